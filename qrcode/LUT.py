@@ -1,29 +1,48 @@
-# Store all kinds of lookup table.
+# Lookup tables, generated by qrcode/generate_lut.py. Don't edit this file,
+# regenerate it with: python qrcode/generate_lut.py
 
+# fmt: off
 
-# # generate rsPoly lookup table.
+# Powers of the GF(256) generator.
+EXP_TABLE = (
+    1, 2, 4, 8, 16, 32, 64, 128, 29, 58, 116, 232, 205, 135, 19, 38, 76, 152, 45, 90,
+    180, 117, 234, 201, 143, 3, 6, 12, 24, 48, 96, 192, 157, 39, 78, 156, 37, 74, 148,
+    53, 106, 212, 181, 119, 238, 193, 159, 35, 70, 140, 5, 10, 20, 40, 80, 160, 93,
+    186, 105, 210, 185, 111, 222, 161, 95, 190, 97, 194, 153, 47, 94, 188, 101, 202,
+    137, 15, 30, 60, 120, 240, 253, 231, 211, 187, 107, 214, 177, 127, 254, 225, 223,
+    163, 91, 182, 113, 226, 217, 175, 67, 134, 17, 34, 68, 136, 13, 26, 52, 104, 208,
+    189, 103, 206, 129, 31, 62, 124, 248, 237, 199, 147, 59, 118, 236, 197, 151, 51,
+    102, 204, 133, 23, 46, 92, 184, 109, 218, 169, 79, 158, 33, 66, 132, 21, 42, 84,
+    168, 77, 154, 41, 82, 164, 85, 170, 73, 146, 57, 114, 228, 213, 183, 115, 230, 209,
+    191, 99, 198, 145, 63, 126, 252, 229, 215, 179, 123, 246, 241, 255, 227, 219, 171,
+    75, 150, 49, 98, 196, 149, 55, 110, 220, 165, 87, 174, 65, 130, 25, 50, 100, 200,
+    141, 7, 14, 28, 56, 112, 224, 221, 167, 83, 166, 81, 162, 89, 178, 121, 242, 249,
+    239, 195, 155, 43, 86, 172, 69, 138, 9, 18, 36, 72, 144, 61, 122, 244, 245, 247,
+    243, 251, 235, 203, 139, 11, 22, 44, 88, 176, 125, 250, 233, 207, 131, 27, 54, 108,
+    216, 173, 71, 142, 1,
+)
 
-# from qrcode import base
+# Logarithms in GF(256) (the entry for 0 is unused).
+LOG_TABLE = (
+    0, 0, 1, 25, 2, 50, 26, 198, 3, 223, 51, 238, 27, 104, 199, 75, 4, 100, 224, 14,
+    52, 141, 239, 129, 28, 193, 105, 248, 200, 8, 76, 113, 5, 138, 101, 47, 225, 36,
+    15, 33, 53, 147, 142, 218, 240, 18, 130, 69, 29, 181, 194, 125, 106, 39, 249, 185,
+    201, 154, 9, 120, 77, 228, 114, 166, 6, 191, 139, 98, 102, 221, 48, 253, 226, 152,
+    37, 179, 16, 145, 34, 136, 54, 208, 148, 206, 143, 150, 219, 189, 241, 210, 19, 92,
+    131, 56, 70, 64, 30, 66, 182, 163, 195, 72, 126, 110, 107, 58, 40, 84, 250, 133,
+    186, 61, 202, 94, 155, 159, 10, 21, 121, 43, 78, 212, 229, 172, 115, 243, 167, 87,
+    7, 112, 192, 247, 140, 128, 99, 13, 103, 74, 222, 237, 49, 197, 254, 24, 227, 165,
+    153, 119, 38, 184, 180, 124, 17, 68, 146, 217, 35, 32, 137, 46, 55, 63, 209, 91,
+    149, 188, 207, 205, 144, 135, 151, 178, 220, 252, 190, 97, 242, 86, 211, 171, 20,
+    42, 93, 158, 132, 60, 57, 83, 71, 109, 65, 162, 31, 45, 67, 216, 183, 123, 164,
+    118, 196, 23, 73, 236, 127, 12, 111, 246, 108, 161, 59, 82, 41, 157, 85, 170, 251,
+    96, 134, 177, 187, 204, 62, 90, 203, 89, 95, 176, 156, 169, 160, 81, 11, 245, 22,
+    235, 122, 117, 44, 215, 79, 174, 213, 233, 230, 231, 173, 232, 116, 214, 244, 234,
+    168, 80, 88, 175,
+)
 
-# def create_bytes(rs_blocks):
-#     for r in range(len(rs_blocks)):
-#         dcCount = rs_blocks[r].data_count
-#         ecCount = rs_blocks[r].total_count - dcCount
-#         rsPoly = base.Polynomial([1], 0)
-#         for i in range(ecCount):
-#             rsPoly = rsPoly * base.Polynomial([1, base.gexp(i)], 0)
-#         return ecCount, rsPoly
-
-# rsPoly_LUT = {}
-# for version in range(1,41):
-#     for error_correction in range(4):
-#         rs_blocks_list = base.rs_blocks(version, error_correction)
-#         ecCount, rsPoly = create_bytes(rs_blocks_list)
-#         rsPoly_LUT[ecCount]=rsPoly.num
-# print(rsPoly_LUT)
-
-# Result. Usage: input: ecCount, output: Polynomial.num
-# e.g. rsPoly = base.Polynomial(LUT.rsPoly_LUT[ecCount], 0)
+# Reed-Solomon generator polynomials, by error correction codeword count.
+# Usage: rsPoly = base.Polynomial(LUT.rsPoly_LUT[ecCount], 0)
 rsPoly_LUT = {  # noqa: N816
     7: [1, 127, 122, 154, 164, 11, 68, 117],
     10: [1, 216, 194, 159, 111, 199, 94, 95, 113, 157, 193],
@@ -32,192 +51,935 @@ rsPoly_LUT = {  # noqa: N816
     16: [1, 59, 13, 104, 189, 68, 209, 30, 8, 163, 65, 41, 229, 98, 50, 36, 59],
     17: [1, 119, 66, 83, 120, 119, 22, 197, 83, 249, 41, 143, 134, 85, 53, 125, 99, 79],
     18: [
-        1,
-        239,
-        251,
-        183,
-        113,
-        149,
-        175,
-        199,
-        215,
-        240,
-        220,
-        73,
-        82,
-        173,
-        75,
-        32,
-        67,
-        217,
-        146,
+        1, 239, 251, 183, 113, 149, 175, 199, 215, 240, 220, 73, 82, 173, 75, 32, 67,
+        217, 146,
     ],
     20: [
-        1,
-        152,
-        185,
-        240,
-        5,
-        111,
-        99,
-        6,
-        220,
-        112,
-        150,
-        69,
-        36,
-        187,
-        22,
-        228,
-        198,
-        121,
-        121,
-        165,
-        174,
+        1, 152, 185, 240, 5, 111, 99, 6, 220, 112, 150, 69, 36, 187, 22, 228, 198, 121,
+        121, 165, 174,
     ],
     22: [
-        1,
-        89,
-        179,
-        131,
-        176,
-        182,
-        244,
-        19,
-        189,
-        69,
-        40,
-        28,
-        137,
-        29,
-        123,
-        67,
-        253,
-        86,
-        218,
-        230,
-        26,
-        145,
-        245,
+        1, 89, 179, 131, 176, 182, 244, 19, 189, 69, 40, 28, 137, 29, 123, 67, 253, 86,
+        218, 230, 26, 145, 245,
     ],
     24: [
-        1,
-        122,
-        118,
-        169,
-        70,
-        178,
-        237,
-        216,
-        102,
-        115,
-        150,
-        229,
-        73,
-        130,
-        72,
-        61,
-        43,
-        206,
-        1,
-        237,
-        247,
-        127,
-        217,
-        144,
-        117,
+        1, 122, 118, 169, 70, 178, 237, 216, 102, 115, 150, 229, 73, 130, 72, 61, 43,
+        206, 1, 237, 247, 127, 217, 144, 117,
     ],
     26: [
-        1,
-        246,
-        51,
-        183,
-        4,
-        136,
-        98,
-        199,
-        152,
-        77,
-        56,
-        206,
-        24,
-        145,
-        40,
-        209,
-        117,
-        233,
-        42,
-        135,
-        68,
-        70,
-        144,
-        146,
-        77,
-        43,
-        94,
+        1, 246, 51, 183, 4, 136, 98, 199, 152, 77, 56, 206, 24, 145, 40, 209, 117, 233,
+        42, 135, 68, 70, 144, 146, 77, 43, 94,
     ],
     28: [
-        1,
-        252,
-        9,
-        28,
-        13,
-        18,
-        251,
-        208,
-        150,
-        103,
-        174,
-        100,
-        41,
-        167,
-        12,
-        247,
-        56,
-        117,
-        119,
-        233,
-        127,
-        181,
-        100,
-        121,
-        147,
-        176,
-        74,
-        58,
-        197,
+        1, 252, 9, 28, 13, 18, 251, 208, 150, 103, 174, 100, 41, 167, 12, 247, 56, 117,
+        119, 233, 127, 181, 100, 121, 147, 176, 74, 58, 197,
     ],
     30: [
-        1,
-        212,
-        246,
-        77,
-        73,
-        195,
-        192,
-        75,
-        98,
-        5,
-        70,
-        103,
-        177,
-        22,
-        217,
-        138,
-        51,
-        181,
-        246,
-        72,
-        25,
-        18,
-        46,
-        228,
-        74,
-        216,
-        195,
-        11,
-        106,
-        130,
-        150,
+        1, 212, 246, 77, 73, 195, 192, 75, 98, 5, 70, 103, 177, 22, 217, 138, 51, 181,
+        246, 72, 25, 18, 46, 228, 74, 216, 195, 11, 106, 130, 150,
     ],
 }
+
+# The same generator polynomials, with the coefficients as logarithms.
+RS_GENERATOR_LOG = {
+    7: (0, 87, 229, 146, 149, 238, 102, 21),
+    10: (0, 251, 67, 46, 61, 118, 70, 64, 94, 32, 45),
+    13: (0, 74, 152, 176, 100, 86, 100, 106, 104, 130, 218, 206, 140, 78),
+    15: (0, 8, 183, 61, 91, 202, 37, 51, 58, 58, 237, 140, 124, 5, 99, 105),
+    16: (0, 120, 104, 107, 109, 102, 161, 76, 3, 91, 191, 147, 169, 182, 194, 225, 120),
+    17: (
+        0, 43, 139, 206, 78, 43, 239, 123, 206, 214, 147, 24, 99, 150, 39, 243, 163,
+        136,
+    ),
+    18: (
+        0, 215, 234, 158, 94, 184, 97, 118, 170, 79, 187, 152, 148, 252, 179, 5, 98,
+        96, 153,
+    ),
+    20: (
+        0, 17, 60, 79, 50, 61, 163, 26, 187, 202, 180, 221, 225, 83, 239, 156, 164,
+        212, 212, 188, 190,
+    ),
+    22: (
+        0, 210, 171, 247, 242, 93, 230, 14, 109, 221, 53, 200, 74, 8, 172, 98, 80, 219,
+        134, 160, 105, 165, 231,
+    ),
+    24: (
+        0, 229, 121, 135, 48, 211, 117, 251, 126, 159, 180, 169, 152, 192, 226, 228,
+        218, 111, 0, 117, 232, 87, 96, 227, 21,
+    ),
+    26: (
+        0, 173, 125, 158, 2, 103, 182, 118, 17, 145, 201, 111, 28, 165, 53, 161, 21,
+        245, 142, 13, 102, 48, 227, 153, 145, 218, 70,
+    ),
+    28: (
+        0, 168, 223, 200, 104, 224, 234, 108, 180, 110, 190, 195, 147, 205, 27, 232,
+        201, 21, 43, 245, 87, 42, 195, 212, 119, 242, 37, 9, 123,
+    ),
+    30: (
+        0, 41, 173, 145, 152, 216, 31, 179, 182, 50, 48, 110, 86, 239, 96, 222, 125,
+        42, 173, 226, 193, 224, 130, 156, 37, 251, 216, 238, 40, 192, 180,
+    ),
+}
+
+# The (total_count, data_count) of every error correction block, indexed
+# by error correction level and version.
+RS_BLOCKS = (
+    (
+        (),
+        ((26, 16),),
+        ((44, 28),),
+        ((70, 44),),
+        ((50, 32), (50, 32)),
+        ((67, 43), (67, 43)),
+        ((43, 27), (43, 27), (43, 27), (43, 27)),
+        ((49, 31), (49, 31), (49, 31), (49, 31)),
+        ((60, 38), (60, 38), (61, 39), (61, 39)),
+        ((58, 36), (58, 36), (58, 36), (59, 37), (59, 37)),
+        ((69, 43), (69, 43), (69, 43), (69, 43), (70, 44)),
+        ((80, 50), (81, 51), (81, 51), (81, 51), (81, 51)),
+        (
+            (58, 36), (58, 36), (58, 36), (58, 36), (58, 36), (58, 36), (59, 37),
+            (59, 37),
+        ),
+        (
+            (59, 37), (59, 37), (59, 37), (59, 37), (59, 37), (59, 37), (59, 37),
+            (59, 37), (60, 38),
+        ),
+        (
+            (64, 40), (64, 40), (64, 40), (64, 40), (65, 41), (65, 41), (65, 41),
+            (65, 41), (65, 41),
+        ),
+        (
+            (65, 41), (65, 41), (65, 41), (65, 41), (65, 41), (66, 42), (66, 42),
+            (66, 42), (66, 42), (66, 42),
+        ),
+        (
+            (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45),
+            (74, 46), (74, 46), (74, 46),
+        ),
+        (
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (75, 47),
+        ),
+        (
+            (69, 43), (69, 43), (69, 43), (69, 43), (69, 43), (69, 43), (69, 43),
+            (69, 43), (69, 43), (70, 44), (70, 44), (70, 44), (70, 44),
+        ),
+        (
+            (70, 44), (70, 44), (70, 44), (71, 45), (71, 45), (71, 45), (71, 45),
+            (71, 45), (71, 45), (71, 45), (71, 45), (71, 45), (71, 45), (71, 45),
+        ),
+        (
+            (67, 41), (67, 41), (67, 41), (68, 42), (68, 42), (68, 42), (68, 42),
+            (68, 42), (68, 42), (68, 42), (68, 42), (68, 42), (68, 42), (68, 42),
+            (68, 42), (68, 42),
+        ),
+        (
+            (68, 42), (68, 42), (68, 42), (68, 42), (68, 42), (68, 42), (68, 42),
+            (68, 42), (68, 42), (68, 42), (68, 42), (68, 42), (68, 42), (68, 42),
+            (68, 42), (68, 42), (68, 42),
+        ),
+        (
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46),
+        ),
+        (
+            (75, 47), (75, 47), (75, 47), (75, 47), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48),
+        ),
+        (
+            (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+        ),
+        (
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+        ),
+        (
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (75, 47), (75, 47),
+            (75, 47), (75, 47),
+        ),
+        (
+            (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45),
+            (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45),
+            (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45),
+            (73, 45), (74, 46), (74, 46), (74, 46),
+        ),
+        (
+            (73, 45), (73, 45), (73, 45), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+        ),
+        (
+            (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45),
+            (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45),
+            (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45), (73, 45),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+        ),
+        (
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+            (76, 48),
+        ),
+        (
+            (74, 46), (74, 46), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47),
+        ),
+        (
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+        ),
+        (
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+        ),
+        (
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47),
+        ),
+        (
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48),
+        ),
+        (
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+        ),
+        (
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47),
+        ),
+        (
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46),
+            (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (74, 46), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47),
+        ),
+        (
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+        ),
+        (
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47), (75, 47),
+            (75, 47), (75, 47), (75, 47), (75, 47), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+            (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48), (76, 48),
+        ),
+    ),
+    (
+        (),
+        ((26, 19),),
+        ((44, 34),),
+        ((70, 55),),
+        ((100, 80),),
+        ((134, 108),),
+        ((86, 68), (86, 68)),
+        ((98, 78), (98, 78)),
+        ((121, 97), (121, 97)),
+        ((146, 116), (146, 116)),
+        ((86, 68), (86, 68), (87, 69), (87, 69)),
+        ((101, 81), (101, 81), (101, 81), (101, 81)),
+        ((116, 92), (116, 92), (117, 93), (117, 93)),
+        ((133, 107), (133, 107), (133, 107), (133, 107)),
+        ((145, 115), (145, 115), (145, 115), (146, 116)),
+        ((109, 87), (109, 87), (109, 87), (109, 87), (109, 87), (110, 88)),
+        ((122, 98), (122, 98), (122, 98), (122, 98), (122, 98), (123, 99)),
+        ((135, 107), (136, 108), (136, 108), (136, 108), (136, 108), (136, 108)),
+        ((150, 120), (150, 120), (150, 120), (150, 120), (150, 120), (151, 121)),
+        (
+            (141, 113), (141, 113), (141, 113), (142, 114), (142, 114), (142, 114),
+            (142, 114),
+        ),
+        (
+            (135, 107), (135, 107), (135, 107), (136, 108), (136, 108), (136, 108),
+            (136, 108), (136, 108),
+        ),
+        (
+            (144, 116), (144, 116), (144, 116), (144, 116), (145, 117), (145, 117),
+            (145, 117), (145, 117),
+        ),
+        (
+            (139, 111), (139, 111), (140, 112), (140, 112), (140, 112), (140, 112),
+            (140, 112), (140, 112), (140, 112),
+        ),
+        (
+            (151, 121), (151, 121), (151, 121), (151, 121), (152, 122), (152, 122),
+            (152, 122), (152, 122), (152, 122),
+        ),
+        (
+            (147, 117), (147, 117), (147, 117), (147, 117), (147, 117), (147, 117),
+            (148, 118), (148, 118), (148, 118), (148, 118),
+        ),
+        (
+            (132, 106), (132, 106), (132, 106), (132, 106), (132, 106), (132, 106),
+            (132, 106), (132, 106), (133, 107), (133, 107), (133, 107), (133, 107),
+        ),
+        (
+            (142, 114), (142, 114), (142, 114), (142, 114), (142, 114), (142, 114),
+            (142, 114), (142, 114), (142, 114), (142, 114), (143, 115), (143, 115),
+        ),
+        (
+            (152, 122), (152, 122), (152, 122), (152, 122), (152, 122), (152, 122),
+            (152, 122), (152, 122), (153, 123), (153, 123), (153, 123), (153, 123),
+        ),
+        (
+            (147, 117), (147, 117), (147, 117), (148, 118), (148, 118), (148, 118),
+            (148, 118), (148, 118), (148, 118), (148, 118), (148, 118), (148, 118),
+            (148, 118),
+        ),
+        (
+            (146, 116), (146, 116), (146, 116), (146, 116), (146, 116), (146, 116),
+            (146, 116), (147, 117), (147, 117), (147, 117), (147, 117), (147, 117),
+            (147, 117), (147, 117),
+        ),
+        (
+            (145, 115), (145, 115), (145, 115), (145, 115), (145, 115), (146, 116),
+            (146, 116), (146, 116), (146, 116), (146, 116), (146, 116), (146, 116),
+            (146, 116), (146, 116), (146, 116),
+        ),
+        (
+            (145, 115), (145, 115), (145, 115), (145, 115), (145, 115), (145, 115),
+            (145, 115), (145, 115), (145, 115), (145, 115), (145, 115), (145, 115),
+            (145, 115), (146, 116), (146, 116), (146, 116),
+        ),
+        (
+            (145, 115), (145, 115), (145, 115), (145, 115), (145, 115), (145, 115),
+            (145, 115), (145, 115), (145, 115), (145, 115), (145, 115), (145, 115),
+            (145, 115), (145, 115), (145, 115), (145, 115), (145, 115),
+        ),
+        (
+            (145, 115), (145, 115), (145, 115), (145, 115), (145, 115), (145, 115),
+            (145, 115), (145, 115), (145, 115), (145, 115), (145, 115), (145, 115),
+            (145, 115), (145, 115), (145, 115), (145, 115), (145, 115), (146, 116),
+        ),
+        (
+            (145, 115), (145, 115), (145, 115), (145, 115), (145, 115), (145, 115),
+            (145, 115), (145, 115), (145, 115), (145, 115), (145, 115), (145, 115),
+            (145, 115), (146, 116), (146, 116), (146, 116), (146, 116), (146, 116),
+            (146, 116),
+        ),
+        (
+            (151, 121), (151, 121), (151, 121), (151, 121), (151, 121), (151, 121),
+            (151, 121), (151, 121), (151, 121), (151, 121), (151, 121), (151, 121),
+            (152, 122), (152, 122), (152, 122), (152, 122), (152, 122), (152, 122),
+            (152, 122),
+        ),
+        (
+            (151, 121), (151, 121), (151, 121), (151, 121), (151, 121), (151, 121),
+            (152, 122), (152, 122), (152, 122), (152, 122), (152, 122), (152, 122),
+            (152, 122), (152, 122), (152, 122), (152, 122), (152, 122), (152, 122),
+            (152, 122), (152, 122),
+        ),
+        (
+            (152, 122), (152, 122), (152, 122), (152, 122), (152, 122), (152, 122),
+            (152, 122), (152, 122), (152, 122), (152, 122), (152, 122), (152, 122),
+            (152, 122), (152, 122), (152, 122), (152, 122), (152, 122), (153, 123),
+            (153, 123), (153, 123), (153, 123),
+        ),
+        (
+            (152, 122), (152, 122), (152, 122), (152, 122), (153, 123), (153, 123),
+            (153, 123), (153, 123), (153, 123), (153, 123), (153, 123), (153, 123),
+            (153, 123), (153, 123), (153, 123), (153, 123), (153, 123), (153, 123),
+            (153, 123), (153, 123), (153, 123), (153, 123),
+        ),
+        (
+            (147, 117), (147, 117), (147, 117), (147, 117), (147, 117), (147, 117),
+            (147, 117), (147, 117), (147, 117), (147, 117), (147, 117), (147, 117),
+            (147, 117), (147, 117), (147, 117), (147, 117), (147, 117), (147, 117),
+            (147, 117), (147, 117), (148, 118), (148, 118), (148, 118), (148, 118),
+        ),
+        (
+            (148, 118), (148, 118), (148, 118), (148, 118), (148, 118), (148, 118),
+            (148, 118), (148, 118), (148, 118), (148, 118), (148, 118), (148, 118),
+            (148, 118), (148, 118), (148, 118), (148, 118), (148, 118), (148, 118),
+            (148, 118), (149, 119), (149, 119), (149, 119), (149, 119), (149, 119),
+            (149, 119),
+        ),
+    ),
+    (
+        (),
+        ((26, 9),),
+        ((44, 16),),
+        ((35, 13), (35, 13)),
+        ((25, 9), (25, 9), (25, 9), (25, 9)),
+        ((33, 11), (33, 11), (34, 12), (34, 12)),
+        ((43, 15), (43, 15), (43, 15), (43, 15)),
+        ((39, 13), (39, 13), (39, 13), (39, 13), (40, 14)),
+        ((40, 14), (40, 14), (40, 14), (40, 14), (41, 15), (41, 15)),
+        (
+            (36, 12), (36, 12), (36, 12), (36, 12), (37, 13), (37, 13), (37, 13),
+            (37, 13),
+        ),
+        (
+            (43, 15), (43, 15), (43, 15), (43, 15), (43, 15), (43, 15), (44, 16),
+            (44, 16),
+        ),
+        (
+            (36, 12), (36, 12), (36, 12), (37, 13), (37, 13), (37, 13), (37, 13),
+            (37, 13), (37, 13), (37, 13), (37, 13),
+        ),
+        (
+            (42, 14), (42, 14), (42, 14), (42, 14), (42, 14), (42, 14), (42, 14),
+            (43, 15), (43, 15), (43, 15), (43, 15),
+        ),
+        (
+            (33, 11), (33, 11), (33, 11), (33, 11), (33, 11), (33, 11), (33, 11),
+            (33, 11), (33, 11), (33, 11), (33, 11), (33, 11), (34, 12), (34, 12),
+            (34, 12), (34, 12),
+        ),
+        (
+            (36, 12), (36, 12), (36, 12), (36, 12), (36, 12), (36, 12), (36, 12),
+            (36, 12), (36, 12), (36, 12), (36, 12), (37, 13), (37, 13), (37, 13),
+            (37, 13), (37, 13),
+        ),
+        (
+            (36, 12), (36, 12), (36, 12), (36, 12), (36, 12), (36, 12), (36, 12),
+            (36, 12), (36, 12), (36, 12), (36, 12), (37, 13), (37, 13), (37, 13),
+            (37, 13), (37, 13), (37, 13), (37, 13),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16),
+        ),
+        (
+            (42, 14), (42, 14), (43, 15), (43, 15), (43, 15), (43, 15), (43, 15),
+            (43, 15), (43, 15), (43, 15), (43, 15), (43, 15), (43, 15), (43, 15),
+            (43, 15), (43, 15), (43, 15), (43, 15), (43, 15),
+        ),
+        (
+            (42, 14), (42, 14), (43, 15), (43, 15), (43, 15), (43, 15), (43, 15),
+            (43, 15), (43, 15), (43, 15), (43, 15), (43, 15), (43, 15), (43, 15),
+            (43, 15), (43, 15), (43, 15), (43, 15), (43, 15), (43, 15), (43, 15),
+        ),
+        (
+            (39, 13), (39, 13), (39, 13), (39, 13), (39, 13), (39, 13), (39, 13),
+            (39, 13), (39, 13), (40, 14), (40, 14), (40, 14), (40, 14), (40, 14),
+            (40, 14), (40, 14), (40, 14), (40, 14), (40, 14), (40, 14), (40, 14),
+            (40, 14), (40, 14), (40, 14), (40, 14),
+        ),
+        (
+            (43, 15), (43, 15), (43, 15), (43, 15), (43, 15), (43, 15), (43, 15),
+            (43, 15), (43, 15), (43, 15), (43, 15), (43, 15), (43, 15), (43, 15),
+            (43, 15), (44, 16), (44, 16), (44, 16), (44, 16), (44, 16), (44, 16),
+            (44, 16), (44, 16), (44, 16), (44, 16),
+        ),
+        (
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (47, 17), (47, 17),
+            (47, 17), (47, 17), (47, 17), (47, 17),
+        ),
+        (
+            (37, 13), (37, 13), (37, 13), (37, 13), (37, 13), (37, 13), (37, 13),
+            (37, 13), (37, 13), (37, 13), (37, 13), (37, 13), (37, 13), (37, 13),
+            (37, 13), (37, 13), (37, 13), (37, 13), (37, 13), (37, 13), (37, 13),
+            (37, 13), (37, 13), (37, 13), (37, 13), (37, 13), (37, 13), (37, 13),
+            (37, 13), (37, 13), (37, 13), (37, 13), (37, 13), (37, 13),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16),
+        ),
+        (
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (47, 17), (47, 17),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+        ),
+        (
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (47, 17), (47, 17),
+            (47, 17), (47, 17),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16),
+        ),
+        (
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (47, 17),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+        ),
+        (
+            (45, 15), (45, 15), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+        ),
+        (
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15),
+            (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (45, 15), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16), (46, 16),
+            (46, 16), (46, 16), (46, 16), (46, 16),
+        ),
+    ),
+    (
+        (),
+        ((26, 13),),
+        ((44, 22),),
+        ((35, 17), (35, 17)),
+        ((50, 24), (50, 24)),
+        ((33, 15), (33, 15), (34, 16), (34, 16)),
+        ((43, 19), (43, 19), (43, 19), (43, 19)),
+        ((32, 14), (32, 14), (33, 15), (33, 15), (33, 15), (33, 15)),
+        ((40, 18), (40, 18), (40, 18), (40, 18), (41, 19), (41, 19)),
+        (
+            (36, 16), (36, 16), (36, 16), (36, 16), (37, 17), (37, 17), (37, 17),
+            (37, 17),
+        ),
+        (
+            (43, 19), (43, 19), (43, 19), (43, 19), (43, 19), (43, 19), (44, 20),
+            (44, 20),
+        ),
+        (
+            (50, 22), (50, 22), (50, 22), (50, 22), (51, 23), (51, 23), (51, 23),
+            (51, 23),
+        ),
+        (
+            (46, 20), (46, 20), (46, 20), (46, 20), (47, 21), (47, 21), (47, 21),
+            (47, 21), (47, 21), (47, 21),
+        ),
+        (
+            (44, 20), (44, 20), (44, 20), (44, 20), (44, 20), (44, 20), (44, 20),
+            (44, 20), (45, 21), (45, 21), (45, 21), (45, 21),
+        ),
+        (
+            (36, 16), (36, 16), (36, 16), (36, 16), (36, 16), (36, 16), (36, 16),
+            (36, 16), (36, 16), (36, 16), (36, 16), (37, 17), (37, 17), (37, 17),
+            (37, 17), (37, 17),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+        ),
+        (
+            (43, 19), (43, 19), (43, 19), (43, 19), (43, 19), (43, 19), (43, 19),
+            (43, 19), (43, 19), (43, 19), (43, 19), (43, 19), (43, 19), (43, 19),
+            (43, 19), (44, 20), (44, 20),
+        ),
+        (
+            (50, 22), (51, 23), (51, 23), (51, 23), (51, 23), (51, 23), (51, 23),
+            (51, 23), (51, 23), (51, 23), (51, 23), (51, 23), (51, 23), (51, 23),
+            (51, 23), (51, 23),
+        ),
+        (
+            (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22),
+            (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22),
+            (50, 22), (50, 22), (50, 22), (51, 23),
+        ),
+        (
+            (47, 21), (47, 21), (47, 21), (47, 21), (47, 21), (47, 21), (47, 21),
+            (47, 21), (47, 21), (47, 21), (47, 21), (47, 21), (47, 21), (47, 21),
+            (47, 21), (47, 21), (47, 21), (48, 22), (48, 22), (48, 22), (48, 22),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+        ),
+        (
+            (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22),
+            (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22),
+            (50, 22), (50, 22), (50, 22), (51, 23), (51, 23), (51, 23), (51, 23),
+            (51, 23), (51, 23),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25),
+        ),
+        (
+            (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22),
+            (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22),
+            (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22),
+            (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22), (50, 22),
+            (51, 23), (51, 23), (51, 23), (51, 23), (51, 23), (51, 23),
+        ),
+        (
+            (53, 23), (53, 23), (53, 23), (53, 23), (53, 23), (53, 23), (53, 23),
+            (53, 23), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+        ),
+        (
+            (53, 23), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (55, 25),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25),
+        ),
+        (
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24),
+            (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (54, 24), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+            (55, 25), (55, 25), (55, 25), (55, 25), (55, 25),
+        ),
+    ),
+)
+
+# Data bit capacities, indexed by error correction level and version.
+BIT_LIMIT_TABLE = (
+    (
+        0, 128, 224, 352, 512, 688, 864, 992, 1232, 1456, 1728, 2032, 2320, 2672, 2920,
+        3320, 3624, 4056, 4504, 5016, 5352, 5712, 6256, 6880, 7312, 8000, 8496, 9024,
+        9544, 10136, 10984, 11640, 12328, 13048, 13800, 14496, 15312, 15936, 16816,
+        17728, 18672,
+    ),
+    (
+        0, 152, 272, 440, 640, 864, 1088, 1248, 1552, 1856, 2192, 2592, 2960, 3424,
+        3688, 4184, 4712, 5176, 5768, 6360, 6888, 7456, 8048, 8752, 9392, 10208, 10960,
+        11744, 12248, 13048, 13880, 14744, 15640, 16568, 17528, 18448, 19472, 20528,
+        21616, 22496, 23648,
+    ),
+    (
+        0, 72, 128, 208, 288, 368, 480, 528, 688, 800, 976, 1120, 1264, 1440, 1576,
+        1784, 2024, 2264, 2504, 2728, 3080, 3248, 3536, 3712, 4112, 4304, 4768, 5024,
+        5288, 5608, 5960, 6344, 6760, 7208, 7688, 7888, 8432, 8768, 9136, 9776, 10208,
+    ),
+    (
+        0, 104, 176, 272, 384, 496, 608, 704, 880, 1056, 1232, 1440, 1648, 1952, 2088,
+        2360, 2600, 2936, 3176, 3560, 3880, 4096, 4544, 4912, 5312, 5744, 6032, 6464,
+        6968, 7288, 7880, 8264, 8920, 9368, 9848, 10288, 10832, 11408, 12016, 12656,
+        13328,
+    ),
+)
+
+# Format information, indexed by error correction level << 3 | mask pattern.
+FORMAT_INFO = (
+    21522, 20773, 24188, 23371, 17913, 16590, 20375, 19104, 30660, 29427, 32170, 30877,
+    26159, 25368, 27713, 26998, 5769, 5054, 7399, 6608, 1890, 597, 3340, 2107, 13663,
+    12392, 16177, 14854, 9396, 8579, 11994, 11245,
+)
+
+# Version information, indexed by version (versions 1 to 6 have none).
+VERSION_INFO = (
+    0, 0, 0, 0, 0, 0, 0, 31892, 34236, 39577, 42195, 48118, 51042, 55367, 58893, 63784,
+    68472, 70749, 76311, 79154, 84390, 87683, 92361, 96236, 102084, 102881, 110507,
+    110734, 117786, 119615, 126325, 127568, 133589, 136944, 141498, 145311, 150283,
+    152622, 158308, 161089, 167017,
+)
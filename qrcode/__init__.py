@@ -5,17 +5,30 @@ from qrcode.constants import (
     ERROR_CORRECT_M,
     ERROR_CORRECT_Q,
 )
-from qrcode.main import QRCode, make
+from qrcode.main import (
+    QRCode,
+    estimate,
+    estimate_many,
+    make,
+    make_many,
+    warmup,
+)
+from qrcode.micro import MicroQRCode
 
 __all__ = [
     "ERROR_CORRECT_H",
     "ERROR_CORRECT_L",
     "ERROR_CORRECT_M",
     "ERROR_CORRECT_Q",
+    "MicroQRCode",
     "QRCode",
+    "estimate",
+    "estimate_many",
     "image",
     "make",
+    "make_many",
     "run_example",
+    "warmup",
 ]
 
 
@@ -0,0 +1,164 @@
+"""
+Asyncio versions of the QR Code functions.
+
+Making and saving QR Code images is blocking work, which would hold up the
+event loop for tens of milliseconds on large (or styled) QR Codes. These
+functions run it on an executor instead, with a limit on how many jobs are
+running or waiting on it at once so that callers wait (rather than queueing
+unbounded work) under load:
+
+.. code:: python
+
+    img = await qrcode.aio.make_async("Some data")
+    await img.save_async("some_file.png")
+
+    async for img in qrcode.aio.make_many_async(labels):
+        ...
+
+By default the work runs on a thread pool shared by these functions; use
+``configure`` to change it, or a ``Runner`` of your own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from qrcode import main
+
+
+class Runner:
+    """
+    Runs blocking functions on an executor for asyncio code, with at most
+    ``limit`` running or waiting for the executor at once (by default,
+    ``max_workers`` or the number of CPUs).
+
+    Without an ``executor``, the runner starts its own thread pool of
+    ``max_workers`` threads when it is first needed.
+
+    Cancelling a call that hasn't started yet stops it from running at all.
+    One that has already started can't be interrupted, but its result is
+    discarded.
+    """
+
+    def __init__(self, executor=None, max_workers=None, limit=None):
+        if limit is None:
+            limit = max_workers or os.cpu_count() or 1
+        if limit < 1:
+            raise ValueError(f"Invalid limit (was {limit}, expected 1 or more)")
+        self.executor = executor
+        self.max_workers = max_workers
+        self.limit = limit
+        self._owns_executor = executor is None
+        self._lock = threading.Lock()
+        # asyncio semaphores belong to one event loop, so keep one per loop.
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _get_executor(self):
+        if self.executor is None:
+            with self._lock:
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix="qrcode-aio"
+                    )
+        return self.executor
+
+    def _semaphore(self):
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.limit)
+        return semaphore
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Call ``func(*args, **kwargs)`` on the executor, waiting first if the
+        runner is at its limit.
+        """
+        async with self._semaphore():
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), partial(func, *args, **kwargs)
+            )
+
+    async def make(self, data=None, **kwargs):
+        """
+        Make a QR Code image, like ``qrcode.make``.
+        """
+        return await self.run(main.make, data, **kwargs)
+
+    async def make_many(self, iterable, **kwargs):
+        """
+        Make a QR Code image for each item of data in the (synchronous or
+        asynchronous) iterable, yielding them in the same order.
+
+        Up to ``limit`` images are made ahead of the one being waited for.
+        Closing the generator early cancels any that haven't started.
+        """
+        if not hasattr(iterable, "__aiter__"):
+            iterable = _aiter(iterable)
+        pending: list[asyncio.Task] = []
+        try:
+            async for data in iterable:
+                pending.append(asyncio.ensure_future(self.make(data, **kwargs)))
+                if len(pending) >= self.limit:
+                    yield await pending.pop(0)
+            while pending:
+                yield await pending.pop(0)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def shutdown(self, wait=True):
+        """
+        Shut down the runner's own thread pool (not one it was given).
+        """
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=wait)
+            self.executor = None
+
+
+async def _aiter(iterable):
+    for item in iterable:
+        yield item
+
+
+_runner = Runner()
+
+
+def configure(executor=None, max_workers=None, limit=None):
+    """
+    Replace the ``Runner`` used by the functions in this module, returning
+    the new one. The arguments are those of ``Runner``.
+    """
+    global _runner  # noqa: PLW0603
+    previous = _runner
+    _runner = Runner(executor, max_workers, limit)
+    previous.shutdown(wait=False)
+    return _runner
+
+
+async def run(func, *args, **kwargs):
+    """
+    Call a blocking function with the shared runner (see ``Runner.run``).
+    """
+    return await _runner.run(func, *args, **kwargs)
+
+
+async def make_async(data=None, **kwargs):
+    """
+    Make a QR Code image without blocking the event loop, like
+    ``qrcode.make``.
+    """
+    return await _runner.make(data, **kwargs)
+
+
+def make_many_async(iterable, **kwargs):
+    """
+    Asynchronously generate a QR Code image for each item of data, in order
+    (see ``Runner.make_many``).
+    """
+    return _runner.make_many(iterable, **kwargs)
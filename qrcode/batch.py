@@ -0,0 +1,327 @@
+"""
+Streaming batch generation: read records from NDJSON or CSV, make a QR Code
+image for each and write them to a zip or tar archive, or a directory.
+
+Every step is a generator, so only the images being made (a couple per
+worker) are held in memory however many records there are, along with the
+file names of the records that have a name (to keep the file names unique):
+
+.. code:: python
+
+    from qrcode import batch
+
+    batch.generate("labels.csv", "labels.zip", workers=4, box_size=4)
+
+Each NDJSON line is either a JSON object, with the data in its ``"data"``
+field, or a JSON string. CSV files need a header row with a ``data`` column.
+An optional ``name`` field or column names each image file (otherwise they
+are named by their position in the input), with the record's position
+appended if the name is already taken (``name-3.png``). A ``manifest.csv``
+listing the position, name, file and version of each image in input order is
+written after the images.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import re
+import shutil
+import tarfile
+import tempfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from qrcode.main import QRCode
+
+MANIFEST_NAME = "manifest.csv"
+MANIFEST_FIELDS = ("index", "name", "file", "version")
+
+# Input formats, by file suffix.
+FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+class Record(NamedTuple):
+    """
+    An item of data to encode, with its position in the input.
+    """
+
+    index: int
+    name: str | None
+    data: Any
+
+
+class Rendered(NamedTuple):
+    """
+    A record's image file, as made by ``render``.
+    """
+
+    record: Record
+    filename: str
+    content: bytes
+    version: int
+
+
+def read_records(source, format=None, data_field="data", name_field="name"):
+    """
+    Lazily read the records from an NDJSON or CSV file (a path, or a text
+    file object). The ``format`` (``"ndjson"`` or ``"csv"``) is found from
+    the file suffix if it isn't given.
+    """
+    if format is None:
+        suffix = Path(getattr(source, "name", source)).suffix.lower()
+        if suffix not in FORMATS:
+            raise ValueError(
+                f"Unknown input format for {source!r}, expected one of {set(FORMATS)}"
+            )
+        format = FORMATS[suffix]
+    if format not in {"csv", "ndjson"}:
+        raise ValueError(f"Invalid format (was {format!r}, expected csv or ndjson)")
+
+    if isinstance(source, (str, os.PathLike)):
+        with Path(source).open(newline="", encoding="utf-8") as file:
+            yield from read_records(file, format, data_field, name_field)
+        return
+
+    if format == "csv":
+        for index, row in enumerate(csv.DictReader(source)):
+            if data_field not in row:
+                raise ValueError(f"Row {index} has no {data_field!r} column")
+            yield Record(index, row.get(name_field) or None, row[data_field])
+        return
+
+    index = 0
+    for line in source:
+        if not line.strip():
+            continue
+        value = json.loads(line)
+        if isinstance(value, dict):
+            if data_field not in value:
+                raise ValueError(f"Record {index} has no {data_field!r} field")
+            name = value.get(name_field)
+            yield Record(index, None if name is None else str(name), value[data_field])
+        else:
+            yield Record(index, None, value if isinstance(value, str) else str(value))
+        index += 1
+
+
+def _safe_name(name):
+    """
+    Make a record name usable as a file name in an archive or a directory.
+    """
+    return re.sub(r"[^\w.-]", "_", name).lstrip(".") or "_"
+
+
+def _make_image(data, kwargs, matrix=False, optimize=20):
+    """
+    Make the image file (or PBM matrix) for some data, returning it with its
+    file extension and the QR Code version.
+    """
+    qr = QRCode(**kwargs)
+    qr.add_data(data, optimize=optimize)
+    if matrix:
+        return qr.to_matrix().to_pbm(), "pbm", qr.version
+    img = qr.make_image()
+    stream = io.BytesIO()
+    img.save(stream)
+    return stream.getvalue(), (img.kind or "img").lower(), qr.version
+
+
+def render(records, workers=None, executor=None, matrix=False, optimize=20, **kwargs):
+    """
+    Make an image for each record, on ``workers`` threads (or the given
+    ``executor``), yielding a ``Rendered`` for each in input order.
+
+    With ``matrix``, the images are PBM files of the QR Code matrices (see
+    ``Matrix.to_pbm``) rather than drawn by an image factory. Other keyword
+    arguments (including ``image_factory``) are passed to each ``QRCode``,
+    and ``optimize`` to ``QRCode.add_data``. At most two images per worker
+    are in progress or waiting to be consumed at once.
+
+    File names are unique (ignoring case): when a name is already taken, the
+    record's position is appended to it. To check this, the file names of
+    the records with a ``name`` are kept (the others are named by their
+    position, so can't clash with each other).
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(workers, thread_name_prefix="qrcode-batch")
+    pending: deque = deque()
+    used: set[str] = set()
+    try:
+        for record in records:
+            future = executor.submit(_make_image, record.data, kwargs, matrix, optimize)
+            pending.append((record, future))
+            if len(pending) >= workers * 2:
+                yield _rendered(*pending.popleft(), used)
+        while pending:
+            yield _rendered(*pending.popleft(), used)
+    finally:
+        for _, future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
+
+
+def _rendered(record, future, used):
+    content, extension, version = future.result()
+    if record.name is None:
+        name = str(record.index)
+        taken = f"{name}.{extension}".casefold() in used
+    else:
+        name = _safe_name(record.name)
+        # Records without a name are named by their position, so a name that
+        # is an earlier position may be taken too.
+        taken = f"{name}.{extension}".casefold() in used or (
+            name.isascii()
+            and name.isdigit()
+            and str(int(name)) == name
+            and int(name) < record.index
+        )
+    filename = f"{name}.{extension}"
+    if taken:
+        filename = f"{name}-{record.index}.{extension}"
+        suffix = 0
+        while filename.casefold() in used:
+            suffix += 1
+            filename = f"{name}-{record.index}-{suffix}.{extension}"
+    # Positions are unique, so only given names (and renamed files) are kept.
+    if record.name is not None or taken:
+        used.add(filename.casefold())
+    return Rendered(record, filename, content, version)
+
+
+class DirectoryWriter:
+    """
+    Writes files to a directory (created if needed).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def add(self, filename, content):
+        (self.path / filename).write_bytes(content)
+
+    def add_file(self, filename, file):
+        with (self.path / filename).open("wb") as out:
+            shutil.copyfileobj(file, out)
+
+    def close(self):
+        pass
+
+
+class ZipWriter:
+    """
+    Writes files to a zip archive.
+    """
+
+    def __init__(self, path):
+        self.archive = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+
+    def add(self, filename, content):
+        self.archive.writestr(filename, content)
+
+    def add_file(self, filename, file):
+        with self.archive.open(filename, "w") as out:
+            shutil.copyfileobj(file, out)
+
+    def close(self):
+        self.archive.close()
+
+
+class TarWriter:
+    """
+    Writes files to a tar archive, compressed to match the file suffix
+    (``.tar.gz``, ``.tgz``, ``.tar.bz2`` or ``.tar.xz``).
+    """
+
+    COMPRESSION = {".gz": "gz", ".tgz": "gz", ".bz2": "bz2", ".xz": "xz"}
+
+    def __init__(self, path):
+        compression = self.COMPRESSION.get(Path(path).suffix.lower(), "")
+        self.archive = tarfile.open(path, f"w:{compression}")  # noqa: SIM115
+        self.mtime = time.time()
+
+    def add(self, filename, content):
+        self.add_file(filename, io.BytesIO(content))
+
+    def add_file(self, filename, file):
+        info = tarfile.TarInfo(filename)
+        info.size = file.seek(0, io.SEEK_END)
+        info.mtime = self.mtime
+        file.seek(0)
+        self.archive.addfile(info, file)
+
+    def close(self):
+        self.archive.close()
+
+
+def open_writer(destination):
+    """
+    Return the writer for a destination path: a zip or tar archive, going by
+    its suffix, or otherwise a directory.
+    """
+    name = Path(destination).name.lower()
+    if name.endswith(".zip"):
+        return ZipWriter(destination)
+    if name.endswith((".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")):
+        return TarWriter(destination)
+    return DirectoryWriter(destination)
+
+
+def write(rendered, destination):
+    """
+    Write the rendered images to the destination (see ``open_writer``),
+    followed by the manifest, returning the number of images written.
+    """
+    writer = open_writer(destination)
+    count = 0
+    try:
+        # The manifest is kept in a temporary file until the images are
+        # written, rather than in memory.
+        with tempfile.TemporaryFile() as manifest:
+            text = io.TextIOWrapper(manifest, encoding="utf-8", newline="")
+            manifest_writer = csv.writer(text)
+            manifest_writer.writerow(MANIFEST_FIELDS)
+            for item in rendered:
+                writer.add(item.filename, item.content)
+                record = item.record
+                manifest_writer.writerow(
+                    (record.index, record.name or "", item.filename, item.version)
+                )
+                count += 1
+            text.flush()
+            manifest.seek(0)
+            writer.add_file(MANIFEST_NAME, manifest)
+            text.detach()
+    finally:
+        writer.close()
+    return count
+
+
+def generate(
+    source,
+    destination,
+    format=None,
+    workers=None,
+    executor=None,
+    data_field="data",
+    name_field="name",
+    **kwargs,
+):
+    """
+    Read the records from ``source`` (see ``read_records``), make their
+    images (see ``render``) and write them to ``destination`` (see
+    ``write``), returning the number of images written.
+    """
+    records = read_records(source, format, data_field, name_field)
+    return write(render(records, workers, executor, **kwargs), destination)
@@ -0,0 +1,319 @@
+"""
+A bitboard representation of the QR Code matrix, used to choose the mask.
+
+Each row of the symbol is held as an integer, with the leftmost column as the
+most significant bit. Masks are applied with one XOR per row and the penalty
+rules are scored with shifts, ANDs and ``int.bit_count`` over whole rows,
+rather than module by module.
+"""
+
+from __future__ import annotations
+
+from itertools import pairwise
+from time import perf_counter
+from typing import NamedTuple
+
+from qrcode import util
+
+# The finder-like 1:1:3:1:1 pattern with four light modules to one side, in
+# both directions (penalty rule 3).
+FINDER_PATTERNS = ((1, 0, 1, 1, 1, 0, 1, 0, 0, 0, 0), (0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 1))
+
+
+class Template(NamedTuple):
+    """
+    The function patterns of a symbol and the eight masks over its data
+    modules.
+    """
+
+    size: int
+    # The modules used by function patterns (so not available for data).
+    reserved: list[int]
+    # The dark function modules, including the format information, for each
+    # mask pattern.
+    functions: list[list[int]]
+    # The data modules inverted by each mask pattern.
+    masks: list[list[int]]
+
+
+def rows(modules):
+    """
+    Return the rows of dark modules in a list-of-lists matrix.
+    """
+    return [
+        int("".join("1" if module else "0" for module in row), 2) for row in modules
+    ]
+
+
+def reserved_rows(modules):
+    """
+    Return the rows of modules that are set in a list-of-lists matrix.
+    """
+    return [
+        int("".join("0" if module is None else "1" for module in row), 2)
+        for row in modules
+    ]
+
+
+def to_modules(rows, size):
+    """
+    Return the list-of-lists matrix for the rows.
+    """
+    return [[bit == "1" for bit in format(row, f"0{size}b")] for row in rows]
+
+
+def make_template(reserved, functions):
+    """
+    Build the template for a symbol from the reserved rows and the dark
+    function module rows for each mask pattern.
+    """
+    size = len(reserved)
+    masks = []
+    for pattern in range(8):
+        mask_func = util.mask_func(pattern)
+        mask = []
+        for row, used in enumerate(reserved):
+            # Every mask pattern repeats every 6 columns.
+            period = "".join("1" if mask_func(row, col) else "0" for col in range(6))
+            mask.append(int((period * (size // 6 + 1))[:size], 2) & ~used)
+        masks.append(mask)
+    return Template(size, reserved, functions, masks)
+
+
+class Placement(NamedTuple):
+    """
+    The order the data modules of a version are filled in.
+    """
+
+    size: int
+    # The row and column of each data module, in placement order (as bytes,
+    # to keep the cached placements small).
+    rows: bytes
+    cols: bytes
+    # The data modules each mask pattern inverts, as bits in placement order.
+    masks: list[int]
+
+    def bits(self, data, mask_pattern=None):
+        """
+        Return the data (followed by light remainder modules) as a string of
+        ``"0"`` and ``"1"`` characters in placement order, masked if a mask
+        pattern is given.
+        """
+        count = len(self.rows)
+        value = int.from_bytes(data, "big") << (count - len(data) * 8)
+        if mask_pattern is not None:
+            value ^= self.masks[mask_pattern]
+        return format(value, f"0{count}b")
+
+
+def make_placement(reserved):
+    """
+    Build the placement for a symbol from its reserved rows, walking the
+    zigzag path of ``QRCode.map_data``.
+    """
+    size = len(reserved)
+    rows = bytearray()
+    cols = bytearray()
+    upwards = True
+    for col in range(size - 1, 0, -2):
+        if col <= 6:
+            # Step over the vertical timing pattern.
+            col -= 1  # noqa: PLW2901
+        for row in range(size - 1, -1, -1) if upwards else range(size):
+            used = reserved[row]
+            for c in (col, col - 1):
+                if not (used >> (size - 1 - c)) & 1:
+                    rows.append(row)
+                    cols.append(c)
+        upwards = not upwards
+
+    masks = []
+    for pattern in range(8):
+        mask_func = util.mask_func(pattern)
+        bits = "".join(
+            "1" if mask_func(row, col) else "0"
+            for row, col in zip(rows, cols, strict=True)
+        )
+        masks.append(int(bits, 2))
+    return Placement(size, bytes(rows), bytes(cols), masks)
+
+
+def place_data(placement, data):
+    """
+    Return the rows of (unmasked) data modules.
+    """
+    size = placement.size
+    data_rows = [0] * size
+    for row, col, bit in zip(
+        placement.rows, placement.cols, placement.bits(data), strict=True
+    ):
+        if bit == "1":
+            data_rows[row] |= 1 << (size - 1 - col)
+    return data_rows
+
+
+def board(template, data_rows, mask_pattern):
+    """
+    Return the rows of the complete symbol for the given mask pattern.
+    """
+    return [
+        function | (data ^ mask)
+        for function, data, mask in zip(
+            template.functions[mask_pattern],
+            data_rows,
+            template.masks[mask_pattern],
+            strict=True,
+        )
+    ]
+
+
+def _same_right(rows, size):
+    """
+    Return the rows of modules that match the next module along.
+    """
+    pairs = ((1 << size) - 1) >> 1
+    return [pairs ^ ((row ^ (row >> 1)) & pairs) for row in rows]
+
+
+def _same_below(rows, size):
+    """
+    Return the rows of modules that match the module below.
+    """
+    full = (1 << size) - 1
+    return [full ^ (above ^ below) for above, below in pairwise(rows)]
+
+
+def dark_penalty(rows, size):
+    """
+    Rule 4: every 5% departure from 50% dark modules scores 10.
+    """
+    dark_count = sum(row.bit_count() for row in rows)
+    percent = float(dark_count) / (size**2)
+    return int(abs(percent * 100 - 50) / 5) * 10
+
+
+def block_penalty(rows, size):
+    """
+    Rule 2: each 2x2 block of the same color scores 3.
+    """
+    blocks = 0
+    for right, below in zip(
+        _same_right(rows, size), _same_below(rows, size), strict=False
+    ):
+        blocks += (below & (below >> 1) & right).bit_count()
+    return blocks * 3
+
+
+def run_penalty(rows, size):
+    """
+    Rule 1: runs of 5 or more modules of the same color score 3, plus 1 for
+    each module past 5.
+    """
+    # Each run has (length - 4) windows of 5 matching modules, so this is the
+    # number of windows plus 2 for every run.
+    windows = 0
+    runs = 0
+    for same in _same_right(rows, size):
+        five = same & (same >> 1) & (same >> 2) & (same >> 3)
+        windows += five.bit_count()
+        runs += (five & ~(five << 1)).bit_count()
+    same_below = _same_below(rows, size)
+    previous = 0
+    for i in range(size - 4):
+        five = same_below[i] & same_below[i + 1] & same_below[i + 2] & same_below[i + 3]
+        windows += five.bit_count()
+        runs += (five & ~previous).bit_count()
+        previous = five
+    return windows + runs * 2
+
+
+def finder_penalty(rows, size):
+    """
+    Rule 3: each finder-like pattern in a row or column scores 40.
+    """
+    # A dark:light:dark:light:dark 1:1:3:1:1 core, followed or preceded by 4
+    # light modules.
+    full = (1 << size) - 1
+    inverse = [row ^ full for row in rows]
+    patterns = 0
+    for row, inverted in zip(rows, inverse, strict=True):
+        core = row & (inverted >> 1) & (row >> 2) & (row >> 3) & (row >> 4)
+        core &= (inverted >> 5) & (row >> 6)
+        light = inverted & (inverted >> 1) & (inverted >> 2) & (inverted >> 3)
+        patterns += (core & (light >> 7)).bit_count()
+        patterns += (light & (core >> 4)).bit_count()
+    cores = [
+        rows[i]
+        & inverse[i + 1]
+        & rows[i + 2]
+        & rows[i + 3]
+        & rows[i + 4]
+        & inverse[i + 5]
+        & rows[i + 6]
+        for i in range(size - 6)
+    ]
+    lights = [
+        inverse[i] & inverse[i + 1] & inverse[i + 2] & inverse[i + 3]
+        for i in range(size - 3)
+    ]
+    for i in range(size - 10):
+        patterns += (cores[i] & lights[i + 7]).bit_count()
+        patterns += (lights[i] & cores[i + 4]).bit_count()
+    return patterns * 40
+
+
+# The penalty rules, cheapest to score first so scoring can stop early once a
+# mask can't win.
+RULES = (dark_penalty, block_penalty, run_penalty, finder_penalty)
+
+# The rules scored by the "fast" mask strategy.
+FAST_RULES = (dark_penalty, run_penalty)
+
+
+def lost_point(rows, size):
+    """
+    Score the penalty for the symbol rows, the same as ``util.lost_point``.
+    """
+    return sum(rule(rows, size) for rule in RULES)
+
+
+def mask_scorer(template, placement, data, rules=RULES):
+    """
+    Return a function scoring a mask pattern for the data, returning its
+    penalty and the rows of the symbol using it.
+
+    Each call builds its own rows, so masks can be scored in parallel.
+    """
+    data_rows = place_data(placement, data)
+
+    def score(pattern):
+        rows = board(template, data_rows, pattern)
+        return sum(rule(rows, template.size) for rule in rules), rows
+
+    return score
+
+
+def best_mask(template, placement, data, rules=RULES, deadline=None):
+    """
+    Return the mask pattern with the lowest penalty for the data, its
+    penalty, and the rows of the symbol using it.
+
+    Each mask is scored one rule at a time, and left as soon as its penalty
+    reaches the lowest penalty so far (the first of any equally low masks
+    wins). If a ``deadline`` (a ``time.perf_counter()`` value) is given, the
+    best mask found when it passes is used.
+    """
+    data_rows = place_data(placement, data)
+    best = None
+    for pattern in range(8):
+        if best is not None and deadline is not None and perf_counter() >= deadline:
+            break
+        rows = board(template, data_rows, pattern)
+        lost_point = 0
+        for rule in rules:
+            lost_point += rule(rows, template.size)
+            if best is not None and lost_point >= best[1]:
+                break
+        else:
+            best = (pattern, lost_point, rows)
+    return best
@@ -0,0 +1,175 @@
+"""
+An opt-in, in-memory cache of made QR Codes, for when the same data is
+encoded again and again (the same URL or product code, say).
+
+.. code:: python
+
+    import qrcode.cache
+
+    qrcode.cache.enable(max_bytes=16 * 1024 * 1024)
+    qrcode.make("https://example.com")  # Made, and cached.
+    qrcode.make("https://example.com")  # From the cache.
+    print(qrcode.cache.stats())
+
+While it is enabled, ``QRCode.make`` looks up the data segments, error
+correction level, version, mask pattern (and strategy) in the cache before
+encoding anything, and restores the version, modules and data codewords of a
+hit instead of encoding the data, computing the error correction and choosing
+the mask. The cache keeps the compact ``Matrix`` of each QR Code, and evicts
+the least recently used ones once they take up more than ``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from qrcode.matrix import Matrix
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# An estimate of the memory taken by an entry besides its matrix, data and
+# key bytes (the entry, its key and the cache's bookkeeping).
+ENTRY_OVERHEAD = 512
+
+
+class Result(NamedTuple):
+    """
+    A cached QR Code: the version, the modules (without a border), the data
+    codewords and the mask choice (``None`` for a given mask pattern).
+    """
+
+    version: int
+    matrix: Matrix
+    data: bytes
+    mask_choice: Any
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+    max_bytes: int
+
+
+def _key_size(key):
+    """
+    The number of bytes of data in a (nested) key.
+    """
+    if isinstance(key, bytes):
+        return len(key)
+    if isinstance(key, tuple):
+        return sum(map(_key_size, key))
+    return 0
+
+
+class ResultCache:
+    """
+    A thread safe LRU cache of QR Code results, holding up to ``max_bytes``
+    (as estimated from their matrices, data codewords and keys).
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        if max_bytes < 0:
+            raise ValueError(
+                f"Invalid max_bytes (was {max_bytes}, expected 0 or larger than that)"
+            )
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[Result, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Return the result for a key (as the most recently used), or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, result):
+        """
+        Store a result, evicting the least recently used ones to stay within
+        ``max_bytes``. Results larger than that aren't stored.
+        """
+        size = (
+            len(result.matrix.data) + len(result.data) + _key_size(key) + ENTRY_OVERHEAD
+        )
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (result, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+                self._evictions += 1
+
+    def stats(self):
+        """
+        Return the hit, miss and eviction counts and the current size.
+        """
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._size,
+                self.max_bytes,
+            )
+
+    def clear(self):
+        """
+        Remove every result and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = self._hits = self._misses = self._evictions = 0
+
+
+# The cache QRCode.make uses, if it has been enabled.
+active: ResultCache | None = None
+
+
+def enable(max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Start caching the QR Codes made (replacing any cache already enabled),
+    returning the cache.
+    """
+    global active  # noqa: PLW0603
+    active = ResultCache(max_bytes)
+    return active
+
+
+def disable():
+    """
+    Stop caching QR Codes, discarding the cache.
+    """
+    global active  # noqa: PLW0603
+    active = None
+
+
+def stats():
+    """
+    Return the statistics of the enabled cache, or None if it isn't enabled.
+    """
+    return None if active is None else active.stats()
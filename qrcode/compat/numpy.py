@@ -0,0 +1,15 @@
+# NumPy is used to choose the mask faster if it is installed. It is slow to
+# import, so it is only imported the first time it is needed.
+from functools import cache
+
+
+@cache
+def load_numpy():
+    """
+    Return the numpy module, or None if it isn't installed.
+    """
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError:
+        return None
+    return np
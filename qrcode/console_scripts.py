@@ -4,14 +4,20 @@ qr - Convert stdin (or the first argument) to a QR Code.
 
 When stdout is a tty the QR Code is printed to the terminal and when stdout is
 a pipe to a file an image is written. The default image format is PNG.
+
+With --batch, a QR Code is made for each line of a file (or stdin). With
+--worker, QR Codes are made for requests read from stdin until it closes.
 """
 
 from __future__ import annotations
 
+import io
+import json
 import optparse
 import os
 import sys
-from importlib import metadata
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, NoReturn
 
@@ -46,12 +52,29 @@ error_correction = {
 }
 
 
+class OptionParser(optparse.OptionParser):
+    """
+    Only looks up the version, and lists the drawers (which imports every
+    image factory), when they are shown rather than whenever qr is run.
+    """
+
+    def get_version(self):
+        from importlib import metadata  # noqa: PLC0415
+
+        return metadata.version("qrcode")
+
+    def format_option_help(self, formatter=None):
+        option = self.get_option("--factory-drawer")
+        option.help = f"Use an alternate drawer. {get_drawer_help()}."
+        return super().format_option_help(formatter)
+
+
 def main(args=None):
     if args is None:
         args = sys.argv[1:]
 
-    version = metadata.version("qrcode")
-    parser = optparse.OptionParser(usage=(__doc__ or "").strip(), version=version)
+    # The version is looked up by get_version, if --version is used.
+    parser = OptionParser(usage=(__doc__ or "").strip(), version="qrcode")
 
     # Wrap parser.error in a typed NoReturn method for better typing.
     def raise_error(msg: str) -> NoReturn:
@@ -66,7 +89,7 @@ def main(args=None):
     )
     parser.add_option(
         "--factory-drawer",
-        help=f"Use an alternate drawer. {get_drawer_help()}.",
+        help="Use an alternate drawer.",
     )
     parser.add_option(
         "--optimize",
@@ -91,6 +114,63 @@ def main(args=None):
         help="The output file. If not specified, the image is sent to "
         "the standard output.",
     )
+    parser.add_option(
+        "--format",
+        type="choice",
+        choices=["image", "matrix"],
+        default="image",
+        help="Output an image (the default) or the matrix of modules, as a "
+        "PBM bitmap with a pixel per module.",
+    )
+    parser.add_option(
+        "--batch",
+        metavar="FILE",
+        help="Make a QR Code for each line of FILE (or of stdin, for -). "
+        "Empty lines are skipped.",
+    )
+    parser.add_option(
+        "-0",
+        "--null",
+        action="store_true",
+        help="Separate the --batch data with NUL characters instead of newlines.",
+    )
+    parser.add_option(
+        "--output-dir",
+        help="The directory to write the --batch files to. If not specified, "
+        "matrices are sent to the standard output one after another.",
+    )
+    parser.add_option(
+        "--filename",
+        default="{index}.{ext}",
+        help="The name of each --batch file in the output directory, using "
+        "{index} (the position of the data among the non-empty items, counting "
+        "from 0) and {ext} (the file extension). Defaults to {index}.{ext}.",
+    )
+    parser.add_option(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="The number of processes making the --batch QR Codes, or 0 for "
+        "one per CPU. Defaults to 1.",
+    )
+    parser.add_option(
+        "--worker",
+        action="store_true",
+        help="Keep running, making a QR Code for each request read from "
+        "stdin and writing its length (4 bytes, big-endian) and contents to "
+        "stdout. An empty response means the request failed.",
+    )
+    parser.add_option(
+        "--protocol",
+        type="choice",
+        choices=["json", "length"],
+        default="json",
+        help="The --worker requests: JSON lines (the default), each a string "
+        "of data or an object with the data and any of the factory, "
+        "factory_drawer, error_correction, optimize, format, box_size, border "
+        "and version for it, or length-prefixed (4 bytes, big-endian) data.",
+    )
 
     opts, args = parser.parse_args(args)
 
@@ -103,6 +183,28 @@ def main(args=None):
     else:
         image_factory = None
 
+    if opts.worker:
+        if args or opts.output or opts.batch:
+            raise_error("--worker can't be used with data, --output or --batch.")
+        Worker(opts, image_factory).run(sys.stdin.buffer, sys.stdout.buffer)
+        return
+
+    if opts.batch:
+        if args or opts.output:
+            raise_error("--batch can't be used with data or --output.")
+        if opts.factory_drawer:
+            raise_error("--batch can't be used with --factory-drawer.")
+        if opts.format == "image" and not opts.output_dir:
+            raise_error("--batch images need an --output-dir.")
+        if opts.jobs < 0:
+            raise_error("--jobs can't be negative.")
+        run_batch(
+            opts,
+            error_correction=error_correction[opts.error_correction],
+            image_factory=image_factory,
+        )
+        return
+
     qr = qrcode.QRCode(
         error_correction=error_correction[opts.error_correction],
         image_factory=image_factory,
@@ -118,7 +220,14 @@ def main(args=None):
     else:
         qr.add_data(data, optimize=opts.optimize)
 
-    if opts.output:
+    if opts.format == "matrix":
+        pbm = qr.to_matrix().to_pbm()
+        if opts.output:
+            Path(opts.output).write_bytes(pbm)
+        else:
+            sys.stdout.buffer.write(pbm)
+            sys.stdout.flush()
+    elif opts.output:
         img = qr.make_image()
         with Path(opts.output).open("wb") as out:
             img.save(out)
@@ -147,6 +256,188 @@ def main(args=None):
         img.save(sys.stdout.buffer)
 
 
+def run_batch(opts, **kwargs) -> None:
+    """
+    Make the QR Codes for the ``--batch`` data, on ``--jobs`` processes.
+    """
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    from qrcode import batch  # noqa: PLC0415
+
+    jobs = opts.jobs or os.cpu_count() or 1
+    delimiter = b"\0" if opts.null else b"\n"
+    with ExitStack() as stack:
+        stream = sys.stdin.buffer
+        if opts.batch != "-":
+            stream = stack.enter_context(Path(opts.batch).open("rb"))
+        executor = None
+        if jobs > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(jobs))
+        records = (
+            batch.Record(index, None, data)
+            for index, data in enumerate(read_payloads(stream, delimiter))
+        )
+        rendered = batch.render(
+            records,
+            workers=jobs,
+            executor=executor,
+            matrix=opts.format == "matrix",
+            optimize=20 if opts.optimize is None else opts.optimize,
+            **kwargs,
+        )
+        if opts.output_dir:
+            directory = Path(opts.output_dir)
+            directory.mkdir(parents=True, exist_ok=True)
+            for item in rendered:
+                name = opts.filename.format(
+                    index=item.record.index, ext=item.filename.rsplit(".", 1)[1]
+                )
+                (directory / name).write_bytes(item.content)
+        else:
+            for item in rendered:
+                sys.stdout.buffer.write(item.content)
+            sys.stdout.flush()
+
+
+class Worker:
+    """
+    Makes the QR Codes for ``qr --worker`` requests, keeping the image
+    factories (and everything else already built) between requests.
+    """
+
+    # The options a JSON request can give.
+    REQUEST_KEYS = frozenset(
+        (
+            "data",
+            "factory",
+            "factory_drawer",
+            "error_correction",
+            "optimize",
+            "format",
+            "box_size",
+            "border",
+            "version",
+        )
+    )
+
+    def __init__(self, opts, image_factory=None):
+        self.opts = opts
+        self.factories = {opts.factory: image_factory}
+
+    def run(self, stdin, stdout):
+        """
+        Answer each request from ``stdin`` on ``stdout``, until ``stdin``
+        ends. Failed requests are reported on stderr, and a truncated request
+        exits with an error.
+        """
+        try:
+            for request in self.read_requests(stdin):
+                try:
+                    content = self.make(self.parse(request))
+                except Exception as e:  # noqa: BLE001
+                    content = b""
+                    sys.stderr.write(f"qr: error: {type(e).__name__}: {e}\n")
+                    sys.stderr.flush()
+                stdout.write(len(content).to_bytes(4, "big") + content)
+                stdout.flush()
+        except EOFError as e:
+            sys.exit(f"qr: error: {e}")
+
+    def read_requests(self, stream):
+        """
+        Lazily read the (unparsed) requests.
+        """
+        if self.opts.protocol == "json":
+            for line in stream:
+                if line.strip():
+                    yield line
+            return
+        while header := stream.read(4):
+            if len(header) < 4:
+                raise EOFError("Incomplete request length")
+            length = int.from_bytes(header, "big")
+            data = stream.read(length)
+            if len(data) < length:
+                raise EOFError("Incomplete request data")
+            yield data
+
+    def parse(self, request):
+        """
+        Return the options for a request, as a dictionary.
+        """
+        if self.opts.protocol == "length":
+            return {"data": request}
+        options = json.loads(request)
+        if not isinstance(options, dict):
+            return {"data": options}
+        unknown = set(options) - self.REQUEST_KEYS
+        if unknown:
+            raise ValueError(f"Unknown request keys: {commas(sorted(unknown), 'and')}")
+        if "data" not in options:
+            raise ValueError("The request has no data")
+        return options
+
+    def factory(self, name):
+        """
+        Return the image factory for a ``--factory`` name (loaded once).
+        """
+        if name not in self.factories:
+            self.factories[name] = get_factory(default_factories.get(name, name))
+        return self.factories[name]
+
+    def make(self, request):
+        """
+        Return the image (or PBM matrix) for a request.
+        """
+        opts = self.opts
+        qr = qrcode.QRCode(
+            version=request.get("version"),
+            error_correction=error_correction[
+                request.get("error_correction", opts.error_correction)
+            ],
+            box_size=request.get("box_size", 10),
+            border=request.get("border", 4),
+            image_factory=self.factory(request.get("factory", opts.factory)),
+        )
+        optimize = request.get("optimize", opts.optimize)
+        qr.add_data(request["data"], optimize=20 if optimize is None else optimize)
+        if request.get("format", opts.format) == "matrix":
+            return qr.to_matrix().to_pbm()
+
+        kwargs = {}
+        drawer = request.get("factory_drawer", opts.factory_drawer)
+        if drawer:
+            aliases = getattr(qr.image_factory, "drawer_aliases", None) or {}
+            if drawer not in aliases:
+                raise ValueError(f"{drawer} factory drawer not found")
+            drawer_cls, drawer_kwargs = aliases[drawer]
+            kwargs["module_drawer"] = drawer_cls(**drawer_kwargs)
+        img = qr.make_image(**kwargs)
+        stream = io.BytesIO()
+        img.save(stream)
+        return stream.getvalue()
+
+
+def read_payloads(stream, delimiter=b"\n"):
+    """
+    Lazily split a binary stream into the data between delimiters, skipping
+    any empty data (and, for newlines, any carriage returns ending a line).
+    """
+    read = getattr(stream, "read1", stream.read)
+    remainder = b""
+    for chunk in iter(partial(read, 65536), b""):
+        *payloads, remainder = (remainder + chunk).split(delimiter)
+        for payload in payloads:
+            if delimiter == b"\n":
+                payload = payload.removesuffix(b"\r")  # noqa: PLW2901
+            if payload:
+                yield payload
+    if delimiter == b"\n":
+        remainder = remainder.removesuffix(b"\r")
+    if remainder:
+        yield remainder
+
+
 def get_factory(module: str) -> type[BaseImage]:
     if "." not in module:
         raise ValueError("The image factory is not a full python path")
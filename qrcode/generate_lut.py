@@ -0,0 +1,222 @@
+"""
+Generate ``LUT.py``, the lookup tables derived from the QR Code spec, so that
+they don't need computing when qrcode is imported or for every QR Code.
+
+Run it after changing how any of the tables are computed, or the source
+tables in ``spec.py``::
+
+    python qrcode/generate_lut.py [OUTPUT]
+
+Run as a script, it only imports ``spec.py`` (not the qrcode package, which
+needs ``LUT.py``), so it works even when ``LUT.py`` is stale or broken.
+"""
+
+import sys
+from pathlib import Path
+
+if __package__:
+    from qrcode import spec
+else:  # Run as a script: spec.py is next to it.
+    import spec
+
+LUT_PATH = Path(__file__).with_name("LUT.py")
+
+WIDTH = 88
+
+HEADER = """\
+# Lookup tables, generated by qrcode/generate_lut.py. Don't edit this file,
+# regenerate it with: python qrcode/generate_lut.py
+
+# fmt: off
+"""
+
+
+def gf_tables():
+    """
+    Return the exponent and logarithm tables for GF(256).
+    """
+    exp = list(range(256))
+    log = list(range(256))
+    for i in range(8):
+        exp[i] = 1 << i
+    for i in range(8, 256):
+        exp[i] = exp[i - 4] ^ exp[i - 5] ^ exp[i - 6] ^ exp[i - 8]
+    for i in range(255):
+        log[exp[i]] = i
+    return tuple(exp), tuple(log)
+
+
+def generator_polynomial(ec_count, exp, log):
+    """
+    Return the Reed-Solomon generator polynomial coefficients for
+    ``ec_count`` error correction codewords.
+    """
+    poly = [1]
+    for i in range(ec_count):
+        # Multiply by (x + a^i).
+        product = [*poly, 0]
+        for j, item in enumerate(poly):
+            if item:
+                product[j + 1] ^= exp[(log[item] + i) % 255]
+        poly = product
+    return poly
+
+
+def rs_blocks():
+    """
+    Return the expanded ``(total_count, data_count)`` blocks, indexed by error
+    correction level and version.
+    """
+    table = []
+    for error_correction in range(4):
+        offset = spec.RS_BLOCK_OFFSET[error_correction]
+        versions = [()]
+        for version in range(1, 41):
+            row = spec.RS_BLOCK_TABLE[(version - 1) * 4 + offset]
+            blocks = []
+            for i in range(0, len(row), 3):
+                count, total_count, data_count = row[i : i + 3]
+                blocks.extend([(total_count, data_count)] * count)
+            versions.append(tuple(blocks))
+        table.append(tuple(versions))
+    return tuple(table)
+
+
+def bch_remainder(data, generator, shift):
+    d = data << shift
+    while spec.BCH_digit(d) - spec.BCH_digit(generator) >= 0:
+        d ^= generator << (spec.BCH_digit(d) - spec.BCH_digit(generator))
+    return (data << shift) | d
+
+
+def tables():
+    """
+    Compute the tables, returning ``(name, comment, value)`` for each.
+    """
+    exp, log = gf_tables()
+    blocks = rs_blocks()
+    ec_counts = sorted(
+        {
+            total - data
+            for level in blocks
+            for version in level
+            for total, data in version
+        }
+    )
+    generators = {
+        ec_count: generator_polynomial(ec_count, exp, log) for ec_count in ec_counts
+    }
+    return [
+        ("EXP_TABLE", "Powers of the GF(256) generator.", exp),
+        ("LOG_TABLE", "Logarithms in GF(256) (the entry for 0 is unused).", log),
+        (
+            "rsPoly_LUT",
+            (
+                "Reed-Solomon generator polynomials, by error correction codeword "
+                "count.\nUsage: rsPoly = base.Polynomial(LUT.rsPoly_LUT[ecCount], 0)"
+            ),
+            generators,
+        ),
+        (
+            "RS_GENERATOR_LOG",
+            "The same generator polynomials, with the coefficients as logarithms.",
+            {
+                ec_count: tuple(log[item] for item in generator)
+                for ec_count, generator in generators.items()
+            },
+        ),
+        (
+            "RS_BLOCKS",
+            (
+                "The (total_count, data_count) of every error correction block, "
+                "indexed\nby error correction level and version."
+            ),
+            blocks,
+        ),
+        (
+            "BIT_LIMIT_TABLE",
+            "Data bit capacities, indexed by error correction level and version.",
+            tuple(
+                (0, *(8 * sum(data for _, data in version) for version in level[1:]))
+                for level in blocks
+            ),
+        ),
+        (
+            "FORMAT_INFO",
+            "Format information, indexed by error correction level << 3 | mask pattern.",
+            tuple(
+                bch_remainder(data, spec.G15, 10) ^ spec.G15_MASK for data in range(32)
+            ),
+        ),
+        (
+            "VERSION_INFO",
+            "Version information, indexed by version (versions 1 to 6 have none).",
+            tuple(
+                bch_remainder(version, spec.G18, 12) if version >= 7 else 0
+                for version in range(41)
+            ),
+        ),
+    ]
+
+
+def format_value(value, indent=0, extra=0):
+    """
+    Format a table as Python source, wrapping it to ``WIDTH`` columns, given
+    the indent and the number of other characters on the same line.
+    """
+    text = repr(value)
+    fits = indent + extra + len(text) <= WIDTH
+    if fits or not isinstance(value, (tuple, list, dict)):
+        return text
+    inner = " " * (indent + 4)
+    if isinstance(value, dict):
+        items = [
+            f"{key!r}: {format_value(item, indent + 4, len(repr(key)) + 3)}"
+            for key, item in value.items()
+        ]
+        brackets = "{}"
+    else:
+        items = [format_value(item, indent + 4, 1) for item in value]
+        brackets = "()" if isinstance(value, tuple) else "[]"
+    lines = []
+    if all("\n" not in item for item in items):
+        # Fill each line with as many items as fit.
+        line = ""
+        for item in items:
+            if line and len(inner) + len(line) + len(item) + 2 > WIDTH:
+                lines.append(line.rstrip())
+                line = ""
+            line += f"{item}, "
+        lines.append(line.rstrip())
+    else:
+        lines = [f"{item}," for item in items]
+    body = "\n".join(inner + line for line in lines)
+    return f"{brackets[0]}\n{body}\n{' ' * indent}{brackets[1]}"
+
+
+def render():
+    """
+    Return the source of ``LUT.py``.
+    """
+    sections = []
+    for name, comment, value in tables():
+        comment_lines = "\n".join(f"# {line}" for line in comment.splitlines())
+        noqa = "  # noqa: N816" if name != name.upper() else ""
+        text = format_value(value, extra=len(name) + 3)
+        if "\n" in text:
+            first, rest = text.split("\n", 1)
+            text = f"{first}{noqa}\n{rest}"
+        else:
+            text += noqa
+        sections.append(f"{comment_lines}\n{name} = {text}\n")
+    return HEADER + "\n" + "\n".join(sections)
+
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+    Path(args[0] if args else LUT_PATH).write_text(render())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -29,6 +29,12 @@ class BaseImage(abc.ABC):
         self.box_size = box_size
         self.pixel_size = (self.width + self.border * 2) * self.box_size
         self.modules = kwargs.pop("qrcode_modules")
+        # The top left corner of each finder pattern (a Micro QR Code has one).
+        self.finders = kwargs.pop("qrcode_finders", None) or (
+            (0, 0),
+            (width - 7, 0),
+            (0, width - 7),
+        )
         self._img = self.new_image(**kwargs)
         self.init_new_image()
 
@@ -56,6 +62,15 @@ class BaseImage(abc.ABC):
         Save the image file.
         """
 
+    async def save_async(self, stream, *args, **kwargs):
+        """
+        Save the image file without blocking the event loop (see
+        ``qrcode.aio``).
+        """
+        from qrcode import aio  # noqa: PLC0415
+
+        await aio.run(self.save, stream, *args, **kwargs)
+
     def pixel_box(self, row, col):
         """
         A helper method for pixel-based image generators that specifies the
@@ -102,10 +117,9 @@ class BaseImage(abc.ABC):
         """
         Find whether the referenced module is in an eye.
         """
-        return (
-            (row < 7 and col < 7)
-            or (row < 7 and self.width - col < 8)
-            or (self.width - row < 8 and col < 7)
+        return any(
+            top <= row < top + 7 and left <= col < left + 7
+            for top, left in self.finders
         )
 
 
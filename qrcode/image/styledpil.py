@@ -3,7 +3,6 @@ from __future__ import annotations
 import warnings
 from typing import overload
 
-import deprecation
 from PIL import Image
 
 import qrcode.image.base
@@ -111,13 +110,13 @@ class StyledPilImage(qrcode.image.base.BaseImageWithDrawer):
         if self.embedded_image:
             self.draw_embedded_image()
 
-    @deprecation.deprecated(
-        deprecated_in="9.0",
-        removed_in="8.3",
-        current_version="8.2",
-        details="Use draw_embedded_image() instead",
-    )
     def draw_embeded_image(self):
+        warnings.warn(
+            "draw_embeded_image() is deprecated. Use draw_embedded_image() "
+            "instead. draw_embeded_image() will be removed in v9.0.",
+            category=DeprecationWarning,
+            stacklevel=2,
+        )
         return self.draw_embedded_image()
 
     def draw_embedded_image(self):
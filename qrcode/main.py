@@ -1,17 +1,47 @@
 from __future__ import annotations
 
+import io
+import operator
+import os
 import sys
+import threading
+import time
 import warnings
 from bisect import bisect_left
-from typing import Generic, NamedTuple, TypeVar, cast, overload
+from functools import reduce
+from itertools import repeat
+from typing import TYPE_CHECKING, Generic, NamedTuple, TypeVar, cast, overload
 
-from qrcode import constants, exceptions, util
+from qrcode import base, bitboard, cache, constants, exceptions, util
+from qrcode.compat.numpy import load_numpy
 from qrcode.image.base import BaseImage
-from qrcode.image.pure import PyPNGImage
+from qrcode.matrix import Matrix
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
 
 ModulesType = list[list[bool | None]]
-# Cache modules generated just based on the QR Code version
+# Shared caches, built as needed (or by ``warmup``). They are only ever added
+# to, while holding precomputed_lock, so they can be read without it.
 precomputed_qr_blanks: dict[int, ModulesType] = {}
+precomputed_qr_templates: dict[tuple[int, int, int], ModulesType] = {}
+precomputed_bitboards: dict[tuple[int, int], bitboard.Template] = {}
+precomputed_placements: dict[int, bitboard.Placement] = {}
+precomputed_lock = threading.RLock()
+_shared_mask_executor: ThreadPoolExecutor | None = None
+_mask_executor_lock = threading.Lock()
+
+
+def _reset_mask_executor():
+    # A forked child inherits the pool without its threads, so it would wait
+    # forever for them. Start a new pool in the child when one is needed.
+    global _shared_mask_executor, _mask_executor_lock  # noqa: PLW0603
+    _shared_mask_executor = None
+    _mask_executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_mask_executor)
 
 
 def make(data=None, **kwargs):
@@ -20,6 +50,291 @@ def make(data=None, **kwargs):
     return qr.make_image()
 
 
+def structured_append(data, max_symbols=16, optimize=20, **kwargs):
+    """
+    Split data across a sequence of up to ``max_symbols`` QR Codes, linked
+    with Structured Append headers so a reader can reassemble it.
+
+    The data is spread over as many symbols as needed for them all to share
+    the smallest possible version (or ``version``, if it is provided), and
+    is balanced between them where possible. Other keyword arguments are
+    passed to each ``QRCode``.
+
+    :raises DataOverflowError: if the data doesn't fit in ``max_symbols``.
+    """
+    if not 1 <= max_symbols <= 16:
+        raise ValueError(f"Invalid max_symbols (was {max_symbols}, expected 1 to 16)")
+    version = kwargs.pop("version", None)
+    error_correction = kwargs.get("error_correction", constants.ERROR_CORRECT_M)
+    is_text = not isinstance(data, bytes)
+    data = util.to_bytestring(data)
+    # Don't split text in the middle of a multi-byte UTF-8 character.
+    boundaries = [i for i, c in enumerate(data) if not is_text or c & 0xC0 != 0x80] + [
+        len(data)
+    ]
+
+    def fits(start, end, version):
+        qr = QRCode(version=version, error_correction=error_correction)
+        qr.structured_append = util.StructuredAppend(0, 1, 0)
+        qr.add_data(data[boundaries[start] : boundaries[end]], optimize=optimize)
+        try:
+            return qr.best_fit(start=version) == version
+        except exceptions.DataOverflowError:
+            return False
+
+    def split(version):
+        # Fill each symbol as full as possible.
+        ends: list[int] = []
+        start = 0
+        while start < len(boundaries) - 1:
+            if len(ends) == max_symbols:
+                return None
+            lo, hi = start, len(boundaries) - 1
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if fits(start, mid, version):
+                    lo = mid
+                else:
+                    hi = mid - 1
+            if lo == start:
+                return None
+            ends.append(lo)
+            start = lo
+        if not ends:
+            return [len(boundaries) - 1]
+        # Try evening out the split across the same number of symbols.
+        even = [
+            bisect_left(boundaries, len(data) * (i + 1) // len(ends))
+            for i in range(len(ends))
+        ]
+        if all(
+            start < end and fits(start, end, version)
+            for start, end in zip([0, *even], even, strict=False)
+        ):
+            return even
+        return ends
+
+    if version is None:
+        lo, hi = 1, 41
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if split(mid) is None:
+                lo = mid + 1
+            else:
+                hi = mid
+        version = lo
+    if version > 40 or (ends := split(version)) is None:
+        raise exceptions.DataOverflowError(
+            f"Data does not fit in {max_symbols} symbols"
+        )
+
+    parity = reduce(operator.xor, data, 0)
+    codes = []
+    for index, (start, end) in enumerate(zip([0, *ends], ends, strict=False)):
+        qr = QRCode(version=version, **kwargs)
+        qr.structured_append = util.StructuredAppend(index, len(ends), parity)
+        qr.add_data(data[boundaries[start] : boundaries[end]], optimize=optimize)
+        codes.append(qr)
+    return codes
+
+
+def make_structured_append(data, max_symbols=16, workers=None, **kwargs):
+    """
+    Build the images for a Structured Append sequence (see
+    ``structured_append``), encoding and rendering the symbols concurrently.
+    """
+    from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+    codes = structured_append(data, max_symbols=max_symbols, **kwargs)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(QRCode.make_image, codes))
+
+
+# The results make_many can return for each item of data.
+MAKE_MANY_OUTPUTS = ("matrix", "bytes", "path")
+
+
+def make_many(
+    iterable, workers=None, output="matrix", path=None, chunksize=None, **kwargs
+):
+    """
+    Make a QR Code for each item of data in the iterable, on a pool of
+    ``workers`` processes (by default, one per CPU), returning a list of the
+    results in the same order as the data.
+
+    ``output`` is what to return for each item:
+
+    ``"matrix"`` (default)
+        The compact ``qrcode.matrix.Matrix`` (see ``QRCode.to_matrix``).
+    ``"bytes"``
+        The contents of the image file.
+    ``"path"``
+        The path the image is saved to, ``path.format(index=index)``.
+
+    Other keyword arguments are passed to each ``QRCode``. The data is sent
+    to the workers in chunks of ``chunksize`` items, those needing the
+    largest versions first so that no worker is left with a slow chunk at the
+    end, and each worker builds the caches for those versions (see
+    ``warmup``) when it starts.
+    """
+    if output not in MAKE_MANY_OUTPUTS:
+        raise ValueError(
+            f"Invalid output (was {output!r}, expected one of {MAKE_MANY_OUTPUTS})"
+        )
+    if output == "path" and path is None:
+        raise ValueError('A path is needed for output="path"')
+    items = list(iterable)
+    if not items:
+        return []
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    error_correction = kwargs.get("error_correction", constants.ERROR_CORRECT_M)
+    min_version = kwargs.get("version") or 1
+    versions = [
+        41 if guess.version is None else max(guess.version, min_version)
+        for guess in estimate_many(items, error_correction)
+    ]
+    order = sorted(range(len(items)), key=versions.__getitem__, reverse=True)
+    if chunksize is None:
+        chunksize = min(max(len(items) // (workers * 4), 1), 256)
+    chunks = [
+        [(index, items[index]) for index in order[start : start + chunksize]]
+        for start in range(0, len(order), chunksize)
+    ]
+
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    # Build the shared caches here too, so that forked workers start with them.
+    # Only the caches: an image factory or mask pool shouldn't be forked.
+    warm_versions = sorted({version for version in versions if version <= 40})
+    warmup(warm_versions, [kwargs.get("error_correction", constants.ERROR_CORRECT_M)])
+    results = [None] * len(items)
+    with ProcessPoolExecutor(
+        workers,
+        initializer=_make_many_worker,
+        initargs=(warm_versions, output, kwargs),
+    ) as executor:
+        for chunk in executor.map(
+            _make_chunk, chunks, repeat(output), repeat(path), repeat(kwargs)
+        ):
+            for index, result in chunk:
+                results[index] = result
+    return results
+
+
+def _make_many_worker(versions, output, kwargs):
+    """
+    Build the caches a ``make_many`` worker process will need.
+    """
+    warmup(versions, [kwargs.get("error_correction", constants.ERROR_CORRECT_M)])
+    if output != "matrix":
+        # Load the image factory (and whatever it imports) up front too.
+        make("", **kwargs)
+
+
+def _make_chunk(chunk, output, path, kwargs):
+    """
+    Make the QR Codes for a chunk of ``make_many`` data, returning each result
+    with the index of its data.
+    """
+    results = []
+    for index, data in chunk:
+        qr = QRCode(**kwargs)
+        qr.add_data(data)
+        if output == "matrix":
+            result = qr.to_matrix()
+        else:
+            img = qr.make_image()
+            if output == "bytes":
+                stream = io.BytesIO()
+                img.save(stream)
+                result = stream.getvalue()
+            else:
+                result = path.format(index=index)
+                img.save(result)
+        results.append((index, result))
+    return results
+
+
+class Estimate(NamedTuple):
+    """
+    The size of the QR Code needed for some data, as returned by ``estimate``.
+
+    ``version`` is ``None`` if the data doesn't fit in a QR Code, in which
+    case ``bits`` and ``capacity`` are for version 40.
+    """
+
+    version: int | None
+    bits: int
+    capacity: int
+
+    @property
+    def headroom(self) -> int:
+        """
+        The number of data bits left unused (negative if the data doesn't fit).
+        """
+        return self.capacity - self.bits
+
+
+def estimate(data, error_correction=constants.ERROR_CORRECT_M, optimize=20):
+    """
+    Find the version of QR Code needed for the data, and how many of its data
+    bits are used, without encoding it.
+    """
+    return next(estimate_many([data], error_correction, optimize))
+
+
+def estimate_many(iterable, error_correction=constants.ERROR_CORRECT_M, optimize=20):
+    """
+    Like ``estimate``, but for each item of data in the iterable. Useful for
+    rejecting data that won't fit before doing any encoding.
+    """
+    qr = QRCode(error_correction=error_correction)
+    bit_limits = util.BIT_LIMIT_TABLE[qr.error_correction]
+    for data in iterable:
+        qr.clear()
+        qr.add_data(data, optimize=optimize)
+        try:
+            version = qr.best_fit()
+        except exceptions.DataOverflowError:
+            yield Estimate(None, qr._bit_length(40), bit_limits[40])
+        else:
+            yield Estimate(version, qr._bit_length(version), bit_limits[version])
+
+
+def warmup(versions=None, levels=None):
+    """
+    Build the shared function patterns, mask templates, data placements and
+    error correction tables for the QR Code versions and error correction
+    levels (all of them by default).
+
+    Call this before forking worker processes, so that none of them pay for
+    building these on their first QR Codes.
+    """
+    if versions is None:
+        versions = range(1, 41)
+    if levels is None:
+        levels = (
+            constants.ERROR_CORRECT_L,
+            constants.ERROR_CORRECT_M,
+            constants.ERROR_CORRECT_Q,
+            constants.ERROR_CORRECT_H,
+        )
+    for version in versions:
+        for level in levels:
+            qr = QRCode(version=version, error_correction=level)
+            template = qr.bitboard_template()
+            placement = qr.data_placement()
+            if load_numpy() is not None:
+                from qrcode import numpy_backend  # noqa: PLC0415
+
+                numpy_backend.template_arrays(template)
+                numpy_backend.placement_arrays(placement)
+            for block in base.rs_blocks(version, level):
+                base.rs_feedback_table(block.total_count - block.data_count)
+
+
 def _check_box_size(size):
     if int(size) <= 0:
         raise ValueError(f"Invalid box size (was {size}, expected larger than 0)")
@@ -43,6 +358,73 @@ def _check_mask_pattern(mask_pattern):
         raise ValueError(f"Mask pattern should be in range(8) (got {mask_pattern})")
 
 
+def _check_mask_strategy(mask_strategy):
+    if mask_strategy in ("exhaustive", "fast"):
+        return
+    if isinstance(mask_strategy, str) and mask_strategy.startswith("deadline="):
+        try:
+            if float(mask_strategy[9:]) >= 0:
+                return
+        except ValueError:
+            pass
+    raise ValueError(
+        "Mask strategy should be 'exhaustive', 'fast' or 'deadline=<ms>' "
+        f"(got {mask_strategy!r})"
+    )
+
+
+def _mask_executor():
+    """
+    Return the thread pool shared by all QR Codes using ``parallel_masks``.
+    """
+    global _shared_mask_executor  # noqa: PLW0603
+    if _shared_mask_executor is None:
+        with _mask_executor_lock:
+            if _shared_mask_executor is None:
+                from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+                _shared_mask_executor = ThreadPoolExecutor(
+                    min(8, os.cpu_count() or 1), thread_name_prefix="qrcode-mask"
+                )
+    return _shared_mask_executor
+
+
+def _parallel_best_mask(score, deadline=None):
+    """
+    Score the eight masks on the shared thread pool, returning the best mask
+    pattern, its penalty and its symbol.
+
+    With a deadline, only the masks scored in time count (waiting for at
+    least one).
+    """
+    futures = [_mask_executor().submit(score, pattern) for pattern in range(8)]
+    done = futures
+    if deadline is not None:
+        from concurrent.futures import FIRST_COMPLETED, wait  # noqa: PLC0415
+
+        done, not_done = wait(futures, max(deadline - time.perf_counter(), 0))
+        if not done:
+            done, not_done = wait(futures, return_when=FIRST_COMPLETED)
+        for future in not_done:
+            future.cancel()
+    pattern = min((future.result()[0], futures.index(future)) for future in done)[1]
+    lost_point, symbol = futures[pattern].result()
+    return pattern, lost_point, symbol
+
+
+class MaskChoice(NamedTuple):
+    """
+    The mask pattern chosen by ``QRCode.best_mask_pattern``, for auditing.
+
+    ``lost_point`` is the penalty the strategy scored for it (for the
+    ``"fast"`` strategy, only rules 1 and 4).
+    """
+
+    mask_pattern: int
+    lost_point: int
+    strategy: str
+
+
 def copy_2d_array(x):
     return [row[:] for row in x]
 
@@ -78,6 +460,8 @@ class QRCode(Generic[GenericImage]):
         border=4,
         image_factory: type[GenericImage] | None = None,
         mask_pattern=None,
+        mask_strategy="exhaustive",
+        parallel_masks=False,
     ):
         _check_box_size(box_size)
         _check_border(border)
@@ -89,6 +473,10 @@ class QRCode(Generic[GenericImage]):
         # any (e.g. for producing printable QR codes).
         self.border = int(border)
         self.mask_pattern = mask_pattern
+        self.mask_strategy = mask_strategy
+        # Score the mask candidates on a shared thread pool (worthwhile on
+        # free-threaded Python builds).
+        self.parallel_masks = parallel_masks
         self.image_factory = image_factory
         if image_factory is not None:
             assert issubclass(image_factory, BaseImage)
@@ -115,6 +503,20 @@ class QRCode(Generic[GenericImage]):
         _check_mask_pattern(pattern)
         self._mask_pattern = pattern
 
+    @property
+    def mask_strategy(self):
+        """
+        How ``best_mask_pattern`` chooses the mask: scoring every mask
+        (``"exhaustive"``), scoring only rules 1 and 4 (``"fast"``), or using
+        the best mask found within a time limit (``"deadline=<ms>"``).
+        """
+        return self._mask_strategy
+
+    @mask_strategy.setter
+    def mask_strategy(self, strategy):
+        _check_mask_strategy(strategy)
+        self._mask_strategy = strategy
+
     def clear(self):
         """
         Reset the internal data.
@@ -123,31 +525,81 @@ class QRCode(Generic[GenericImage]):
         self.modules_count = 0
         self.data_cache = None
         self.data_list = []
+        self.structured_append: util.StructuredAppend | None = None
         self._version = None
+        self._best_mask = None
+        self.mask_choice: MaskChoice | None = None
 
-    def add_data(self, data, optimize=20):
+    def add_data(self, data, optimize=20, kanji=False):
         """
         Add data to this QR Code.
 
         :param optimize: Data will be split into multiple chunks to optimize
             the QR size by finding to more compressed modes of at least this
-            length. Set to ``0`` to avoid optimizing at all.
+            length. Set to ``0`` to avoid optimizing at all, or to
+            ``"minimal"`` to use the segmentation that needs the fewest bits
+            (see :func:`qrcode.util.minimal_data_chunks`).
+        :param kanji: The data is Shift JIS (strings are encoded as Shift JIS
+            rather than UTF-8), and double-byte characters may be encoded
+            using the more compact Kanji mode.
         """
         if isinstance(data, util.QRData):
             self.data_list.append(data)
+        elif optimize == "minimal":
+            self.data_list.extend(self._minimal_data_chunks(data, kanji))
         elif optimize:
-            self.data_list.extend(util.optimal_data_chunks(data, minimum=optimize))
+            self.data_list.extend(
+                util.optimal_data_chunks(data, minimum=optimize, kanji=kanji)
+            )
+        elif kanji:
+            data = util.to_bytestring(data, "shift_jis")
+            mode = util.MODE_KANJI if util.RE_KANJI.match(data) else None
+            self.data_list.append(util.QRData(data, mode=mode))
         else:
             self.data_list.append(util.QRData(data))
         self.data_cache = None
 
+    def _minimal_data_chunks(self, data, kanji):
+        if self._version is not None:
+            return util.minimal_data_chunks(data, self._version, kanji)
+        # The character count header sizes change at versions 10 and 27, so
+        # use the segmentation for the first range of versions that fits.
+        for start, end in ((1, 9), (10, 26), (27, 40)):
+            chunks = util.minimal_data_chunks(data, start, kanji)
+            needed_bits = self._bit_length(start, self.data_list + chunks)
+            if needed_bits <= util.BIT_LIMIT_TABLE[self.error_correction][end]:
+                break
+        return chunks
+
+    def _bit_length(self, version, data_list=None):
+        """
+        The number of bits needed for the data in the given version.
+        """
+        if data_list is None:
+            data_list = self.data_list
+        needed_bits = util.bit_length(data_list, version)
+        if self.structured_append is not None:
+            needed_bits += util.STRUCTURED_APPEND_LENGTH
+        return needed_bits
+
     def make(self, fit=True):
         """
         Compile the data into a QR Code array.
 
         :param fit: If ``True`` (or if a size has not been provided), find the
             best fit for the data to avoid data overflow errors.
+
+        If the result cache is enabled (see ``qrcode.cache``), a QR Code
+        already made with the same data and settings is restored from it.
         """
+        results = cache.active
+        if results is not None:
+            key = self._result_key(fit)
+            result = results.get(key)
+            if result is not None:
+                self._restore_result(result)
+                return
+
         if fit or (self.version is None):
             self.best_fit(start=self.version)
         if self.mask_pattern is None:
@@ -155,7 +607,93 @@ class QRCode(Generic[GenericImage]):
         else:
             self.makeImpl(self.mask_pattern)
 
+        if results is not None:
+            results.put(
+                key,
+                cache.Result(
+                    self.version,
+                    Matrix.from_modules(self.modules),
+                    bytes(self.data_cache),
+                    self.mask_choice if self.mask_pattern is None else None,
+                ),
+            )
+
+    def _result_key(self, fit):
+        """
+        The result cache key for making this QR Code: everything ``make``
+        depends on.
+        """
+        return (
+            type(self),
+            tuple((data.mode, data.data) for data in self.data_list),
+            self.structured_append,
+            self.error_correction,
+            self._version,
+            bool(fit),
+            self.mask_pattern,
+            self.mask_strategy,
+        )
+
+    def _restore_result(self, result):
+        self.version = result.version
+        self.modules = result.matrix.tolist()
+        self.modules_count = len(self.modules)
+        self.data_cache = list(result.data)
+        self._best_mask = None
+        if result.mask_choice is not None:
+            self.mask_choice = result.mask_choice
+
     def makeImpl(self, mask_pattern):
+        best_mask, self._best_mask = self._best_mask, None
+        if best_mask is not None and best_mask[:3] == (
+            self.version,
+            self.data_cache,
+            mask_pattern,
+        ):
+            self.modules = best_mask[3]
+            self.modules_count = len(self.modules)
+            return
+
+        self.setup_function_patterns(mask_pattern)
+
+        if self.data_cache is None:
+            self.data_cache = util.create_data(
+                self.version,
+                self.error_correction,
+                self.data_list,
+                self.structured_append,
+            )
+        self.map_data(self.data_cache, mask_pattern)
+
+    def setup_function_patterns(self, mask_pattern):
+        """
+        Reset the modules to the function patterns and format information,
+        leaving the data modules as ``None``.
+        """
+        self.modules_count = self.version * 4 + 17
+        self.modules = copy_2d_array(self._function_patterns(mask_pattern))
+
+    def _function_patterns(self, mask_pattern):
+        """
+        Return the (shared) function patterns and format information for this
+        version and error correction level and the mask pattern.
+
+        They are built the first time they are needed (or by ``warmup``), once
+        for all instances.
+        """
+        key = (self.version, self.error_correction, mask_pattern)
+        template = precomputed_qr_templates.get(key)
+        if template is None:
+            with precomputed_lock:
+                template = precomputed_qr_templates.get(key)
+                if template is None:
+                    template = self._build_function_patterns(mask_pattern)
+                    precomputed_qr_templates[key] = template
+        return template
+
+    def _build_function_patterns(self, mask_pattern):
+        # The setup methods work on self.modules, so put it back afterwards.
+        modules, modules_count = self.modules, self.modules_count
         self.modules_count = self.version * 4 + 17
 
         if self.version in precomputed_qr_blanks:
@@ -164,9 +702,8 @@ class QRCode(Generic[GenericImage]):
             self.modules = [
                 [None] * self.modules_count for i in range(self.modules_count)
             ]
-            self.setup_position_probe_pattern(0, 0)
-            self.setup_position_probe_pattern(self.modules_count - 7, 0)
-            self.setup_position_probe_pattern(0, self.modules_count - 7)
+            for row, col in self.finder_positions():
+                self.setup_position_probe_pattern(row, col)
             self.setup_position_adjust_pattern()
             self.setup_timing_pattern()
 
@@ -177,11 +714,21 @@ class QRCode(Generic[GenericImage]):
         if self.version >= 7:
             self.setup_type_number()
 
-        if self.data_cache is None:
-            self.data_cache = util.create_data(
-                self.version, self.error_correction, self.data_list
-            )
-        self.map_data(self.data_cache, mask_pattern)
+        # Only the rows with format or version information differ from the
+        # blank, so share the others to keep the cache small.
+        blank = precomputed_qr_blanks[self.version]
+        template = [
+            blank_row if row == blank_row else row
+            for row, blank_row in zip(self.modules, blank, strict=True)
+        ]
+        self.modules, self.modules_count = modules, modules_count
+        return template
+
+    def finder_positions(self):
+        """
+        The (row, col) of the top left module of each finder pattern.
+        """
+        return ((0, 0), (self.modules_count - 7, 0), (0, self.modules_count - 7))
 
     def setup_position_probe_pattern(self, row, col):
         for r in range(-1, 8):
@@ -212,19 +759,13 @@ class QRCode(Generic[GenericImage]):
         # Corresponds to the code in util.create_data, except we don't yet know
         # version, so optimistically assume start and check later
         mode_sizes = util.mode_sizes_for_version(start)
-        buffer = util.BitBuffer()
-        for data in self.data_list:
-            buffer.put(data.mode, 4)
-            buffer.put(len(data), mode_sizes[data.mode])
-            data.write(buffer)
-
-        needed_bits = len(buffer)
-        # Create a thread-local copy of the table to avoid concurrent access issues (Python 3.13+)
-        self.version = bisect_left(
-            util.BIT_LIMIT_TABLE[self.error_correction][:], needed_bits, start
+        needed_bits = self._bit_length(start)
+        version = bisect_left(
+            util.BIT_LIMIT_TABLE[self.error_correction], needed_bits, start
         )
-        if self.version == 41:
+        if version == 41:
             raise exceptions.DataOverflowError
+        self.version = version
 
         # Now check whether we need more bits for the mode sizes, recursing if
         # our guess was too low
@@ -234,21 +775,92 @@ class QRCode(Generic[GenericImage]):
 
     def best_mask_pattern(self):
         """
-        Find the most efficient mask pattern.
+        Find the most efficient mask pattern, using the ``mask_strategy``.
+
+        The chosen pattern and its penalty are kept in ``mask_choice``.
         """
-        min_lost_point = 0
-        pattern = 0
+        strategy = self.mask_strategy
+        deadline = None
+        if strategy.startswith("deadline="):
+            deadline = time.perf_counter() + float(strategy[9:]) / 1000
 
-        for i in range(8):
-            self.makeImpl(i)
+        if self.data_cache is None:
+            self.data_cache = util.create_data(
+                self.version,
+                self.error_correction,
+                self.data_list,
+                self.structured_append,
+            )
+        template = self.bitboard_template()
+        placement = self.data_placement()
+        fast = strategy == "fast"
+        if load_numpy() is None:
+            rules = bitboard.FAST_RULES if fast else bitboard.RULES
+            if self.parallel_masks:
+                score = bitboard.mask_scorer(
+                    template, placement, self.data_cache, rules
+                )
+                pattern, lost_point, rows = _parallel_best_mask(score, deadline)
+            else:
+                pattern, lost_point, rows = bitboard.best_mask(
+                    template, placement, self.data_cache, rules, deadline
+                )
+            modules = bitboard.to_modules(rows, template.size)
+        else:
+            from qrcode import numpy_backend  # noqa: PLC0415
+
+            if self.parallel_masks:
+                score = numpy_backend.mask_scorer(
+                    template, placement, self.data_cache, fast
+                )
+                pattern, lost_point, board = _parallel_best_mask(score, deadline)
+                modules = board.tolist()
+            else:
+                pattern, lost_point, modules = numpy_backend.best_mask(
+                    template, placement, self.data_cache, fast, deadline
+                )
+        self.mask_choice = MaskChoice(pattern, lost_point, strategy)
+        # Keep the winning symbol, so makeImpl doesn't need to rebuild it.
+        self._best_mask = (self.version, self.data_cache, pattern, modules)
+        return pattern
 
-            lost_point = util.lost_point(self.modules)
+    def bitboard_template(self):
+        """
+        Return the (shared) bitboard template for this version and error
+        correction level.
+        """
+        key = (self.version, self.error_correction)
+        template = precomputed_bitboards.get(key)
+        if template is None:
+            with precomputed_lock:
+                template = precomputed_bitboards.get(key)
+                if template is None:
+                    template = self._build_bitboard_template()
+                    precomputed_bitboards[key] = template
+        return template
+
+    def _build_bitboard_template(self):
+        functions = [self._function_patterns(mask_pattern) for mask_pattern in range(8)]
+        return bitboard.make_template(
+            bitboard.reserved_rows(functions[0]),
+            [bitboard.rows(modules) for modules in functions],
+        )
 
-            if i == 0 or min_lost_point > lost_point:
-                min_lost_point = lost_point
-                pattern = i
+    def data_placement(self):
+        """
+        Return the (shared) placement of the data modules for this version.
 
-        return pattern
+        It is built the first time it is needed, once for all instances.
+        """
+        placement = precomputed_placements.get(self.version)
+        if placement is None:
+            reserved = self.bitboard_template().reserved
+            with precomputed_lock:
+                placement = precomputed_placements.get(self.version)
+                if placement is None:
+                    placement = bitboard.make_placement(reserved)
+                    precomputed_placements[self.version] = placement
+        return placement
 
     def print_tty(self, out=None):
         """
@@ -365,16 +977,22 @@ class QRCode(Generic[GenericImage]):
         else:
             image_factory = self.image_factory
             if image_factory is None:
-                from qrcode.image.pil import Image, PilImage  # noqa: PLC0415
-
                 # Use PIL by default if available, otherwise use PyPNG.
-                image_factory = PilImage if Image else PyPNGImage
+                if constants.PIL_AVAILABLE:
+                    from qrcode.image.pil import PilImage  # noqa: PLC0415
+
+                    image_factory = PilImage
+                else:
+                    from qrcode.image.pure import PyPNGImage  # noqa: PLC0415
+
+                    image_factory = PyPNGImage
 
         im = image_factory(
             self.border,
             self.modules_count,
             self.box_size,
             qrcode_modules=self.modules,
+            qrcode_finders=self.finder_positions(),
             **kwargs,
         )
 
@@ -470,45 +1088,18 @@ class QRCode(Generic[GenericImage]):
         self.modules[self.modules_count - 8][8] = True
 
     def map_data(self, data, mask_pattern):
-        inc = -1
-        row = self.modules_count - 1
-        bitIndex = 7
-        byteIndex = 0
-
-        mask_func = util.mask_func(mask_pattern)
-
-        data_len = len(data)
-
-        for col in range(self.modules_count - 1, 0, -2):
-            if col <= 6:
-                col -= 1  # noqa: PLW2901
-
-            col_range = (col, col - 1)
-
-            while True:
-                for c in col_range:
-                    if self.modules[row][c] is None:
-                        dark = False
-
-                        if byteIndex < data_len:
-                            dark = ((data[byteIndex] >> bitIndex) & 1) == 1
-
-                        if mask_func(row, c):
-                            dark = not dark
-
-                        self.modules[row][c] = dark
-                        bitIndex -= 1
-
-                        if bitIndex == -1:
-                            byteIndex += 1
-                            bitIndex = 7
-
-                row += inc
-
-                if row < 0 or self.modules_count <= row:
-                    row -= inc
-                    inc = -inc
-                    break
+        # The data modules are filled in the order of the version's (cached)
+        # placement, which follows the zigzag path up and down each pair of
+        # columns from the right.
+        modules = self.modules
+        placement = self.data_placement()
+        for row, col, bit in zip(
+            placement.rows,
+            placement.cols,
+            placement.bits(data, mask_pattern),
+            strict=True,
+        ):
+            modules[row][col] = bit == "1"
 
     def get_matrix(self):
         """
@@ -523,14 +1114,34 @@ class QRCode(Generic[GenericImage]):
             return self.modules
 
         width = len(self.modules) + self.border * 2
-        code = [[False] * width] * self.border
+        code = [[False] * width for _ in range(self.border)]
         x_border = [False] * self.border
         for module in self.modules:
             code.append(x_border + cast("list[bool]", module) + x_border)
-        code += [[False] * width] * self.border
+        code.extend([False] * width for _ in range(self.border))
 
         return code
 
+    def to_matrix(self) -> Matrix:
+        """
+        Return the QR Code as a compact ``qrcode.matrix.Matrix`` (a byte per
+        module), including the border.
+
+        It is a fraction of the size of ``modules``, for keeping many QR Codes
+        in memory.
+        """
+        if self.data_cache is None:
+            self.make()
+
+        return Matrix.from_modules(self.modules, self.border)
+
+    def to_numpy(self, border=None):
+        """
+        Return the QR Code as a two dimensional boolean NumPy array, with a
+        ``border`` (by default, ``self.border``).
+        """
+        return self.to_matrix().to_numpy(border)
+
     def active_with_neighbors(self, row: int, col: int) -> ActiveWithNeighbors:
         context: list[bool] = []
         for r in range(row - 1, row + 2):
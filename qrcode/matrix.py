@@ -0,0 +1,152 @@
+"""
+A compact QR Code matrix, for keeping many QR Codes in memory.
+
+The modules are held in a single ``bytearray``, one byte (0 for light, 1 for
+dark) per module, row by row and including a border of light modules. That is
+a byte per module rather than a pointer per module for ``QRCode.modules``,
+and it can be shared without copying through the buffer protocol or as a
+NumPy array.
+"""
+
+from __future__ import annotations
+
+from qrcode.compat.numpy import load_numpy
+
+
+class Matrix:
+    """
+    The modules of a QR Code (``size`` x ``size``) surrounded by a ``border``
+    of light modules.
+
+    Use ``buffer()`` (or ``memoryview(matrix)`` on Python 3.12 and later) for
+    a two dimensional view of the bytes, ``to_numpy()`` for a boolean NumPy
+    view and ``tolist()`` for the list-of-lists format of ``QRCode.modules``.
+    """
+
+    __slots__ = ("border", "data", "size")
+
+    def __init__(self, size, border=0, data=None):
+        if border < 0:
+            raise ValueError(
+                f"Invalid border value (was {border}, expected 0 or larger than that)"
+            )
+        self.size = size
+        self.border = border
+        width = self.width
+        if data is None:
+            data = bytearray(width * width)
+        elif len(data) != width * width:
+            raise ValueError(
+                f"Invalid data length (was {len(data)}, expected {width * width})"
+            )
+        self.data = data
+
+    @classmethod
+    def from_modules(cls, modules, border=0):
+        """
+        Build the matrix for a list-of-lists of modules, such as
+        ``QRCode.modules``. Unset (``None``) modules are light.
+        """
+        size = len(modules)
+        width = size + border * 2
+        side = bytes(border)
+        data = bytearray(width * border)
+        for row in modules:
+            data += side
+            data += bytes(bool(module) for module in row)
+            data += side
+        data += bytes(width * border)
+        return cls(size, border, data)
+
+    @property
+    def width(self):
+        """
+        The number of modules across the matrix, including the border.
+        """
+        return self.size + self.border * 2
+
+    def __eq__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return (self.size, self.border, self.data) == (
+            other.size,
+            other.border,
+            other.data,
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self):
+        return f"<{type(self).__name__} size={self.size} border={self.border}>"
+
+    def buffer(self):
+        """
+        Return a (width, width) ``memoryview`` of the matrix bytes, without
+        copying them.
+        """
+        width = self.width
+        return memoryview(self.data).cast("B", (width, width))
+
+    def __buffer__(self, flags):
+        return self.buffer()
+
+    def to_numpy(self, border=None):
+        """
+        Return the matrix as a two dimensional boolean NumPy array, with a
+        ``border`` (by default, the matrix's own border).
+
+        For borders up to the matrix's own, the array is a view of the matrix
+        rather than a copy.
+        """
+        np = load_numpy()
+        if np is None:
+            raise ImportError("NumPy library not found.")
+        if border is None:
+            border = self.border
+        width = self.width
+        array = np.frombuffer(self.data, dtype=bool).reshape(width, width)
+        if border > self.border:
+            return np.pad(array, border - self.border)
+        trim = self.border - border
+        return array[trim : width - trim, trim : width - trim]
+
+    def tolist(self, border=None):
+        """
+        Return the matrix as a list of lists of booleans, in the format of
+        ``QRCode.modules`` (with a ``border``, by default the matrix's own).
+        Each row is a separate list.
+        """
+        if border is None:
+            border = self.border
+        width = self.size + border * 2
+        rows = [[False] * width for _ in range(border)]
+        side = [False] * border
+        for row in range(self.size):
+            offset = (row + self.border) * self.width + self.border
+            modules = [byte == 1 for byte in self.data[offset : offset + self.size]]
+            rows.append(side + modules + side)
+        rows.extend([False] * width for _ in range(border))
+        return rows
+
+    def packbits(self):
+        """
+        Return the matrix packed 8 modules to a byte, row by row with the
+        leftmost module in the most significant bit and each row padded to a
+        whole byte with light modules.
+        """
+        width = self.width
+        row_bytes = (width + 7) // 8
+        padding = row_bytes * 8 - width
+        digits = bytes.maketrans(b"\x00\x01", b"01")
+        packed = bytearray()
+        for offset in range(0, len(self.data), width):
+            bits = self.data[offset : offset + width].translate(digits)
+            packed += (int(bits, 2) << padding).to_bytes(row_bytes, "big")
+        return bytes(packed)
+
+    def to_pbm(self):
+        """
+        Return the matrix as a binary PBM (Netpbm ``P4``) image, one pixel per
+        module, dark modules black.
+        """
+        return f"P4\n{self.width} {self.width}\n".encode() + self.packbits()
@@ -0,0 +1,285 @@
+"""
+Micro QR Code symbols (M1 to M4), for small amounts of data.
+
+Micro QR Codes have a single finder pattern and need a border of only two
+modules, so they take up much less space than the smallest (21x21) QR Code.
+"""
+
+from __future__ import annotations
+
+from qrcode import base, constants, exceptions, util
+from qrcode.main import QRCode
+
+# The number of data bits and error correction codewords for each version and
+# error correction level. M1 only offers error detection and is treated as L.
+# M1 and M3 finish with a 4 bit data codeword.
+RS_BLOCK_TABLE = {
+    (1, constants.ERROR_CORRECT_L): (20, 2),
+    (2, constants.ERROR_CORRECT_L): (40, 5),
+    (2, constants.ERROR_CORRECT_M): (32, 6),
+    (3, constants.ERROR_CORRECT_L): (84, 6),
+    (3, constants.ERROR_CORRECT_M): (68, 8),
+    (4, constants.ERROR_CORRECT_L): (128, 8),
+    (4, constants.ERROR_CORRECT_M): (112, 10),
+    (4, constants.ERROR_CORRECT_Q): (80, 14),
+}
+
+# The symbol number stored in the format information.
+SYMBOL_NUMBERS = {key: number for number, key in enumerate(RS_BLOCK_TABLE)}
+
+# Mode indicators. The indicator is version - 1 bits long, so M1 only supports
+# numeric data and M2 adds alphanumeric data.
+MODE_INDICATORS = {
+    util.MODE_NUMBER: 0,
+    util.MODE_ALPHA_NUM: 1,
+    util.MODE_8BIT_BYTE: 2,
+    util.MODE_KANJI: 3,
+}
+
+# Character count indicator lengths, by mode, for M1 to M4.
+LENGTH_BITS = {
+    util.MODE_NUMBER: (3, 4, 5, 6),
+    util.MODE_ALPHA_NUM: (None, 3, 4, 5),
+    util.MODE_8BIT_BYTE: (None, None, 4, 5),
+    util.MODE_KANJI: (None, None, 3, 4),
+}
+
+# Micro QR Codes use 4 of the QR Code mask patterns.
+MASK_PATTERNS = (1, 4, 6, 7)
+
+G15_MASK = (1 << 14) | (1 << 10) | (1 << 6) | (1 << 2) | (1 << 0)
+
+
+def BCH_format_info(data):
+    return util.BCH_type_info(data) ^ util.G15_MASK ^ G15_MASK
+
+
+def check_version(version):
+    if version < 1 or version > 4:
+        raise ValueError(f"Invalid version (was {version}, expected 1 to 4)")
+
+
+def length_in_bits(mode, version):
+    """
+    Return the length of the character count indicator, or ``None`` if the
+    mode isn't available in this version.
+    """
+    if mode not in LENGTH_BITS:
+        raise TypeError(f"Invalid mode ({mode})")  # pragma: no cover
+
+    check_version(version)
+
+    return LENGTH_BITS[mode][version - 1]
+
+
+def data_length(version, data_list):
+    """
+    Return the number of bits needed for the data in this version, or ``None``
+    if the data uses a mode the version doesn't support.
+    """
+    needed_bits = 0
+    for data in data_list:
+        bits = length_in_bits(data.mode, version)
+        if bits is None or len(data) >= 1 << bits:
+            return None
+        needed_bits += version - 1 + bits + util.data_bit_length(data.mode, len(data))
+    return needed_bits
+
+
+def create_data(version, error_correction, data_list):
+    if (version, error_correction) not in RS_BLOCK_TABLE:
+        raise ValueError(f"Error correction level not available for M{version} symbols")
+    data_bits, ec_count = RS_BLOCK_TABLE[version, error_correction]
+
+    buffer = util.BitBuffer()
+    for data in data_list:
+        bits = length_in_bits(data.mode, version)
+        if bits is None:
+            raise ValueError(f"Mode {data.mode} not available in M{version} symbols")
+        buffer.put(MODE_INDICATORS[data.mode], version - 1)
+        buffer.put(len(data), bits)
+        data.write(buffer)
+
+    if len(buffer) > data_bits:
+        raise exceptions.DataOverflowError(
+            f"Code length overflow. Data size ({len(buffer)}) > size available ({data_bits})"
+        )
+
+    # Terminate the bits (M1 uses 3 0s, each version after that 2 more).
+    buffer.put(0, min(data_bits - len(buffer), version * 2 + 1))
+
+    # Delimit the string into 8-bit words, padding with 0s if necessary.
+    delimit = len(buffer) % 8
+    if delimit:
+        buffer.put(0, min(8 - delimit, data_bits - len(buffer)))
+
+    # Add special alternating padding bitstrings until buffer is full, with
+    # the final 4 bit codeword of M1 and M3 symbols left as 0s.
+    bytes_to_fill = (data_bits // 8 * 8 - len(buffer)) // 8
+    if bytes_to_fill > 0:
+        buffer.put_bytes(
+            bytes((util.PAD0, util.PAD1) * (bytes_to_fill // 2 + 1))[:bytes_to_fill]
+        )
+    buffer.put(0, data_bits - len(buffer))
+
+    # Micro QR Codes have a single block. Error correction is calculated on
+    # whole codewords, but only the top 4 bits of a final half codeword are
+    # placed in the symbol.
+    data = list(buffer.buffer)
+    placed = util.BitBuffer()
+    placed.put(
+        int.from_bytes(buffer.buffer, "big") >> (len(data) * 8 - data_bits), data_bits
+    )
+    placed.put_bytes(bytes(base.rs_encode(data, ec_count)))
+    return list(placed.buffer)
+
+
+class MicroQRCode(QRCode):
+    """
+    A Micro QR Code, usable with any of the image factories.
+
+    The version is 1 to 4 (for M1 to M4), ``error_correction`` can't be H
+    (and M4 is the only version supporting Q), and the mask pattern is 0 to 3.
+    M1 symbols only detect errors, and are only used for
+    ``ERROR_CORRECT_L``.
+    """
+
+    def __init__(
+        self,
+        version=None,
+        error_correction=constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=2,
+        image_factory=None,
+        mask_pattern=None,
+    ):
+        if error_correction == constants.ERROR_CORRECT_H:
+            raise ValueError("Micro QR Codes don't support ERROR_CORRECT_H")
+        super().__init__(
+            version=version,
+            error_correction=error_correction,
+            box_size=box_size,
+            border=border,
+            image_factory=image_factory,
+            mask_pattern=mask_pattern,
+        )
+
+    @property
+    def version(self) -> int:
+        if self._version is None:
+            self.best_fit()
+        return self._version  # type: ignore[return-value]
+
+    @version.setter
+    def version(self, value) -> None:
+        if value is not None:
+            value = int(value)
+            check_version(value)
+        self._version = value
+
+    @property
+    def mask_pattern(self):
+        return self._mask_pattern
+
+    @mask_pattern.setter
+    def mask_pattern(self, pattern):
+        if pattern is not None:
+            if not isinstance(pattern, int):
+                raise TypeError(
+                    f"Invalid mask pattern (was {type(pattern)}, expected int)"
+                )
+            if pattern < 0 or pattern > 3:
+                raise ValueError(f"Mask pattern should be in range(4) (got {pattern})")
+        self._mask_pattern = pattern
+
+    def best_fit(self, start=None):
+        """
+        Find the minimum size required to fit in the data.
+        """
+        if start is None:
+            start = 1
+        check_version(start)
+
+        for version in range(start, 5):
+            if (version, self.error_correction) not in RS_BLOCK_TABLE:
+                continue
+            needed_bits = data_length(version, self.data_list)
+            data_bits = RS_BLOCK_TABLE[version, self.error_correction][0]
+            if needed_bits is not None and needed_bits <= data_bits:
+                self.version = version
+                return version
+        raise exceptions.DataOverflowError
+
+    def best_mask_pattern(self):
+        """
+        Find the mask pattern giving the most dark modules along the right and
+        bottom edges.
+        """
+        max_score = -1
+        pattern = 0
+
+        for i in range(4):
+            self.makeImpl(i)
+
+            last = self.modules_count - 1
+            right = sum(1 for row in self.modules[1:] if row[last])
+            bottom = sum(1 for dark in self.modules[last][1:] if dark)
+            score = min(right, bottom) * 16 + max(right, bottom)
+
+            if score > max_score:
+                max_score = score
+                pattern = i
+
+        return pattern
+
+    def makeImpl(self, mask_pattern):
+        if self.data_cache is None:
+            self.data_cache = create_data(
+                self.version, self.error_correction, self.data_list
+            )
+
+        self.modules_count = self.version * 2 + 9
+        self.modules = [[None] * self.modules_count for i in range(self.modules_count)]
+        for row, col in self.finder_positions():
+            self.setup_position_probe_pattern(row, col)
+        self.setup_timing_pattern()
+        self.setup_type_info(mask_pattern)
+        self.map_data(self.data_cache, mask_pattern)
+
+    def finder_positions(self):
+        return ((0, 0),)
+
+    def setup_timing_pattern(self):
+        for i in range(8, self.modules_count):
+            self.modules[0][i] = self.modules[i][0] = i % 2 == 0
+
+    def setup_type_info(self, mask_pattern):
+        data = (SYMBOL_NUMBERS[self.version, self.error_correction] << 2) | mask_pattern
+        bits = BCH_format_info(data)
+
+        for i in range(15):
+            mod = ((bits >> i) & 1) == 1
+
+            if i < 8:
+                self.modules[i + 1][8] = mod
+            else:
+                self.modules[8][15 - i] = mod
+
+    def map_data(self, data, mask_pattern):
+        # Like QRCode.map_data, but there is no vertical timing pattern to
+        # step over.
+        mask_func = util.mask_func(MASK_PATTERNS[mask_pattern])
+        bits = iter(
+            ((byte >> bit_index) & 1) == 1
+            for byte in data
+            for bit_index in range(7, -1, -1)
+        )
+
+        upwards = True
+        for col in range(self.modules_count - 1, 0, -2):
+            rows = range(self.modules_count)
+            for row in reversed(rows) if upwards else rows:
+                for c in (col, col - 1):
+                    if self.modules[row][c] is None:
+                        self.modules[row][c] = next(bits, False) != mask_func(row, c)
+            upwards = not upwards
@@ -0,0 +1,227 @@
+"""
+Array versions of the mask penalty scoring, used when NumPy is installed.
+
+All eight masks are applied and scored at once, as a stacked (8, N, N)
+boolean array.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+from qrcode.bitboard import FINDER_PATTERNS
+from qrcode.compat.numpy import load_numpy
+
+np = load_numpy()
+
+# Array versions of the bitboard templates and placements, by id (holding the
+# original so the id can't be reused).
+_template_arrays: dict = {}
+_placement_arrays: dict = {}
+
+
+def unpack_rows(rows, size):
+    """
+    Return the boolean array for bitboard rows (leftmost column in the most
+    significant bit).
+    """
+    width = (size + 7) // 8
+    packed = np.frombuffer(
+        b"".join(row.to_bytes(width, "big") for row in rows), np.uint8
+    )
+    bits = np.unpackbits(packed).reshape(-1, width * 8)
+    return bits[:, width * 8 - size :].astype(bool)
+
+
+def _runs(same):
+    """
+    Score rule 1 along the last axis, given where each module matches the
+    next.
+    """
+    length = same.shape[-1]
+    five = same[..., : length - 3].copy()
+    for offset in range(1, 4):
+        five &= same[..., offset : length - 3 + offset]
+    # Each run of length 5 or more has (length - 4) windows of 5 matching
+    # modules, and scores (length - 2).
+    starts = five[..., 0].sum(axis=-1) + (five[..., 1:] & ~five[..., :-1]).sum(
+        axis=(-2, -1)
+    )
+    return five.sum(axis=(-2, -1)) + starts * 2
+
+
+def _finder_patterns(modules):
+    """
+    Count the finder-like patterns along the last axis (rule 3).
+    """
+    size = modules.shape[-1]
+    inverse = ~modules
+    # Where the dark:light:dark:light:dark 1:1:3:1:1 core starts, and where
+    # four light modules start.
+    core = modules[..., : size - 6].copy()
+    for offset, dark in enumerate(FINDER_PATTERNS[0][1:7], 1):
+        core &= (modules if dark else inverse)[..., offset : size - 6 + offset]
+    light = inverse[..., : size - 3].copy()
+    for offset in range(1, 4):
+        light &= inverse[..., offset : size - 3 + offset]
+    # The core followed by 4 light modules, or preceded by them.
+    return (core[..., : size - 10] & light[..., 7:]).sum(axis=(-2, -1)) + (
+        light[..., : size - 10] & core[..., 4:]
+    ).sum(axis=(-2, -1))
+
+
+def _dark_lost_points(boards):
+    """
+    Score penalty rule 4 (every 5% departure from 50% dark modules).
+    """
+    percent = boards.sum(axis=(-2, -1)) / (boards.shape[-1] ** 2)
+    return (np.abs(percent * 100 - 50) / 5).astype(int) * 10
+
+
+def _block_lost_points(boards):
+    """
+    Score penalty rule 2 (2x2 blocks of the same color).
+    """
+    window = (
+        boards[..., :-1, :-1].astype(np.uint8)
+        + boards[..., :-1, 1:]
+        + boards[..., 1:, :-1]
+        + boards[..., 1:, 1:]
+    )
+    return ((window == 0) | (window == 4)).sum(axis=(-2, -1)) * 3
+
+
+def _run_lost_points(boards):
+    """
+    Score penalty rule 1 (runs of 5 or more modules of the same color).
+    """
+    columns = boards.swapaxes(-2, -1)
+    return _runs(boards[..., 1:] == boards[..., :-1]) + _runs(
+        columns[..., 1:] == columns[..., :-1]
+    )
+
+
+def _finder_lost_points(boards):
+    """
+    Score penalty rule 3 (finder-like patterns in rows and columns).
+    """
+    columns = boards.swapaxes(-2, -1)
+    return (_finder_patterns(boards) + _finder_patterns(columns)) * 40
+
+
+def lost_points(boards):
+    """
+    Score the penalty for each of a stack of (N, N) boolean arrays, the same
+    as ``util.lost_point``.
+    """
+    return (
+        _dark_lost_points(boards)
+        + _block_lost_points(boards)
+        + _run_lost_points(boards)
+        + _finder_lost_points(boards)
+    )
+
+
+def lost_point(modules):
+    """
+    Score the penalty for a list-of-lists matrix.
+    """
+    return int(lost_points(np.array(modules, dtype=bool)))
+
+
+def placement_arrays(placement):
+    """
+    Return the row and column index arrays for a placement.
+    """
+    cached = _placement_arrays.get(id(placement))
+    if cached is None or cached[0] is not placement:
+        rows = np.frombuffer(placement.rows, np.uint8).astype(np.intp)
+        cols = np.frombuffer(placement.cols, np.uint8).astype(np.intp)
+        cached = _placement_arrays[id(placement)] = (placement, rows, cols)
+    return cached[1], cached[2]
+
+
+def template_arrays(template):
+    """
+    Return the function module and mask arrays, stacked for the eight masks,
+    for a bitboard template.
+    """
+    size = template.size
+    cached = _template_arrays.get(id(template))
+    if cached is None or cached[0] is not template:
+        # Cached packed 8 modules to a byte, as they are kept for every
+        # version and error correction level once warmed up.
+        functions = np.stack([unpack_rows(rows, size) for rows in template.functions])
+        masks = np.stack([unpack_rows(rows, size) for rows in template.masks])
+        cached = _template_arrays[id(template)] = (
+            template,
+            np.packbits(functions, axis=-1),
+            np.packbits(masks, axis=-1),
+        )
+    return (
+        np.unpackbits(cached[1], axis=-1, count=size).astype(bool),
+        np.unpackbits(cached[2], axis=-1, count=size).astype(bool),
+    )
+
+
+def _mask_boards(template, placement, data):
+    """
+    Place the data and apply each of the eight masks to it.
+    """
+    functions, masks = template_arrays(template)
+    rows, cols = placement_arrays(placement)
+    bits = np.unpackbits(np.array(data, np.uint8)).astype(bool)
+    placed = np.zeros((template.size, template.size), bool)
+    placed[rows[: len(bits)], cols[: len(bits)]] = bits
+    return functions | (placed ^ masks)
+
+
+def mask_scorer(template, placement, data, fast=False):
+    """
+    Return a function scoring a mask pattern for the data, returning its
+    penalty and the symbol using it as an array. ``fast`` scores only rules 4
+    and 1.
+
+    Each call scores its own array, so masks can be scored in parallel.
+    """
+    boards = _mask_boards(template, placement, data)
+
+    def score(pattern):
+        board = boards[pattern]
+        lost_point = _dark_lost_points(board) + _run_lost_points(board)
+        if not fast:
+            lost_point += _block_lost_points(board) + _finder_lost_points(board)
+        return int(lost_point), board
+
+    return score
+
+
+def best_mask(template, placement, data, fast=False, deadline=None):
+    """
+    Return the mask pattern with the lowest penalty for the data, its penalty,
+    and the symbol using it as a list-of-lists matrix.
+
+    The cheaper rules are scored for all eight masks at once, then the finder
+    pattern rule only for masks (from the lowest partial penalty up) that can
+    still beat the best so far. ``fast`` scores only rules 4 and 1. If a
+    ``deadline`` (a ``time.perf_counter()`` value) is given, the best mask
+    found when it passes is used.
+    """
+    boards = _mask_boards(template, placement, data)
+    partial = _dark_lost_points(boards) + _run_lost_points(boards)
+    if fast:
+        pattern = int(partial.argmin())
+        return pattern, int(partial[pattern]), boards[pattern].tolist()
+    partial += _block_lost_points(boards)
+    best = None
+    for pattern in sorted(range(8), key=lambda pattern: (partial[pattern], pattern)):
+        if best is not None and (
+            (partial[pattern], pattern) > best
+            or (deadline is not None and perf_counter() >= deadline)
+        ):
+            break
+        lost_point = int(partial[pattern] + _finder_lost_points(boards[pattern]))
+        if best is None or (lost_point, pattern) < best:
+            best = (lost_point, pattern)
+    lost_point, pattern = best
+    return pattern, lost_point, boards[pattern].tolist()
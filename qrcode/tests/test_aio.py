@@ -0,0 +1,114 @@
+import asyncio
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import qrcode
+from qrcode import aio
+from qrcode.image.svg import SvgPathImage
+
+
+def svg_bytes(img):
+    stream = io.BytesIO()
+    img.save(stream)
+    return stream.getvalue()
+
+
+def test_make_async():
+    img = asyncio.run(aio.make_async("async", image_factory=SvgPathImage))
+    expected = qrcode.make("async", image_factory=SvgPathImage)
+    assert svg_bytes(img) == svg_bytes(expected)
+
+
+def test_save_async(tmp_path):
+    async def make_and_save():
+        img = await aio.make_async("async", image_factory=SvgPathImage)
+        await img.save_async(str(tmp_path / "async.svg"))
+        return img
+
+    img = asyncio.run(make_and_save())
+    assert (tmp_path / "async.svg").read_bytes() == svg_bytes(img)
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_make_many_async(asynchronous):
+    data = [f"item {i}" * (i + 1) for i in range(7)]
+
+    async def items():
+        for item in data:
+            yield item
+
+    async def collect():
+        runner = aio.Runner(max_workers=2, limit=3)
+        iterable = items() if asynchronous else data
+        images = [
+            img async for img in runner.make_many(iterable, image_factory=SvgPathImage)
+        ]
+        runner.shutdown()
+        return images
+
+    images = asyncio.run(collect())
+    assert [svg_bytes(img) for img in images] == [
+        svg_bytes(qrcode.make(item, image_factory=SvgPathImage)) for item in data
+    ]
+
+
+def test_runner_limit():
+    runner = aio.Runner(ThreadPoolExecutor(8), limit=2)
+    lock = threading.Lock()
+    running = [0]
+    most = [0]
+
+    def work():
+        with lock:
+            running[0] += 1
+            most[0] = max(most[0], running[0])
+        threading.Event().wait(0.01)
+        with lock:
+            running[0] -= 1
+
+    async def run_all():
+        await asyncio.gather(*(runner.run(work) for _ in range(8)))
+
+    asyncio.run(run_all())
+    runner.executor.shutdown()
+    assert most[0] == 2
+
+
+def test_runner_cancel():
+    runner = aio.Runner(max_workers=1, limit=1)
+    started = []
+    release = threading.Event()
+
+    async def cancel_waiting():
+        first = asyncio.ensure_future(runner.run(release.wait))
+        second = asyncio.ensure_future(runner.run(started.append, "second"))
+        await asyncio.sleep(0.01)
+        second.cancel()
+        release.set()
+        await first
+        with pytest.raises(asyncio.CancelledError):
+            await second
+
+    asyncio.run(cancel_waiting())
+    runner.shutdown()
+    assert started == []
+
+
+def test_runner_invalid_limit():
+    with pytest.raises(ValueError):
+        aio.Runner(limit=0)
+
+
+def test_configure():
+    executor = ThreadPoolExecutor(1)
+    try:
+        runner = aio.configure(executor, limit=1)
+        assert runner.executor is executor
+        img = asyncio.run(aio.make_async("configured", image_factory=SvgPathImage))
+        assert svg_bytes(img).startswith(b"<?xml")
+    finally:
+        aio.configure()
+        executor.shutdown()
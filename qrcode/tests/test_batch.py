@@ -0,0 +1,166 @@
+import csv
+import io
+import tarfile
+import warnings
+import zipfile
+
+import pytest
+
+import qrcode
+from qrcode import batch
+from qrcode.image.svg import SvgPathImage
+
+NDJSON = """{"data": "first", "name": "one"}
+
+"second"
+{"data": "third", "name": "../escape"}
+"""
+
+CSV = """name,data
+one,first
+,second
+../escape,third
+"""
+
+FILENAMES = ["one.svg", "1.svg", "_escape.svg"]
+
+
+def svg_bytes(data):
+    stream = io.BytesIO()
+    qrcode.make(data, image_factory=SvgPathImage).save(stream)
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize(("format", "text"), [("ndjson", NDJSON), ("csv", CSV)])
+def test_read_records(format, text):
+    records = list(batch.read_records(io.StringIO(text), format))
+    assert records == [
+        batch.Record(0, "one", "first"),
+        batch.Record(1, None, "second"),
+        batch.Record(2, "../escape", "third"),
+    ]
+
+
+def test_read_records_path(tmp_path):
+    path = tmp_path / "labels.jsonl"
+    path.write_text(NDJSON)
+    assert [record.data for record in batch.read_records(path)] == [
+        "first",
+        "second",
+        "third",
+    ]
+
+
+def test_read_records_invalid(tmp_path):
+    with pytest.raises(ValueError):
+        list(batch.read_records(tmp_path / "labels.txt"))
+    with pytest.raises(ValueError):
+        list(batch.read_records(io.StringIO(CSV), "xml"))
+    with pytest.raises(ValueError):
+        list(batch.read_records(io.StringIO('{"name": "one"}\n'), "ndjson"))
+
+
+def test_render_bounded():
+    consumed = []
+
+    def records():
+        for index in range(20):
+            consumed.append(index)
+            yield batch.Record(index, None, f"item {index}")
+
+    rendered = batch.render(records(), workers=2, image_factory=SvgPathImage)
+    first = next(rendered)
+    assert first.filename == "0.svg"
+    assert first.content == svg_bytes("item 0")
+    # Only a couple of images per worker are made ahead.
+    assert len(consumed) == 4
+    assert [item.record.index for item in rendered] == list(range(1, 20))
+    assert len(consumed) == 20
+
+
+@pytest.mark.parametrize("destination", ["out.zip", "out.tar", "out.tar.gz", "out"])
+def test_generate(tmp_path, destination):
+    source = tmp_path / "labels.csv"
+    source.write_text(CSV)
+    destination = tmp_path / destination
+    count = batch.generate(source, destination, image_factory=SvgPathImage)
+    assert count == 3
+
+    if destination.suffix == ".zip":
+        with zipfile.ZipFile(destination) as archive:
+            assert archive.namelist() == [*FILENAMES, "manifest.csv"]
+            files = {name: archive.read(name) for name in archive.namelist()}
+    elif destination.suffix:
+        with tarfile.open(destination) as archive:
+            assert archive.getnames() == [*FILENAMES, "manifest.csv"]
+            files = {
+                member.name: archive.extractfile(member).read()
+                for member in archive.getmembers()
+            }
+    else:
+        assert sorted(path.name for path in destination.iterdir()) == sorted(
+            [*FILENAMES, "manifest.csv"]
+        )
+        files = {path.name: path.read_bytes() for path in destination.iterdir()}
+
+    assert files["one.svg"] == svg_bytes("first")
+    assert files["1.svg"] == svg_bytes("second")
+    manifest = list(csv.reader(io.StringIO(files["manifest.csv"].decode())))
+    assert manifest == [
+        ["index", "name", "file", "version"],
+        ["0", "one", "one.svg", "1"],
+        ["1", "", "1.svg", "1"],
+        ["2", "../escape", "_escape.svg", "1"],
+    ]
+
+
+@pytest.mark.parametrize("destination", ["out.zip", "out"])
+def test_generate_duplicate_names(tmp_path, destination):
+    records = [
+        batch.Record(0, "1", "first"),
+        batch.Record(1, None, "second"),
+        batch.Record(2, "A", "third"),
+        batch.Record(3, "a", "fourth"),
+        batch.Record(4, "A-3", "fifth"),
+        batch.Record(5, None, "sixth"),
+        batch.Record(6, "5", "seventh"),
+        batch.Record(7, "05", "eighth"),
+        batch.Record(8, "C-10", "ninth"),
+        batch.Record(9, "C", "tenth"),
+        batch.Record(10, "C", "eleventh"),
+        batch.Record(11, "c", "twelfth"),
+    ]
+    destination = tmp_path / destination
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        count = batch.write(
+            batch.render(records, image_factory=SvgPathImage), destination
+        )
+    assert count == len(records)
+
+    filenames = [
+        "1.svg",
+        "1-1.svg",
+        "A.svg",
+        "a-3.svg",
+        "A-3-4.svg",
+        "5.svg",
+        "5-6.svg",
+        "05.svg",
+        "C-10.svg",
+        "C.svg",
+        "C-10-1.svg",
+        "c-11.svg",
+    ]
+    if destination.suffix == ".zip":
+        with zipfile.ZipFile(destination) as archive:
+            assert archive.namelist() == [*filenames, "manifest.csv"]
+            files = {name: archive.read(name) for name in archive.namelist()}
+    else:
+        files = {path.name: path.read_bytes() for path in destination.iterdir()}
+        assert sorted(files) == sorted([*filenames, "manifest.csv"])
+
+    for record, filename in zip(records, filenames, strict=True):
+        assert files[filename] == svg_bytes(record.data)
+    manifest = list(csv.DictReader(io.StringIO(files["manifest.csv"].decode())))
+    assert [row["file"] for row in manifest] == filenames
@@ -0,0 +1,113 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+import qrcode
+from qrcode import bitboard, main, util
+
+
+@pytest.mark.parametrize("size", [21, 25, 45])
+def test_lost_point(size):
+    rand = random.Random(size)  # noqa: S311
+    for density in (0.2, 0.5, 0.8):
+        modules = [[rand.random() < density for _ in range(size)] for _ in range(size)]
+        row = modules[rand.randrange(size)]
+        row[3:14] = [bool(dark) for dark in bitboard.FINDER_PATTERNS[0]]
+        assert bitboard.lost_point(bitboard.rows(modules), size) == util.lost_point(
+            modules
+        )
+
+
+def test_rows_round_trip():
+    modules = [[True, False, True], [False, False, True], [True, True, True]]
+    assert bitboard.rows(modules) == [0b101, 0b001, 0b111]
+    assert bitboard.to_modules(bitboard.rows(modules), 3) == modules
+
+
+@pytest.mark.parametrize("version", [1, 7, 14])
+@pytest.mark.parametrize(
+    "error_correction", [qrcode.ERROR_CORRECT_L, qrcode.ERROR_CORRECT_H]
+)
+def test_board_matches_make_impl(version, error_correction):
+    qr = qrcode.QRCode(version=version, error_correction=error_correction)
+    qr.add_data("bits" * version)
+    qr.make(fit=False)
+    template = qr.bitboard_template()
+    data_rows = bitboard.place_data(qr.data_placement(), qr.data_cache)
+    for mask_pattern in range(8):
+        qr.makeImpl(mask_pattern)
+        assert bitboard.board(template, data_rows, mask_pattern) == bitboard.rows(
+            qr.modules
+        )
+
+
+def test_best_mask_pattern():
+    qr = qrcode.QRCode(version=5)
+    qr.add_data("the lowest penalty mask")
+    qr.make(fit=False)
+    penalties = []
+    for mask_pattern in range(8):
+        qr.makeImpl(mask_pattern)
+        penalties.append(util.lost_point(qr.modules))
+    assert qr.best_mask_pattern() == penalties.index(min(penalties))
+
+
+def test_placement_shared():
+    qr = qrcode.QRCode(version=3)
+    placement = qr.data_placement()
+    assert qrcode.QRCode(version=3).data_placement() is placement
+    # Version 3 has 70 data codewords and 7 remainder bits.
+    assert len(placement.rows) == len(placement.cols) == 70 * 8 + 7
+    coordinates = set(zip(placement.rows, placement.cols, strict=True))
+    assert len(coordinates) == len(placement.rows)
+    assert placement.bits([0xFF], mask_pattern=None) == "1" * 8 + "0" * (70 * 8 - 1)
+
+
+def test_placement_threads():
+    version = 33
+    main.precomputed_placements.pop(version, None)
+    with ThreadPoolExecutor(8) as executor:
+        placements = list(
+            executor.map(
+                lambda _: qrcode.QRCode(version=version).data_placement(), range(8)
+            )
+        )
+    assert all(placement is placements[0] for placement in placements)
+
+
+@pytest.mark.parametrize("version", [2, 9, 21])
+def test_best_mask(version):
+    qr = qrcode.QRCode(version=version, error_correction=qrcode.ERROR_CORRECT_Q)
+    qr.add_data(bytes(range(version * 3)))
+    qr.make(fit=False)
+    template = qr.bitboard_template()
+    placement = qr.data_placement()
+    data_rows = bitboard.place_data(placement, qr.data_cache)
+    boards = [bitboard.board(template, data_rows, i) for i in range(8)]
+    penalties = [bitboard.lost_point(rows, template.size) for rows in boards]
+    expected = penalties.index(min(penalties))
+    assert bitboard.best_mask(template, placement, qr.data_cache) == (
+        expected,
+        penalties[expected],
+        boards[expected],
+    )
+
+
+def test_make_keeps_best_mask():
+    qr = qrcode.QRCode(version=6)
+    qr.add_data("no ninth makeImpl")
+    with mock.patch.object(
+        qr, "setup_function_patterns", wraps=qr.setup_function_patterns
+    ) as setup:
+        qr.make(fit=False)
+        # Only the (cached) template needs the function patterns, not the
+        # winning symbol.
+        calls = setup.call_count
+        qr.makeImpl(qr.best_mask_pattern())
+        assert setup.call_count == calls
+    expected = qrcode.QRCode(version=6, mask_pattern=qr.best_mask_pattern())
+    expected.add_data("no ninth makeImpl")
+    expected.make(fit=False)
+    assert qr.modules == expected.modules
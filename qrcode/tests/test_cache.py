@@ -0,0 +1,134 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import qrcode
+from qrcode import cache
+from qrcode.image.svg import SvgPathImage
+from qrcode.matrix import Matrix
+from qrcode.micro import MicroQRCode
+
+
+@pytest.fixture
+def results():
+    yield cache.enable()
+    cache.disable()
+
+
+def make_qr(data="https://example.com/product/12345", **kwargs):
+    qr = qrcode.QRCode(**kwargs)
+    qr.add_data(data)
+    qr.make()
+    return qr
+
+
+def test_disabled():
+    assert cache.active is None
+    assert cache.stats() is None
+    make_qr()
+    assert cache.active is None
+
+
+def test_hit(results):
+    first = make_qr()
+    second = make_qr()
+    assert results.stats()[:4] == (1, 1, 0, 1)
+
+    cache.disable()
+    expected = make_qr()
+    for qr in (first, second):
+        assert qr.version == expected.version
+        assert qr.modules == expected.modules
+        assert qr.data_cache == expected.data_cache
+        assert qr.mask_choice == expected.mask_choice
+
+    stream = io.BytesIO()
+    second.make_image(image_factory=SvgPathImage).save(stream)
+    expected_stream = io.BytesIO()
+    expected.make_image(image_factory=SvgPathImage).save(expected_stream)
+    assert stream.getvalue() == expected_stream.getvalue()
+
+
+def test_restored_modules_are_copies(results):
+    make_qr().modules[0][0] = None
+    assert make_qr().modules[0][0] is True
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"error_correction": qrcode.ERROR_CORRECT_H},
+        {"version": 5},
+        {"mask_pattern": 2},
+        {"mask_strategy": "fast"},
+    ],
+)
+def test_key(results, kwargs):
+    make_qr()
+    qr = make_qr(**kwargs)
+    assert results.stats().misses == 2
+    assert make_qr(**kwargs).modules == qr.modules
+    assert results.stats().hits == 1
+
+
+def test_key_data(results):
+    data = "product " + "1" * 25
+    make_qr(data)
+    make_qr(data, version=3)
+    make_qr(data[:-1])
+    # Different segments (a single byte mode one).
+    qr = qrcode.QRCode()
+    qr.add_data(data, optimize=0)
+    qr.make()
+    make_qr("12345")
+    micro = MicroQRCode()
+    micro.add_data("12345")
+    micro.make()
+    assert results.stats().misses == 6
+    assert micro.modules_count == 11
+
+
+def test_evict(results):
+    # Room for three version 1 QR Codes.
+    results.max_bytes = 3 * (21 * 21 + cache.ENTRY_OVERHEAD + 32)
+    for data in ("0", "1", "2", "0", "3"):
+        make_qr(data)
+    stats = results.stats()
+    assert stats.entries == 3
+    assert stats.evictions == 1
+    assert stats.size <= stats.max_bytes
+    # "1" was the least recently used, so was evicted.
+    make_qr("2")
+    make_qr("1")
+    assert results.stats()[:2] == (2, 5)
+
+
+def test_too_large():
+    results = cache.ResultCache(max_bytes=100)
+    results.put(("key",), cache.Result(1, Matrix(21), b"data", None))
+    assert len(results) == 0
+    with pytest.raises(ValueError):
+        cache.ResultCache(max_bytes=-1)
+
+
+def test_clear(results):
+    make_qr()
+    make_qr()
+    results.clear()
+    assert results.stats() == (0, 0, 0, 0, 0, cache.DEFAULT_MAX_BYTES)
+
+
+def test_threads(results):
+    data = [f"item {i % 5}" for i in range(40)]
+
+    def make(item):
+        return make_qr(item).modules
+
+    with ThreadPoolExecutor(4) as executor:
+        made = list(executor.map(make, data))
+    stats = results.stats()
+    assert stats.hits + stats.misses == len(data)
+    assert stats.entries == 5
+    cache.disable()
+    assert made == [make_qr(item).modules for item in data]
@@ -109,3 +109,22 @@ def test_styledpilimage_embeded_parameters(dummy_image: NamedTemporaryFile) -> N
         DeprecationWarning, match="The 'embeded_\\*' parameters are deprecated."
     ):
         StyledPilImage(embeded_image=embedded_img, **styled_kwargs)
+
+
+@pytest.mark.skipif(not PIL_AVAILABLE, reason="PIL is not installed")
+def test_styledpilimage_draw_embeded_image() -> None:
+    """
+    StyledPilImage.draw_embeded_image() is deprecated and will raise a
+    DeprecationWarning.
+
+    Removed in v9.0.
+    """
+    from qrcode.image.styledpil import StyledPilImage
+
+    qr = QRCode()
+    qr.add_data("Hello")
+    img = qr.make_image(image_factory=StyledPilImage)
+    with pytest.warns(
+        DeprecationWarning, match=r"draw_embeded_image\(\) is deprecated."
+    ):
+        img.draw_embeded_image()
@@ -0,0 +1,90 @@
+import os
+import subprocess
+import sys
+from importlib.util import find_spec
+
+import pytest
+
+# Packages only needed for particular image factories, and the ones only
+# needed once QR Codes are made, which importing qrcode shouldn't import.
+IMAGE_PACKAGES = {"PIL", "png", "lxml", "deprecation"}
+DEFERRED = IMAGE_PACKAGES | {"numpy", "multiprocessing"}
+
+HELP = (
+    "from qrcode.console_scripts import main\n"
+    "try:\n"
+    "    main(['--help'])\n"
+    "except SystemExit:\n"
+    "    pass"
+)
+
+
+def imported_packages(code):
+    """
+    Run code in a new interpreter, returning the top level packages in
+    ``sys.modules`` afterwards.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {name.split(".")[0] for name in result.stdout.splitlines()[-1].split()}
+
+
+def run_importtime(code):
+    """
+    Run code with ``-X importtime``, returning the cumulative seconds taken
+    by each top level import.
+
+    The code is run once beforehand, so that the imports are timed with
+    their bytecode cached, as they would be once installed.
+    """
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, env=env
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    imported = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            imported[name.strip()] = int(cumulative) / 1e6
+    return imported
+
+
+def test_import_qrcode():
+    assert not imported_packages("import qrcode") & DEFERRED
+
+
+def test_qr_help():
+    # Listing the drawers imports the image factories, but nothing else.
+    assert not imported_packages(HELP) & (DEFERRED - {"PIL", "png"})
+
+
+def test_qr_matrix(tmp_path):
+    # Making a QR Code's matrix doesn't need any image libraries.
+    imported = imported_packages(
+        "from qrcode.console_scripts import main\n"
+        f"main(['--format', 'matrix', '--output', {str(tmp_path / 'qr.pbm')!r}, 'x'])"
+    )
+    assert not imported & IMAGE_PACKAGES
+    assert (tmp_path / "qr.pbm").read_bytes().startswith(b"P4")
+
+
+@pytest.mark.skipif(find_spec("numpy") is None, reason="NumPy is not installed")
+def test_import_qrcode_benchmark():
+    # Importing qrcode should take less time than importing NumPy, one of the
+    # deferred packages (several times less on a typical machine). Comparing
+    # the two rather than using a fixed budget allows for slow machines.
+    imported = run_importtime("import qrcode\nimport numpy")
+    assert imported["qrcode"] < imported["numpy"]
@@ -0,0 +1,92 @@
+import sys
+
+import pytest
+
+import qrcode
+from qrcode.compat.numpy import load_numpy
+from qrcode.matrix import Matrix
+
+np = load_numpy()
+
+
+def make_qr(border=4):
+    qr = qrcode.QRCode(border=border)
+    qr.add_data("compact matrix")
+    qr.make()
+    return qr
+
+
+@pytest.mark.parametrize("border", [0, 1, 4])
+def test_to_matrix(border):
+    qr = make_qr(border)
+    matrix = qr.to_matrix()
+    assert matrix.size == qr.modules_count
+    assert matrix.border == border
+    assert len(matrix.data) == matrix.width**2
+    assert matrix.tolist() == qr.get_matrix()
+    assert matrix.tolist(border=0) == qr.modules
+
+
+def test_tolist_rows_not_shared():
+    rows = make_qr().to_matrix().tolist()
+    rows[0][0] = True
+    assert not rows[1][0]
+    assert not rows[-1][0]
+
+
+def test_get_matrix_rows_not_shared():
+    rows = make_qr().get_matrix()
+    rows[0][0] = True
+    assert not rows[1][0]
+    assert not rows[-1][0]
+
+
+def test_from_modules():
+    modules = [[True, None], [False, True]]
+    matrix = Matrix.from_modules(modules, border=1)
+    assert matrix.data == bytes([0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0])
+    assert matrix == Matrix(2, 1, bytearray(matrix.data))
+    assert matrix != Matrix.from_modules(modules)
+
+
+def test_invalid_matrix():
+    with pytest.raises(ValueError):
+        Matrix(21, border=-1)
+    with pytest.raises(ValueError):
+        Matrix(21, data=bytearray(20))
+
+
+def test_buffer():
+    matrix = make_qr().to_matrix()
+    view = matrix.buffer()
+    assert view.shape == (matrix.width, matrix.width)
+    assert view.obj is matrix.data
+    assert view[4, 4] == 1
+    assert view.tolist() == [[int(module) for module in row] for row in matrix.tolist()]
+    if sys.version_info >= (3, 12):
+        assert memoryview(matrix).shape == view.shape
+
+
+@pytest.mark.skipif(not np, reason="Requires numpy")
+@pytest.mark.parametrize("border", [0, 2, 4])
+def test_to_numpy_view(border):
+    qr = make_qr()
+    matrix = qr.to_matrix()
+    array = matrix.to_numpy(border=border)
+    assert array.dtype == bool
+    assert np.shares_memory(array, np.frombuffer(matrix.data, np.uint8))
+    assert array.tolist() == matrix.tolist(border=border)
+
+
+@pytest.mark.skipif(not np, reason="Requires numpy")
+def test_to_numpy_wider_border():
+    qr = make_qr(border=1)
+    array = qr.to_numpy(border=3)
+    assert array.shape == (qr.modules_count + 6,) * 2
+    assert array.tolist() == qr.to_matrix().tolist(border=3)
+
+
+def test_to_numpy_without_numpy(monkeypatch):
+    monkeypatch.setattr(qrcode.matrix, "load_numpy", lambda: None)
+    with pytest.raises(ImportError):
+        make_qr().to_numpy()
@@ -0,0 +1,140 @@
+import io
+
+import pytest
+
+import qrcode
+from qrcode.constants import PIL_AVAILABLE
+from qrcode.exceptions import DataOverflowError
+from qrcode.image.svg import SvgPathImage
+from qrcode.micro import MicroQRCode, create_data
+from qrcode.util import MODE_8BIT_BYTE, MODE_ALPHA_NUM, MODE_KANJI, QRData
+
+EXPECTED_M2 = [
+    "#######.#.#.#",
+    "#.....#.###.#",
+    "#.###.#..##.#",
+    "#.###.#..####",
+    "#.###.#.###..",
+    "#.....#.#...#",
+    "#######..####",
+    ".........##..",
+    "##.#....#...#",
+    ".##.#.#.#.#.#",
+    "###..#######.",
+    "...#.#....##.",
+    "###.#..##.###",
+]
+
+
+def test_micro_matrix():
+    qr = MicroQRCode()
+    qr.add_data("01234567")
+    qr.make()
+    assert qr.version == 2
+    assert qr.modules_count == 13
+    assert [
+        "".join("#" if module else "." for module in row) for row in qr.modules
+    ] == EXPECTED_M2
+
+
+@pytest.mark.parametrize(
+    ("data", "error_correction", "version"),
+    [
+        ("12345", qrcode.ERROR_CORRECT_L, 1),
+        ("12345", qrcode.ERROR_CORRECT_M, 2),
+        ("HELLO", qrcode.ERROR_CORRECT_L, 2),
+        ("hello", qrcode.ERROR_CORRECT_L, 3),
+        ("HELLO WORLD", qrcode.ERROR_CORRECT_M, 3),
+        ("1" * 35, qrcode.ERROR_CORRECT_L, 4),
+        ("1" * 21, qrcode.ERROR_CORRECT_Q, 4),
+    ],
+)
+def test_micro_best_fit(data, error_correction, version):
+    qr = MicroQRCode(error_correction=error_correction)
+    qr.add_data(data)
+    qr.make()
+    assert qr.version == version
+    assert qr.modules_count == version * 2 + 9
+    assert 0 <= qr.best_mask_pattern() <= 3
+
+
+def test_micro_data_length():
+    # M1 holds 20 data bits and 2 error correction codewords, as the final
+    # data codeword is only 4 bits long.
+    data = create_data(1, qrcode.ERROR_CORRECT_L, [QRData("12345")])
+    assert len(data) == 5
+    assert data[4] & 0x0F == 0
+    # M4-L holds 16 data codewords and 8 error correction codewords.
+    data = create_data(4, qrcode.ERROR_CORRECT_L, [QRData("12345")])
+    assert len(data) == 24
+
+
+def test_micro_kanji():
+    qr = MicroQRCode()
+    qr.add_data(QRData("点茗", mode=MODE_KANJI))
+    qr.make()
+    assert qr.version == 3
+
+
+def test_micro_mode_not_available():
+    qr = MicroQRCode(version=1)
+    qr.add_data("A", optimize=0)
+    assert qr.data_list[0].mode == MODE_ALPHA_NUM
+    with pytest.raises(ValueError):
+        qr.make(fit=False)
+    qr.make()
+    assert qr.version == 2
+
+
+def test_micro_overflow():
+    qr = MicroQRCode()
+    qr.add_data("a" * 16)
+    with pytest.raises(DataOverflowError):
+        qr.make()
+    qr = MicroQRCode(version=3)
+    qr.add_data(QRData("a" * 10, mode=MODE_8BIT_BYTE))
+    with pytest.raises(DataOverflowError):
+        qr.make(fit=False)
+
+
+def test_micro_invalid():
+    with pytest.raises(ValueError):
+        MicroQRCode(version=5)
+    with pytest.raises(ValueError):
+        MicroQRCode(error_correction=qrcode.ERROR_CORRECT_H)
+    with pytest.raises(ValueError):
+        MicroQRCode(mask_pattern=4)
+    with pytest.raises(TypeError):
+        MicroQRCode(mask_pattern="1")
+    qr = MicroQRCode(version=1, error_correction=qrcode.ERROR_CORRECT_M)
+    qr.add_data("1")
+    with pytest.raises(ValueError):
+        qr.make(fit=False)
+
+
+def test_micro_image():
+    qr = MicroQRCode(image_factory=SvgPathImage)
+    qr.add_data("12345")
+    img = qr.make_image()
+    assert isinstance(img, SvgPathImage)
+    assert img.width == 11
+    assert img.border == 2
+    img.save(io.BytesIO())
+    assert len(qr.get_matrix()) == 15
+
+
+@pytest.mark.skipif(not PIL_AVAILABLE, reason="PIL is not installed")
+def test_micro_styled_image():
+    from qrcode.image.styledpil import StyledPilImage
+    from qrcode.image.styles.moduledrawers.pil import CircleModuleDrawer
+
+    qr = MicroQRCode(version=1, image_factory=StyledPilImage)
+    qr.add_data("12345")
+    img = qr.make_image(eye_drawer=CircleModuleDrawer())
+    img.save(io.BytesIO())
+    # Only the modules of the single finder pattern are drawn as an eye.
+    eyes = {(r, c) for r in range(11) for c in range(11) if img.is_eye(r, c)}
+    assert eyes == {(r, c) for r in range(7) for c in range(7)}
+
+    img = qrcode.make("12345", image_factory=StyledPilImage)
+    assert sum(img.is_eye(r, c) for r in range(21) for c in range(21)) == 3 * 49
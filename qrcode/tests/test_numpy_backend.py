@@ -0,0 +1,88 @@
+import random
+import time
+
+import pytest
+
+import qrcode
+from qrcode import bitboard, util
+
+np = pytest.importorskip("numpy", reason="NumPy is not installed")
+
+if np:
+    from qrcode import numpy_backend
+
+
+def _random_modules(size, seed):
+    rand = random.Random(seed)  # noqa: S311
+    modules = [[rand.random() < 0.5 for _ in range(size)] for _ in range(size)]
+    modules[3][2:13] = [bool(dark) for dark in bitboard.FINDER_PATTERNS[1]]
+    return modules
+
+
+@pytest.mark.parametrize("size", [21, 45, 177])
+def test_lost_point(size, monkeypatch):
+    modules = _random_modules(size, size)
+    expected = numpy_backend.lost_point(modules)
+    monkeypatch.setattr(util, "load_numpy", lambda: None)
+    assert util.lost_point(modules) == expected
+
+
+@pytest.mark.parametrize("version", [1, 10, 40])
+def test_mask_scorer(version):
+    qr = qrcode.QRCode(version=version)
+    qr.add_data("numpy" * version)
+    qr.make(fit=False)
+    template = qr.bitboard_template()
+    data_rows = bitboard.place_data(qr.data_placement(), qr.data_cache)
+    expected = [
+        bitboard.lost_point(bitboard.board(template, data_rows, i), template.size)
+        for i in range(8)
+    ]
+    score = numpy_backend.mask_scorer(template, qr.data_placement(), qr.data_cache)
+    scored = [score(i) for i in range(8)]
+    assert [lost_point for lost_point, _ in scored] == expected
+    assert [bitboard.rows(board.tolist()) for _, board in scored] == [
+        bitboard.board(template, data_rows, i) for i in range(8)
+    ]
+
+
+@pytest.mark.parametrize("version", [1, 10, 40])
+def test_best_mask(version):
+    qr = qrcode.QRCode(version=version)
+    qr.add_data("numpy" * version)
+    qr.make(fit=False)
+    template = qr.bitboard_template()
+    placement = qr.data_placement()
+    pattern, lost_point, modules = numpy_backend.best_mask(
+        template, placement, qr.data_cache
+    )
+    assert (pattern, lost_point, bitboard.rows(modules)) == bitboard.best_mask(
+        template, placement, qr.data_cache
+    )
+
+
+def test_best_mask_pattern_without_numpy(monkeypatch):
+    qr = qrcode.QRCode(version=12)
+    qr.add_data("same mask either way")
+    qr.make(fit=False)
+    expected = qr.best_mask_pattern()
+    monkeypatch.setattr(qrcode.main, "load_numpy", lambda: None)
+    assert qr.best_mask_pattern() == expected
+
+
+def test_benchmark_version_40(monkeypatch):
+    # Scoring all eight masks of a version 40 symbol as arrays should be much
+    # faster than scoring the lists one at a time in pure Python.
+    boards = [_random_modules(177, seed) for seed in range(8)]
+
+    start = time.perf_counter()
+    numpy_backend.lost_points(np.array(boards, dtype=bool))
+    numpy_time = time.perf_counter() - start
+
+    monkeypatch.setattr(util, "load_numpy", lambda: None)
+    start = time.perf_counter()
+    for modules in boards:
+        util.lost_point(modules)
+    python_time = time.perf_counter() - start
+
+    assert numpy_time < python_time
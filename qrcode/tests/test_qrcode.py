@@ -1,4 +1,7 @@
 import io
+import os
+import sys
+import time
 from unittest import mock
 
 import pytest
@@ -7,8 +10,16 @@ import qrcode
 import qrcode.util
 from qrcode.exceptions import DataOverflowError
 from qrcode.image.base import BaseImage
+from qrcode.image.svg import SvgPathImage
+from qrcode.main import make_structured_append, structured_append
 from qrcode.tests.consts import UNICODE_TEXT
-from qrcode.util import MODE_8BIT_BYTE, MODE_ALPHA_NUM, MODE_NUMBER, QRData
+from qrcode.util import (
+    MODE_8BIT_BYTE,
+    MODE_ALPHA_NUM,
+    MODE_KANJI,
+    MODE_NUMBER,
+    QRData,
+)
 
 
 def test_basic():
@@ -69,6 +80,99 @@ def test_overflow():
         qr.make(fit=False)
 
 
+def test_overflow_fit():
+    qr = qrcode.QRCode()
+    qr.add_data("a" * 5000)
+    with pytest.raises(DataOverflowError):
+        qr.make()
+
+
+def test_estimate():
+    estimate = qrcode.estimate("a" * 100)
+    qr = qrcode.QRCode()
+    qr.add_data("a" * 100)
+    qr.make()
+    assert estimate.version == qr.version
+    assert estimate.bits == 4 + 8 + 800
+    assert (
+        estimate.capacity
+        == qrcode.util.BIT_LIMIT_TABLE[qr.error_correction][qr.version]
+    )
+    assert estimate.headroom == estimate.capacity - estimate.bits
+
+
+def test_estimate_overflow():
+    estimate = qrcode.estimate("a" * 5000)
+    assert estimate.version is None
+    assert estimate.headroom < 0
+
+
+def test_estimate_many():
+    data = ["1", "a" * 100, "a" * 5000, "A" * 4000]
+    estimates = list(
+        qrcode.estimate_many(data, error_correction=qrcode.constants.ERROR_CORRECT_L)
+    )
+    assert [estimate.version for estimate in estimates] == [1, 5, None, 39]
+    assert estimates == [
+        qrcode.estimate(item, error_correction=qrcode.constants.ERROR_CORRECT_L)
+        for item in data
+    ]
+
+
+def test_structured_append():
+    data = "".join(f"item{i:04d}=ABC{i * 7919 % 100000:05d};" for i in range(400))
+    codes = structured_append(data, error_correction=qrcode.ERROR_CORRECT_L)
+    assert 1 < len(codes) <= 16
+    assert len({qr.version for qr in codes}) == 1
+    assert b"".join(d.data for qr in codes for d in qr.data_list) == data.encode()
+    parity = 0
+    for c in data.encode():
+        parity ^= c
+    for index, qr in enumerate(codes):
+        assert qr.structured_append == (index, len(codes), parity)
+
+    # A smaller version is not possible with the same number of symbols.
+    with pytest.raises(DataOverflowError):
+        structured_append(
+            data,
+            max_symbols=len(codes),
+            version=codes[0].version - 1,
+            error_correction=qrcode.ERROR_CORRECT_L,
+        )
+
+
+def test_structured_append_single():
+    codes = structured_append("hello")
+    assert len(codes) == 1
+    assert codes[0].version == 1
+
+
+def test_structured_append_version():
+    codes = structured_append("A" * 1000, version=10)
+    assert {qr.version for qr in codes} == {10}
+    lengths = [len(qr.data_list[0]) for qr in codes]
+    assert max(lengths) - min(lengths) <= 1
+
+
+def test_structured_append_utf8():
+    data = "\u03b1" * 500
+    for qr in structured_append(data, version=5):
+        qr.data_list[0].data.decode("utf-8")
+
+
+def test_structured_append_overflow():
+    with pytest.raises(DataOverflowError):
+        structured_append("a" * 5000, max_symbols=1)
+    with pytest.raises(ValueError):
+        structured_append("a", max_symbols=17)
+
+
+def test_make_structured_append():
+    images = make_structured_append("A" * 1000, version=5, image_factory=SvgPathImage)
+    assert len(images) > 1
+    assert all(isinstance(im, SvgPathImage) for im in images)
+
+
 def test_add_qrdata():
     qr = qrcode.QRCode(version=1)
     data = QRData("a")
@@ -124,6 +228,71 @@ def test_mode_8bit_newline():
     assert qr.data_list[0].mode == MODE_8BIT_BYTE
 
 
+def test_mode_kanji():
+    qr = qrcode.QRCode()
+    qr.add_data(QRData("点茗" * 3, mode=MODE_KANJI))
+    qr.make()
+    assert qr.version == 1
+    assert len(qr.data_list[0]) == 6
+
+
+def test_mode_kanji_invalid():
+    with pytest.raises(ValueError):
+        QRData(b"abcd", mode=MODE_KANJI)
+    with pytest.raises(ValueError):
+        QRData("点茗"[:1].encode("shift_jis")[:1], mode=MODE_KANJI)
+
+
+def test_add_data_kanji():
+    text = "ＱＲコードは漢字モード対応です"
+    qr = qrcode.QRCode()
+    qr.add_data(text)
+    assert qr.version == 4
+
+    qr = qrcode.QRCode()
+    qr.add_data(text, kanji=True)
+    assert [d.mode for d in qr.data_list] == [MODE_KANJI]
+    assert qr.data_list[0].data == text.encode("shift_jis")
+    assert qr.version == 2
+
+    qr = qrcode.QRCode()
+    qr.add_data(text, optimize=0, kanji=True)
+    assert [d.mode for d in qr.data_list] == [MODE_KANJI]
+
+
+def test_add_data_kanji_mixed():
+    text = "漢字モード ABC1234567890"
+    qr = qrcode.QRCode()
+    qr.add_data(text, optimize=4, kanji=True)
+    assert [d.mode for d in qr.data_list] == [
+        MODE_KANJI,
+        MODE_ALPHA_NUM,
+        MODE_NUMBER,
+    ]
+    qr.make()
+
+    qr = qrcode.QRCode()
+    qr.add_data(text, optimize="minimal", kanji=True)
+    assert [d.mode for d in qr.data_list] == [
+        MODE_KANJI,
+        MODE_ALPHA_NUM,
+        MODE_NUMBER,
+    ]
+    qr.make()
+
+
+def test_add_data_kanji_boundaries():
+    # 0xF041 is a (user-defined) double-byte character which can't use Kanji
+    # mode. Its second byte is "A", which must not be split off into an
+    # alphanumeric chunk.
+    data = b"\xf0ABCDEFGHIJ"
+    for optimize in (1, "minimal"):
+        qr = qrcode.QRCode()
+        qr.add_data(data, optimize=optimize, kanji=True)
+        assert b"".join(d.data for d in qr.data_list) == data
+        assert qr.data_list[0].data.startswith(b"\xf0A")
+
+
 def test_make_image_with_wrong_pattern():
     with pytest.raises(TypeError):
         qrcode.QRCode(mask_pattern="string pattern")
@@ -149,6 +318,221 @@ def test_best_mask_pattern_includes_format_info():
     assert qr.best_mask_pattern() == 6
 
 
+def test_mask_choice():
+    qr = qrcode.QRCode(version=8)
+    qr.add_data("audit the mask")
+    qr.make(fit=False)
+    assert qr.mask_choice.strategy == "exhaustive"
+    assert qr.mask_choice.lost_point == qrcode.util.lost_point(qr.modules)
+    penalties = []
+    for mask_pattern in range(8):
+        other = qrcode.QRCode(version=8, mask_pattern=mask_pattern)
+        other.add_data("audit the mask")
+        other.make(fit=False)
+        assert other.mask_choice is None
+        penalties.append(qrcode.util.lost_point(other.modules))
+    assert qr.mask_choice.mask_pattern == penalties.index(min(penalties))
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_mask_strategy_fast(numpy, monkeypatch):
+    if not numpy:
+        monkeypatch.setattr(qrcode.main, "load_numpy", lambda: None)
+    qr = qrcode.QRCode(version=12, mask_strategy="fast")
+    qr.add_data("fast" * 50)
+    qr.make(fit=False)
+    assert qr.mask_choice.strategy == "fast"
+    rows = qrcode.bitboard.rows(qr.modules)
+    assert qr.mask_choice.lost_point == qrcode.bitboard.dark_penalty(
+        rows, qr.modules_count
+    ) + qrcode.bitboard.run_penalty(rows, qr.modules_count)
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_mask_strategy_deadline(numpy, monkeypatch):
+    if not numpy:
+        monkeypatch.setattr(qrcode.main, "load_numpy", lambda: None)
+    exhaustive = qrcode.QRCode(version=20)
+    exhaustive.add_data("deadline" * 20)
+    exhaustive.make(fit=False)
+
+    qr = qrcode.QRCode(version=20, mask_strategy="deadline=0")
+    qr.add_data("deadline" * 20)
+    qr.make(fit=False)
+    # The first mask scored is always finished.
+    assert qr.mask_choice.lost_point == qrcode.util.lost_point(qr.modules)
+
+    qr = qrcode.QRCode(version=20, mask_strategy="deadline=60000")
+    qr.add_data("deadline" * 20)
+    qr.make(fit=False)
+    assert qr.mask_choice == exhaustive.mask_choice._replace(strategy="deadline=60000")
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+@pytest.mark.parametrize("mask_strategy", ["exhaustive", "fast", "deadline=60000"])
+def test_parallel_masks(mask_strategy, numpy, monkeypatch):
+    if not numpy:
+        monkeypatch.setattr(qrcode.main, "load_numpy", lambda: None)
+    codes = []
+    for parallel_masks in (False, True):
+        qr = qrcode.QRCode(
+            version=15, mask_strategy=mask_strategy, parallel_masks=parallel_masks
+        )
+        qr.add_data("parallel" * 30)
+        qr.make(fit=False)
+        codes.append(qr)
+    assert codes[1].mask_choice == codes[0].mask_choice
+    assert codes[1].modules == codes[0].modules
+
+
+def test_parallel_masks_deadline():
+    qr = qrcode.QRCode(version=30, mask_strategy="deadline=0", parallel_masks=True)
+    qr.add_data("parallel")
+    qr.make(fit=False)
+    assert qr.mask_choice.lost_point == qrcode.util.lost_point(qr.modules)
+
+
+def _make_parallel_masks():
+    qr = qrcode.QRCode(version=5, parallel_masks=True)
+    qr.add_data("forked")
+    qr.make(fit=False)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires fork")
+def test_parallel_masks_after_fork():
+    import multiprocessing
+
+    # Start the shared mask pool before forking.
+    _make_parallel_masks()
+    process = multiprocessing.get_context("fork").Process(target=_make_parallel_masks)
+    process.start()
+    process.join(30)
+    if process.is_alive():
+        process.kill()
+        pytest.fail("Making a QR Code with parallel_masks hung after a fork")
+    assert process.exitcode == 0
+
+
+@pytest.mark.skipif(
+    getattr(sys, "_is_gil_enabled", lambda: True)() or (os.cpu_count() or 1) < 2,
+    reason="Needs a free-threaded Python build and more than one CPU",
+)
+def test_parallel_masks_benchmark(monkeypatch):
+    # Scoring the masks of a single version 40 code in parallel should be
+    # faster than scoring them one by one.
+    monkeypatch.setattr(qrcode.main, "load_numpy", lambda: None)
+    timings = []
+    for parallel_masks in (False, True):
+        qr = qrcode.QRCode(version=40, parallel_masks=parallel_masks)
+        qr.add_data("benchmark" * 100)
+        qr.make(fit=False)
+        start = time.perf_counter()
+        for _ in range(5):
+            qr.best_mask_pattern()
+        timings.append(time.perf_counter() - start)
+    assert timings[1] < timings[0]
+
+
+def test_make_many():
+    data = ["short", "a" * 900, "", "b" * 300, "1234567890" * 20]
+    matrices = qrcode.make_many(data, workers=2, chunksize=2, box_size=2)
+    for item, matrix in zip(data, matrices, strict=True):
+        qr = qrcode.QRCode(box_size=2)
+        qr.add_data(item)
+        assert matrix == qr.to_matrix()
+
+
+def test_make_many_bytes():
+    images = qrcode.make_many(
+        ["first", "second"], workers=1, output="bytes", image_factory=SvgPathImage
+    )
+    assert len(images) == 2
+    assert images[0].startswith(b"<?xml")
+    assert images[0] != images[1]
+
+
+def test_make_many_bytes_parallel_masks():
+    data = ["a" * 50, "b" * 300, "c"]
+    images = qrcode.make_many(
+        data,
+        workers=2,
+        output="bytes",
+        parallel_masks=True,
+        image_factory=SvgPathImage,
+    )
+    for item, image in zip(data, images, strict=True):
+        stream = io.BytesIO()
+        qrcode.make(item, image_factory=SvgPathImage).save(stream)
+        assert image == stream.getvalue()
+
+
+def test_make_many_path(tmp_path):
+    path = str(tmp_path / "{index}.svg")
+    paths = qrcode.make_many(
+        ["first", "second"],
+        workers=1,
+        output="path",
+        path=path,
+        image_factory=SvgPathImage,
+    )
+    assert paths == [str(tmp_path / "0.svg"), str(tmp_path / "1.svg")]
+    assert (tmp_path / "1.svg").read_bytes().startswith(b"<?xml")
+
+
+def test_make_many_empty():
+    assert qrcode.make_many([]) == []
+
+
+def test_make_many_invalid():
+    with pytest.raises(ValueError):
+        qrcode.make_many(["data"], output="image")
+    with pytest.raises(ValueError):
+        qrcode.make_many(["data"], output="path")
+
+
+def test_make_many_overflow():
+    with pytest.raises(DataOverflowError):
+        qrcode.make_many(["fits", "x" * 3000], workers=1)
+
+
+def test_warmup():
+    version, level = 12, qrcode.ERROR_CORRECT_Q
+    for mask_pattern in range(8):
+        qrcode.main.precomputed_qr_templates.pop((version, level, mask_pattern), None)
+    qrcode.main.precomputed_bitboards.pop((version, level), None)
+    qrcode.main.precomputed_placements.pop(version, None)
+    qrcode.warmup(versions=[version], levels=[level])
+    for mask_pattern in range(8):
+        assert (version, level, mask_pattern) in qrcode.main.precomputed_qr_templates
+    assert (version, level) in qrcode.main.precomputed_bitboards
+    assert version in qrcode.main.precomputed_placements
+
+
+def test_function_patterns():
+    qr = qrcode.QRCode(version=8, error_correction=qrcode.ERROR_CORRECT_H)
+    qr.setup_function_patterns(5)
+    expected = [[None] * qr.modules_count for _ in range(qr.modules_count)]
+    qr.modules = expected
+    qr.setup_position_probe_pattern(0, 0)
+    qr.setup_position_probe_pattern(qr.modules_count - 7, 0)
+    qr.setup_position_probe_pattern(0, qr.modules_count - 7)
+    qr.setup_position_adjust_pattern()
+    qr.setup_timing_pattern()
+    qr.setup_type_info(5)
+    qr.setup_type_number()
+    qr.setup_function_patterns(5)
+    assert qr.modules == expected
+    # Each QR Code gets its own copy of the shared template.
+    qr.modules[9][9] = True
+    assert qr._function_patterns(5)[9][9] is None
+
+
+@pytest.mark.parametrize("mask_strategy", ["best", "deadline=", "deadline=-1", None])
+def test_mask_strategy_invalid(mask_strategy):
+    with pytest.raises(ValueError):
+        qrcode.QRCode(mask_strategy=mask_strategy)
+
+
 def test_mask_pattern_setter():
     qr = qrcode.QRCode()
 
@@ -234,6 +618,42 @@ def test_optimize_size():
     assert qr.version == 11
 
 
+def test_optimize_minimal():
+    qr = qrcode.QRCode()
+    qr.add_data("http://example.com/ABCDEFG12345678901234", optimize="minimal")
+    assert [(d.mode, d.data) for d in qr.data_list] == [
+        (MODE_8BIT_BYTE, b"http://example.com"),
+        (MODE_ALPHA_NUM, b"/ABCDEFG"),
+        (MODE_NUMBER, b"12345678901234"),
+    ]
+    qr.make()
+    assert qr.version == 3
+
+
+def test_optimize_minimal_size():
+    text = "A1abc12345123451234512345def1HELLOHELLOHELLOHELLOa" * 5
+    qr = qrcode.QRCode()
+    qr.add_data(text, optimize="minimal")
+    qr.make()
+    assert qr.version == 10
+
+    text = "https://example.com/item?id=1234567890123&ref=AB12CD34"
+    qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_L)
+    qr.add_data(text)
+    assert qr.version == 4
+    qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_L)
+    qr.add_data(text, optimize="minimal")
+    assert qr.version == 3
+
+
+def test_optimize_minimal_large_version():
+    qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_H)
+    qr.add_data("HELLO/" * 200, optimize="minimal")
+    qr.make()
+    assert qr.version > 26
+    assert [d.mode for d in qr.data_list] == [MODE_ALPHA_NUM]
+
+
 def test_qrdata_repr():
     data = b"hello"
     data_obj = qrcode.util.QRData(data)
@@ -1,9 +1,12 @@
+import io
 import sys
 from unittest import mock
 
 import pytest
 
-from qrcode.console_scripts import commas, main
+import qrcode
+from qrcode.console_scripts import commas, main, read_payloads
+from qrcode.image.svg import SvgImage, SvgPathImage
 
 
 def bad_read():
@@ -100,3 +103,169 @@ def test_commas():
     assert commas("AB") == "A or B"
     assert commas("ABC") == "A, B or C"
     assert commas("ABC", joiner="and") == "A, B and C"
+
+
+def test_format_matrix(tmp_path):
+    main(["testtext", "--format", "matrix", "--output", str(tmp_path / "test.pbm")])
+    qr = qrcode.QRCode()
+    qr.add_data("testtext")
+    assert (tmp_path / "test.pbm").read_bytes() == qr.to_matrix().to_pbm()
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_batch_output_dir(tmp_path, jobs):
+    source = tmp_path / "data.txt"
+    source.write_bytes(b"first\r\nsecond\n\nthird")
+    main(
+        [
+            "--batch",
+            str(source),
+            "--factory",
+            "svg-path",
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--filename",
+            "code-{index:02d}.{ext}",
+            "-j",
+            jobs,
+        ]
+    )
+    assert sorted(path.name for path in (tmp_path / "out").iterdir()) == [
+        "code-00.svg",
+        "code-01.svg",
+        "code-02.svg",
+    ]
+    stream = io.BytesIO()
+    qrcode.make("third", image_factory=SvgPathImage).save(stream)
+    assert (tmp_path / "out" / "code-02.svg").read_bytes() == stream.getvalue()
+
+
+def test_batch_output_dir_blank_lines(tmp_path):
+    # Blank lines are skipped, so {index} counts only the non-empty items.
+    source = tmp_path / "data.txt"
+    source.write_bytes(b"\nfirst\n\n\nsecond\n")
+    out = tmp_path / "out"
+    main(["--batch", str(source), "--format", "matrix", "--output-dir", str(out)])
+    assert sorted(path.name for path in out.iterdir()) == ["0.pbm", "1.pbm"]
+    for index, data in enumerate(("first", "second")):
+        qr = qrcode.QRCode()
+        qr.add_data(data)
+        assert (out / f"{index}.pbm").read_bytes() == qr.to_matrix().to_pbm()
+
+
+def test_batch_matrix_stdout(capsysbinary):
+    with mock.patch("sys.stdin") as mock_stdin:
+        mock_stdin.buffer = io.BytesIO(b"first\0second\nline\0")
+        main(["--batch", "-", "-0", "--format", "matrix"])
+    expected = []
+    for data in ("first", "second\nline"):
+        qr = qrcode.QRCode()
+        qr.add_data(data)
+        expected.append(qr.to_matrix().to_pbm())
+    assert capsysbinary.readouterr().out == b"".join(expected)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--batch", "-"],
+        ["--batch", "-", "--format", "matrix", "testtext"],
+        ["--batch", "-", "--format", "matrix", "--output", "out.pbm"],
+        ["--batch", "-", "--format", "matrix", "--jobs", "-1"],
+        ["--batch", "-", "--output-dir", "out", "--factory-drawer", "circle"],
+    ],
+)
+def test_batch_invalid(args):
+    with pytest.raises(SystemExit):
+        main(args)
+
+
+def test_read_payloads():
+    stream = io.BytesIO(b"one\r\ntwo\n\n" + b"x" * 70000 + b"\nlast\r")
+    assert list(read_payloads(stream)) == [b"one", b"two", b"x" * 70000, b"last"]
+    stream = io.BytesIO(b"one\ntwo\0\0three\0")
+    assert list(read_payloads(stream, b"\0")) == [b"one\ntwo", b"three"]
+
+
+def read_responses(output):
+    responses = []
+    while output:
+        length = int.from_bytes(output[:4], "big")
+        responses.append(output[4 : 4 + length])
+        output = output[4 + length :]
+    return responses
+
+
+def test_worker_json(capsysbinary):
+    requests = [
+        b'"first"\n',
+        b"\n",
+        b'{"data": "second", "format": "matrix", "border": 1}\n',
+        b'{"data": "third", "factory": "svg-path", "error_correction": "H"}\n',
+        b'{"data": "fourth", "colour": "red"}\n',
+        b"not json\n",
+        b'{"data": "' + b"x" * 5000 + b'"}\n',
+    ]
+    with mock.patch("sys.stdin") as mock_stdin:
+        mock_stdin.buffer = io.BytesIO(b"".join(requests))
+        main(["--worker", "--factory", "svg"])
+    output, errors = capsysbinary.readouterr()
+    responses = read_responses(output)
+    assert len(responses) == 6
+
+    stream = io.BytesIO()
+    qrcode.make("first", image_factory=SvgImage).save(stream)
+    assert responses[0] == stream.getvalue()
+    qr = qrcode.QRCode(border=1)
+    qr.add_data("second")
+    assert responses[1] == qr.to_matrix().to_pbm()
+    stream = io.BytesIO()
+    qrcode.make(
+        "third",
+        image_factory=SvgPathImage,
+        error_correction=qrcode.ERROR_CORRECT_H,
+    ).save(stream)
+    assert responses[2] == stream.getvalue()
+    assert responses[3:] == [b"", b"", b""]
+    assert b"Unknown request keys: colour" in errors
+    assert b"DataOverflowError" in errors
+    assert errors.count(b"qr: error:") == 3
+
+
+def test_worker_length(capsysbinary):
+    requests = b"".join(
+        len(data).to_bytes(4, "big") + data for data in (b"first", b"\x00\xff")
+    )
+    with mock.patch("sys.stdin") as mock_stdin:
+        mock_stdin.buffer = io.BytesIO(requests)
+        main(["--worker", "--protocol", "length", "--format", "matrix"])
+    responses = read_responses(capsysbinary.readouterr().out)
+    expected = []
+    for data in (b"first", b"\x00\xff"):
+        qr = qrcode.QRCode()
+        qr.add_data(data)
+        expected.append(qr.to_matrix().to_pbm())
+    assert responses == expected
+
+
+@pytest.mark.parametrize(
+    ("requests", "message"),
+    [
+        (b"\x00\x00\x00\x09short", "Incomplete request data"),
+        (b"\x00\x00\x00\x05first\x00\x00", "Incomplete request length"),
+    ],
+)
+def test_worker_length_incomplete(capsysbinary, requests, message):
+    with mock.patch("sys.stdin") as mock_stdin:
+        mock_stdin.buffer = io.BytesIO(requests)
+        with pytest.raises(SystemExit) as excinfo:
+            main(["--worker", "--protocol", "length", "--format", "matrix"])
+    assert excinfo.value.code == f"qr: error: {message}"
+    # The complete requests before it are still answered.
+    responses = read_responses(capsysbinary.readouterr().out)
+    assert len(responses) == requests.count(b"first")
+
+
+def test_worker_invalid():
+    with pytest.raises(SystemExit):
+        main(["--worker", "testtext"])
@@ -1,18 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 import qrcode
-from qrcode import util
+from qrcode import main, util
 
 
-def test_best_fit_passes_copy_to_bisect():
+def test_best_fit_bisects_immutable_table():
     """
-    Verify that best_fit passes a copy of BIT_LIMIT_TABLE to bisect_left
-    to ensure thread safety in Python 3.13+.
+    Verify that best_fit bisects the shared BIT_LIMIT_TABLE row directly,
+    which is safe across threads because it is an immutable tuple.
     """
     qr = qrcode.QRCode()
     qr.add_data("test data")
 
-    # Identify the global table being used
     original_table = util.BIT_LIMIT_TABLE[qr.error_correction]
+    assert isinstance(original_table, tuple)
 
     with mock.patch("qrcode.main.bisect_left") as mock_bisect:
         # Mock return value to be a valid version number to avoid side effects
@@ -21,15 +22,23 @@ def test_best_fit_passes_copy_to_bisect():
         qr.best_fit()
 
         assert mock_bisect.called
-
-        # Check arguments: bisect_left(a, x, lo=0, hi=len(a), *, key=None)
-        # We are interested in 'a' (the list)
         args, _ = mock_bisect.call_args
-        passed_table = args[0]
+        assert args[0] is original_table
+
+
+def test_function_patterns_built_once():
+    """
+    Verify that concurrent QR Codes share one function pattern template
+    (with the format information) rather than racing to build their own.
+    """
+    key = (27, qrcode.ERROR_CORRECT_L, 3)
+    main.precomputed_qr_templates.pop(key, None)
 
-        # Verify content matches
-        assert passed_table == original_table
+    def function_patterns(_):
+        qr = qrcode.QRCode(version=27, error_correction=qrcode.ERROR_CORRECT_L)
+        return qr._function_patterns(3)
 
-        # Verify it is a NEW object (copy), not the original global list
-        # This confirms the thread-safety fix
-        assert passed_table is not original_table
+    with ThreadPoolExecutor(8) as executor:
+        templates = list(executor.map(function_patterns, range(8)))
+    assert all(template is templates[0] for template in templates)
+    assert main.precomputed_qr_templates[key] is templates[0]
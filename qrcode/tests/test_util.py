@@ -1,6 +1,13 @@
+import random
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
-from qrcode import util
+from qrcode import LUT, base, constants, generate_lut, spec, util
+from qrcode.constants import ERROR_CORRECT_Q
 
 
 def test_check_wrong_version():
@@ -9,3 +16,199 @@ def test_check_wrong_version():
 
     with pytest.raises(ValueError):
         util.check_version(41)
+
+
+def _rs_encode_polynomial(data, ec_count):
+    generator = base.Polynomial([1], 0)
+    for i in range(ec_count):
+        generator = generator * base.Polynomial([1, base.gexp(i)], 0)
+    remainder = base.Polynomial(data, ec_count) % generator
+    return ([0] * ec_count + list(remainder))[-ec_count:]
+
+
+@pytest.mark.parametrize("ec_count", [2, 5, 6, 8, 14, *sorted(LUT.rsPoly_LUT)])
+def test_rs_encode_matches_polynomial(ec_count):
+    rng = random.Random(ec_count)  # noqa: S311
+    for data in (
+        [rng.randrange(256) for _ in range(40)],
+        [0] * 10 + [rng.randrange(256) for _ in range(10)],
+        [1] + [0] * 30,
+    ):
+        assert base.rs_encode(data, ec_count) == _rs_encode_polynomial(data, ec_count)
+
+
+def test_rs_generator_log_lut():
+    for ec_count, num in LUT.rsPoly_LUT.items():
+        assert [base.gexp(n) for n in base.rs_generator_log(ec_count)] == num
+
+
+def test_lut_up_to_date():
+    # LUT.py is generated, and should match what generate_lut makes now.
+    assert generate_lut.render() == Path(LUT.__file__).read_text()
+
+
+def test_generate_lut_script(tmp_path):
+    # The generator only needs spec.py, so it can rebuild a broken LUT.py.
+    for module in (generate_lut, spec):
+        shutil.copy(module.__file__, tmp_path)
+    (tmp_path / "qrcode").mkdir()
+    (tmp_path / "qrcode" / "__init__.py").write_text("raise ImportError\n")
+    subprocess.run(
+        [sys.executable, "generate_lut.py", "LUT.py"], cwd=tmp_path, check=True
+    )
+    assert (tmp_path / "LUT.py").read_text() == Path(LUT.__file__).read_text()
+
+
+def test_spec_rs_block_offset():
+    assert spec.RS_BLOCK_OFFSET == {
+        constants.ERROR_CORRECT_L: 0,
+        constants.ERROR_CORRECT_M: 1,
+        constants.ERROR_CORRECT_Q: 2,
+        constants.ERROR_CORRECT_H: 3,
+    }
+
+
+def test_bch():
+    assert util.BCH_type_info(0b00101) == 0b100000011001110
+    assert util.BCH_type_number(7) == 0b000111110010010100
+    assert base.rs_blocks(5, ERROR_CORRECT_Q) == (
+        base.RSBlock(33, 15),
+        base.RSBlock(33, 15),
+        base.RSBlock(34, 16),
+        base.RSBlock(34, 16),
+    )
+
+
+def test_bit_buffer_put():
+    rng = random.Random(0)  # noqa: S311
+    buffer = util.BitBuffer()
+    bits = []
+    for _ in range(200):
+        length = rng.randrange(0, 20)
+        num = rng.getrandbits(length + 3)
+        buffer.put(num, length)
+        bits.extend((num >> (length - i - 1)) & 1 == 1 for i in range(length))
+    assert len(buffer) == len(bits)
+    assert [buffer.get(i) for i in range(len(bits))] == bits
+    assert len(buffer.buffer) == (len(bits) + 7) // 8
+
+
+@pytest.mark.parametrize("offset", range(8))
+def test_bit_buffer_put_bytes(offset):
+    buffer = util.BitBuffer()
+    buffer.put(0b1010101, offset)
+    buffer.put_bytes(b"\x12\xab\xff")
+    expected = util.BitBuffer()
+    expected.put(0b1010101, offset)
+    for c in b"\x12\xab\xff":
+        for i in range(8):
+            expected.put_bit((c >> (7 - i)) & 1)
+    assert buffer.buffer == expected.buffer
+    assert len(buffer) == len(expected) == offset + 24
+
+
+def _bit_length(chunks, version):
+    buffer = util.BitBuffer()
+    for chunk in chunks:
+        buffer.put(chunk.mode, 4)
+        buffer.put(len(chunk), util.length_in_bits(chunk.mode, version))
+        chunk.write(buffer)
+    return len(buffer)
+
+
+@pytest.mark.parametrize("version", [1, 10, 27])
+def test_minimal_data_chunks(version):
+    rng = random.Random(version)  # noqa: S311
+    for _ in range(200):
+        data = bytes(rng.choice(b"0123456789AB:/ab\xe3") for _ in range(40))
+        chunks = util.minimal_data_chunks(data, version)
+        assert b"".join(chunk.data for chunk in chunks) == data
+        for chunk in chunks:
+            assert chunk.mode >= util.optimal_mode(chunk.data)
+        minimal = _bit_length(chunks, version)
+        assert minimal <= _bit_length([util.QRData(data)], version)
+        for minimum in (1, 2, 4, 8):
+            chunks = util.optimal_data_chunks(data, minimum=minimum)
+            assert minimal <= _bit_length(chunks, version)
+
+
+def test_minimal_data_chunks_empty():
+    assert util.minimal_data_chunks(b"") == []
+
+
+def test_qrdata_kanji_write():
+    # Example from ISO/IEC 18004 section 7.4.6.
+    buffer = util.BitBuffer()
+    util.QRData("点茗", mode=util.MODE_KANJI).write(buffer)
+    assert len(buffer) == 26
+    assert int.from_bytes(buffer.buffer, "big") >> 6 == (0xD9F << 13) | 0x1AAA
+
+
+def test_structured_append_write():
+    buffer = util.BitBuffer()
+    util.StructuredAppend(index=2, total=4, parity=0xA5).write(buffer)
+    assert len(buffer) == 20
+    assert buffer.buffer == bytearray([0x32, 0x3A, 0x50])
+
+
+@pytest.mark.parametrize(
+    ("mode", "data"),
+    [
+        (util.MODE_NUMBER, b"0123456789"),
+        (util.MODE_NUMBER, b"01234567"),
+        (util.MODE_ALPHA_NUM, b"AC-42"),
+        (util.MODE_8BIT_BYTE, b"hello"),
+        (util.MODE_KANJI, "点茗".encode("shift_jis")),
+    ],
+)
+def test_data_bit_length(mode, data):
+    qr_data = util.QRData(data, mode=mode)
+    buffer = util.BitBuffer()
+    qr_data.write(buffer)
+    assert util.data_bit_length(mode, len(qr_data)) == len(buffer)
+
+
+def test_bit_length():
+    data_list = list(util.optimal_data_chunks(b"ABC123456789abc", minimum=3))
+    for version in (1, 10, 27):
+        buffer = util.BitBuffer()
+        mode_sizes = util.mode_sizes_for_version(version)
+        for data in data_list:
+            buffer.put(data.mode, 4)
+            buffer.put(len(data), mode_sizes[data.mode])
+            data.write(buffer)
+        assert util.bit_length(data_list, version) == len(buffer)
+
+
+def _write_per_character(qr_data):
+    buffer = util.BitBuffer()
+    data = qr_data.data
+    if qr_data.mode == util.MODE_NUMBER:
+        for i in range(0, len(data), 3):
+            chars = data[i : i + 3]
+            buffer.put(int(chars), util.NUMBER_LENGTH[len(chars)])
+    else:
+        for i in range(0, len(data), 2):
+            chars = data[i : i + 2]
+            if len(chars) > 1:
+                value = util.ALPHA_NUM.find(chars[:1]) * 45
+                buffer.put(value + util.ALPHA_NUM.find(chars[1:]), 11)
+            else:
+                buffer.put(util.ALPHA_NUM.find(chars), 6)
+    return buffer
+
+
+@pytest.mark.parametrize("length", [1, 2, 3, 4, 5, 6, 7, 100, 1001])
+@pytest.mark.parametrize(
+    ("mode", "alphabet"),
+    [(util.MODE_NUMBER, b"0123456789"), (util.MODE_ALPHA_NUM, util.ALPHA_NUM)],
+)
+def test_qrdata_write(mode, alphabet, length):
+    rand = random.Random(length)  # noqa: S311
+    data = bytes(rand.choice(alphabet) for _ in range(length))
+    qr_data = util.QRData(data, mode=mode)
+    expected = _write_per_character(qr_data)
+    buffer = util.BitBuffer()
+    qr_data.write(buffer)
+    assert len(buffer) == len(expected)
+    assert buffer.buffer == expected.buffer
@@ -0,0 +1,198 @@
+import asyncio
+import io
+import threading
+import time
+from unittest import mock
+from wsgiref.util import setup_testing_defaults
+
+import pytest
+
+import qrcode
+from qrcode.image.svg import SvgPathImage
+from qrcode.web import App
+
+
+@pytest.fixture
+def app():
+    app = App()
+    yield app
+    app.close()
+
+
+def get(app, query="", path="/qr", method="GET", headers=None):
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+        **(headers or {}),
+    }
+    setup_testing_defaults(environ)
+    response = {}
+
+    def start_response(status, headers):
+        response["status"] = status
+        response["headers"] = dict(headers)
+
+    body = b"".join(app(environ, start_response))
+    return response["status"], response["headers"], body
+
+
+def svg_bytes(data, **kwargs):
+    stream = io.BytesIO()
+    qrcode.make(data, image_factory=SvgPathImage, **kwargs).save(stream)
+    return stream.getvalue()
+
+
+def test_svg(app):
+    status, headers, body = get(app, "data=hello&format=svg&ec=h")
+    assert status == "200 OK"
+    assert headers["Content-Type"] == "image/svg+xml"
+    assert headers["Content-Length"] == str(len(body))
+    assert headers["Cache-Control"] == "public, max-age=86400"
+    assert body == svg_bytes("hello", error_correction=qrcode.ERROR_CORRECT_H)
+
+
+def test_png(app):
+    status, headers, body = get(app, "data=hello")
+    assert status == "200 OK"
+    assert headers["Content-Type"] == "image/png"
+    assert body.startswith(b"\x89PNG")
+
+
+def test_etag(app):
+    _, headers, _ = get(app, "data=hello&format=svg")
+    etag = headers["ETag"]
+    assert etag.startswith('"')
+    assert etag != get(app, "data=hello")[1]["ETag"]
+    assert etag != get(app, "data=hullo&format=svg")[1]["ETag"]
+    # The same QR Code gets the same ETag, whether or not it was cached.
+    other = App()
+    assert etag == get(other, "data=hello&format=svg")[1]["ETag"]
+    other.close()
+
+    status, headers, body = get(
+        app, "data=hello&format=svg", headers={"HTTP_IF_NONE_MATCH": f'"x", {etag}'}
+    )
+    assert status == "304 Not Modified"
+    assert headers["ETag"] == etag
+    assert body == b""
+
+
+def test_head(app):
+    status, headers, body = get(app, "data=hello&format=svg", method="HEAD")
+    assert status == "200 OK"
+    assert int(headers["Content-Length"]) > 0
+    assert body == b""
+
+
+@pytest.mark.parametrize(
+    ("path", "method", "query", "status"),
+    [
+        ("/other", "GET", "data=hello", "404 Not Found"),
+        ("/qr", "POST", "data=hello", "405 Method Not Allowed"),
+        ("/qr", "GET", "", "400 Bad Request"),
+        ("/qr", "GET", "data=hello&ec=X", "400 Bad Request"),
+        ("/qr", "GET", "data=hello&format=gif", "400 Bad Request"),
+        ("/qr", "GET", "data=" + "x" * 3000, "400 Bad Request"),
+    ],
+)
+def test_errors(app, path, method, query, status):
+    assert get(app, query, path=path, method=method)[0] == status
+
+
+def test_data_overflow():
+    app = App(max_data=10000)
+    assert get(app, "data=" + "x" * 3000 + "&ec=H")[0] == "400 Bad Request"
+    app.close()
+
+
+def test_cache(app):
+    app.cache_size = 2
+    with mock.patch.object(app, "render", wraps=app.render) as render:
+        first = get(app, "data=one&format=svg")
+        assert get(app, "data=one&format=svg") == first
+        assert render.call_count == 1
+        get(app, "data=two&format=svg")
+        get(app, "data=three&format=svg")
+        get(app, "data=one&format=svg")
+        assert render.call_count == 4
+
+
+def test_busy():
+    app = App(max_workers=1, max_pending=1)
+    release = threading.Event()
+    render = app.render
+
+    def slow_render(*args):
+        release.wait()
+        return render(*args)
+
+    with mock.patch.object(app, "render", side_effect=slow_render):
+        waiting = threading.Thread(target=get, args=(app, "data=slow"))
+        waiting.start()
+        while app._pending._value:
+            time.sleep(0.001)
+        status, headers, _ = get(app, "data=other")
+        release.set()
+        waiting.join()
+    assert status == "503 Service Unavailable"
+    assert headers["Retry-After"] == "1"
+    assert get(app, "data=other")[0] == "200 OK"
+    app.close()
+
+
+def test_asgi(app):
+    async def request(scope):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        await app.asgi(scope, None, send)
+        return messages
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/qr",
+        "query_string": b"data=hello&format=svg",
+        "headers": [],
+    }
+    start, body = asyncio.run(request(scope))
+    assert start["status"] == 200
+    headers = dict(start["headers"])
+    assert headers[b"content-type"] == b"image/svg+xml"
+    assert body["body"] == svg_bytes("hello")
+
+    scope["headers"] = [(b"if-none-match", headers[b"etag"])]
+    start, body = asyncio.run(request(scope))
+    assert start["status"] == 304
+    assert body["body"] == b""
+
+
+def test_asgi_lifespan(app):
+    received = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+    sent = []
+
+    async def receive():
+        return next(received)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    asyncio.run(app.asgi({"type": "lifespan"}, receive, send))
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+
+def test_benchmark_cached(app):
+    # Serving a cached QR Code should be far quicker than making it.
+    start = time.perf_counter()
+    get(app, "data=" + "benchmark" * 20)
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(10):
+        get(app, "data=" + "benchmark" * 20)
+    cached = (time.perf_counter() - start) / 10
+
+    assert cached * 10 < uncached
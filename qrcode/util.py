@@ -1,14 +1,18 @@
 import math
 import re
+from typing import NamedTuple
 
 from qrcode import LUT, base, exceptions
 from qrcode.base import RSBlock
+from qrcode.compat.numpy import load_numpy
+from qrcode.spec import G15, G15_MASK, G18, BCH_digit  # noqa: F401
 
 # QR encoding modes.
 MODE_NUMBER = 1 << 0
 MODE_ALPHA_NUM = 1 << 1
 MODE_8BIT_BYTE = 1 << 2
 MODE_KANJI = 1 << 3
+MODE_STRUCTURED_APPEND = MODE_NUMBER | MODE_ALPHA_NUM
 
 # Encoding mode sizes.
 MODE_SIZE_SMALL = {
@@ -33,6 +37,13 @@ MODE_SIZE_LARGE = {
 ALPHA_NUM = b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:"
 RE_ALPHA_NUM = re.compile(b"^[" + re.escape(ALPHA_NUM) + rb"]*\Z")
 
+# Shift JIS double-byte characters that can be encoded in Kanji mode, in the
+# ranges 0x8140-0x9FFC and 0xE040-0xEBBF.
+KANJI_CHAR = rb"(?:[\x81-\x9f\xe0-\xea][\x40-\x7e\x80-\xfc]|\xeb[\x40-\x7e\x80-\xbf])"
+RE_KANJI = re.compile(b"^" + KANJI_CHAR + rb"*\Z")
+# Any single Shift JIS character, used to keep splits on character boundaries.
+SHIFT_JIS_CHAR = rb"(?:[\x81-\x9f\xe0-\xfc][\x40-\x7e\x80-\xfc]|[\x00-\xff])"
+
 # The number of bits for numeric delimited data lengths.
 NUMBER_LENGTH = {3: 10, 2: 7, 1: 4}
 
@@ -79,59 +90,20 @@ PATTERN_POSITION_TABLE = [
     [6, 30, 58, 86, 114, 142, 170],
 ]
 
-G15 = (1 << 10) | (1 << 8) | (1 << 5) | (1 << 4) | (1 << 2) | (1 << 1) | (1 << 0)
-G18 = (
-    (1 << 12)
-    | (1 << 11)
-    | (1 << 10)
-    | (1 << 9)
-    | (1 << 8)
-    | (1 << 5)
-    | (1 << 2)
-    | (1 << 0)
-)
-G15_MASK = (1 << 14) | (1 << 12) | (1 << 10) | (1 << 4) | (1 << 1)
-
 PAD0 = 0xEC
 PAD1 = 0x11
 
 
-# Precompute bit count limits, indexed by error correction level and code size
-def _data_count(block):
-    return block.data_count
-
-
-BIT_LIMIT_TABLE = [
-    [0]
-    + [
-        8 * sum(map(_data_count, base.rs_blocks(version, error_correction)))
-        for version in range(1, 41)
-    ]
-    for error_correction in range(4)
-]
+# Bit count limits, indexed by error correction level and code size
+BIT_LIMIT_TABLE = LUT.BIT_LIMIT_TABLE
 
 
 def BCH_type_info(data):
-    d = data << 10
-    while BCH_digit(d) - BCH_digit(G15) >= 0:
-        d ^= G15 << (BCH_digit(d) - BCH_digit(G15))
-
-    return ((data << 10) | d) ^ G15_MASK
+    return LUT.FORMAT_INFO[data]
 
 
 def BCH_type_number(data):
-    d = data << 12
-    while BCH_digit(d) - BCH_digit(G18) >= 0:
-        d ^= G18 << (BCH_digit(d) - BCH_digit(G18))
-    return (data << 12) | d
-
-
-def BCH_digit(data):
-    digit = 0
-    while data != 0:
-        digit += 1
-        data >>= 1
-    return digit
+    return LUT.VERSION_INFO[data]
 
 
 def pattern_position(version):
@@ -178,12 +150,44 @@ def length_in_bits(mode, version):
     return mode_sizes_for_version(version)[mode]
 
 
+def data_bit_length(mode, length):
+    """
+    Return the number of bits needed to write ``length`` characters in the
+    given mode, not counting the mode and character count indicators.
+    """
+    if mode == MODE_NUMBER:
+        return length // 3 * 10 + NUMBER_LENGTH.get(length % 3, 0)
+    if mode == MODE_ALPHA_NUM:
+        return length // 2 * 11 + length % 2 * 6
+    if mode == MODE_KANJI:
+        return length * 13
+    return length * 8
+
+
+def bit_length(data_list, version):
+    """
+    Return the number of bits needed to write the data chunks (with their
+    mode and character count indicators) in the given version, without
+    writing them.
+    """
+    mode_sizes = mode_sizes_for_version(version)
+    return sum(
+        4 + mode_sizes[data.mode] + data_bit_length(data.mode, len(data))
+        for data in data_list
+    )
+
+
 def check_version(version):
     if version < 1 or version > 40:
         raise ValueError(f"Invalid version (was {version}, expected 1 to 40)")
 
 
 def lost_point(modules):
+    if load_numpy() is not None:
+        from qrcode import numpy_backend  # noqa: PLC0415
+
+        return numpy_backend.lost_point(modules)
+
     modules_count = len(modules)
 
     lost_point = 0
@@ -356,12 +360,18 @@ def _lost_point_level4(modules, modules_count):
     return rating * 10
 
 
-def optimal_data_chunks(data, minimum=4):
+def optimal_data_chunks(data, minimum=4, kanji=False):
     """
     An iterator returning QRData chunks optimized to the data content.
 
     :param minimum: The minimum number of bytes in a row to split as a chunk.
+    :param kanji: Treat the data as Shift JIS (encoding it first if it is not
+        a byte-string), splitting only on character boundaries and using
+        Kanji mode for runs of at least ``minimum`` double-byte characters.
     """
+    if kanji:
+        yield from _shift_jis_data_chunks(to_bytestring(data, "shift_jis"), minimum)
+        return
     data = to_bytestring(data)
     num_pattern = rb"\d"
     alpha_pattern = b"[" + re.escape(ALPHA_NUM) + b"]"
@@ -382,6 +392,50 @@ def optimal_data_chunks(data, minimum=4):
                 yield QRData(sub_chunk, mode=mode, check_data=False)
 
 
+def _shift_jis_data_chunks(data, minimum):
+    num_pattern = rb"\d"
+    alpha_pattern = b"[" + re.escape(ALPHA_NUM) + b"]"
+    for is_kanji, chunk in _shift_jis_split(data, KANJI_CHAR, minimum):
+        if is_kanji:
+            yield QRData(chunk, mode=MODE_KANJI, check_data=False)
+            continue
+        for is_num, sub_chunk in _shift_jis_split(chunk, num_pattern, minimum):
+            if is_num:
+                yield QRData(sub_chunk, mode=MODE_NUMBER, check_data=False)
+                continue
+            for is_alpha, part in _shift_jis_split(sub_chunk, alpha_pattern, minimum):
+                mode = MODE_ALPHA_NUM if is_alpha else MODE_8BIT_BYTE
+                yield QRData(part, mode=mode, check_data=False)
+
+
+def _shift_jis_split(data, char_pattern, minimum):
+    """
+    Like ``_optimal_split``, but only matching runs of ``char_pattern`` that
+    start on a Shift JIS character boundary.
+    """
+    if re.match(b"(?:" + char_pattern + rb")+\Z", data):
+        yield True, data
+        return
+    if len(data) <= minimum:
+        yield False, data
+        return
+    # Step through the data a character at a time, so a run is never matched
+    # starting from the second byte of a double-byte character.
+    re_repeat = b"{" + str(minimum).encode("ascii") + b",}"
+    pattern = re.compile(
+        b"((?:" + char_pattern + b")" + re_repeat + b")|" + SHIFT_JIS_CHAR
+    )
+    start = 0
+    for match in pattern.finditer(data):
+        if match.group(1):
+            if match.start() > start:
+                yield False, data[start : match.start()]
+            yield True, match.group(1)
+            start = match.end()
+    if start < len(data):
+        yield False, data[start:]
+
+
 def _optimal_split(data, pattern):
     while data:
         match = re.search(pattern, data)
@@ -396,13 +450,105 @@ def _optimal_split(data, pattern):
         yield False, data
 
 
-def to_bytestring(data):
+# The cost of each character in sixths of a bit, by mode.
+_CHAR_COST = {
+    MODE_NUMBER: 20,  # 10 bits per 3 digits
+    MODE_ALPHA_NUM: 33,  # 11 bits per 2 characters
+    MODE_8BIT_BYTE: 48,  # 8 bits per byte
+    MODE_KANJI: 78,  # 13 bits per double-byte character
+}
+_NUMBER_BYTES = frozenset(b"0123456789")
+_ALPHA_NUM_BYTES = frozenset(ALPHA_NUM)
+_RE_KANJI_CHAR = re.compile(KANJI_CHAR)
+_RE_SHIFT_JIS_CHAR = re.compile(SHIFT_JIS_CHAR)
+
+
+def minimal_data_chunks(data, version=1, kanji=False):
+    """
+    Return the QRData chunks encoding the data in the fewest possible bits.
+
+    Rather than splitting on runs of a minimum length like
+    ``optimal_data_chunks``, this finds the exact minimum cost segmentation,
+    counting the mode indicator and character count header of every chunk.
+    Only the header sizes depend on ``version``, so the result is the same
+    for every version sharing the same ``mode_sizes_for_version``.
+
+    :param kanji: Treat the data as Shift JIS (encoding it first if it is not
+        a byte-string), allowing Kanji mode and only splitting chunks on
+        character boundaries.
+    """
+    data = to_bytestring(data, "shift_jis" if kanji else "utf-8")
+    if not data:
+        return []
+    modes = (MODE_NUMBER, MODE_ALPHA_NUM, MODE_8BIT_BYTE)
+    if kanji:
+        modes += (MODE_KANJI,)
+        starts = {match.start() for match in _RE_SHIFT_JIS_CHAR.finditer(data)}
+    else:
+        starts = range(len(data))
+    mode_sizes = mode_sizes_for_version(version)
+    head_costs = [(4 + mode_sizes[mode]) * 6 for mode in modes]
+    mode_range = range(len(modes))
+
+    # costs[i][m] is the minimum cost (in sixths of a bit) of encoding
+    # data[:i] with a chunk of mode m open at the end. parents[i][m] is the
+    # position the last character started at, or the mode switched from (as
+    # ~mode) if the chunk was opened at i.
+    unreachable = 1 << 62
+    costs = [[unreachable] * len(modes) for _ in range(len(data) + 1)]
+    parents: list[list[int]] = [[0] * len(modes) for _ in range(len(data) + 1)]
+    costs[0] = list(head_costs)
+    for i, c in enumerate(data):
+        cost = costs[i]
+        if i and i in starts:
+            # Allow a new chunk to start here. Partial bits are rounded up
+            # before the next header.
+            closed = [(item + 5) // 6 * 6 for item in cost]
+            for m in mode_range:
+                for k in mode_range:
+                    switched = closed[k] + head_costs[m]
+                    if switched < cost[m]:
+                        cost[m] = switched
+                        parents[i][m] = ~k
+        for m, mode in enumerate(modes):
+            if mode == MODE_8BIT_BYTE:
+                end = i + 1
+            elif i not in starts:
+                continue
+            elif mode == MODE_NUMBER:
+                end = i + 1 if c in _NUMBER_BYTES else None
+            elif mode == MODE_ALPHA_NUM:
+                end = i + 1 if c in _ALPHA_NUM_BYTES else None
+            else:
+                end = i + 2 if _RE_KANJI_CHAR.match(data, i) else None
+            if end is not None and cost[m] + _CHAR_COST[mode] < costs[end][m]:
+                costs[end][m] = cost[m] + _CHAR_COST[mode]
+                parents[end][m] = i
+
+    # Walk back from the cheapest final mode to find each chunk.
+    m = min(mode_range, key=lambda m: (costs[-1][m] + 5) // 6)
+    chunks = []
+    i = end = len(data)
+    while i:
+        parent = parents[i][m]
+        if parent < 0:
+            chunks.append(QRData(data[i:end], mode=modes[m], check_data=False))
+            end = i
+            m = ~parent
+        else:
+            i = parent
+    chunks.append(QRData(data[:end], mode=modes[m], check_data=False))
+    chunks.reverse()
+    return chunks
+
+
+def to_bytestring(data, encoding="utf-8"):
     """
     Convert data to a (utf-8 encoded) byte-string if it isn't a byte-string
     already.
     """
     if not isinstance(data, bytes):
-        data = str(data).encode("utf-8")
+        data = str(data).encode(encoding)
     return data
 
 
@@ -417,11 +563,58 @@ def optimal_mode(data):
     return MODE_8BIT_BYTE
 
 
+_DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+_ALPHA_NUM_VALUES = bytes.maketrans(ALPHA_NUM, bytes(range(len(ALPHA_NUM))))
+# Shift JIS lead bytes 0x81-0x9F and 0xE0-0xEB map to consecutive rows of
+# 0xC0 characters, trail bytes are offset from 0x40.
+_KANJI_LEAD_VALUES = bytes.maketrans(
+    bytes(range(0x81, 0xA0)) + bytes(range(0xE0, 0xEC)), bytes(range(0x2B))
+)
+_KANJI_TRAIL_VALUES = bytes.maketrans(bytes(range(0x40, 0x100)), bytes(range(0xC0)))
+
+
+def _lanes(values):
+    """
+    Spread byte values into the 16 bit lanes of an integer (first value most
+    significant), so a whole run of them can be combined with integer
+    arithmetic.
+    """
+    lanes = bytearray(len(values) * 2)
+    lanes[1::2] = values
+    return int.from_bytes(lanes, "big")
+
+
+def _pack_fields(value, count, width):
+    """
+    Pack ``count`` fields of ``width`` bits, held one per 16 bit lane of
+    ``value``, into a single ``count * width`` bit integer.
+
+    Neighbouring lanes are merged pairwise, so this takes a logarithmic number
+    of big integer operations rather than one per field.
+    """
+    lane = 16
+    padding = 0
+    while count > 1:
+        if count % 2:
+            # Add an empty field to the end, to be shifted off afterwards.
+            value <<= lane
+            count += 1
+            padding += width
+        half = bytes(lane // 8)
+        low = value & int.from_bytes((half + b"\xff" * len(half)) * (count // 2), "big")
+        value = ((value - low) >> (lane - width)) | low
+        count //= 2
+        lane *= 2
+        width *= 2
+    return value >> padding
+
+
 class QRData:
     """
     Data held in a QR compatible format.
 
-    Doesn't currently handle KANJI.
+    KANJI mode data is held as Shift JIS encoded bytes, and is never chosen
+    automatically.
     """
 
     def __init__(self, data, mode=None, check_data=True):
@@ -430,51 +623,76 @@ class QRData:
         chosen.
         """
         if check_data:
-            data = to_bytestring(data)
+            data = to_bytestring(data, "shift_jis" if mode == MODE_KANJI else "utf-8")
 
         if mode is None:
             self.mode = optimal_mode(data)
         else:
             self.mode = mode
-            if mode not in (MODE_NUMBER, MODE_ALPHA_NUM, MODE_8BIT_BYTE):
+            if mode not in (MODE_NUMBER, MODE_ALPHA_NUM, MODE_8BIT_BYTE, MODE_KANJI):
                 raise TypeError(f"Invalid mode ({mode})")  # pragma: no cover
-            if check_data and mode < optimal_mode(data):  # pragma: no cover
+            if check_data and (
+                not RE_KANJI.match(data)
+                if mode == MODE_KANJI
+                else mode < optimal_mode(data)
+            ):
                 raise ValueError(f"Provided data can not be represented in mode {mode}")
 
         self.data = data
 
     def __len__(self):
+        if self.mode == MODE_KANJI:
+            return len(self.data) // 2
         return len(self.data)
 
     def write(self, buffer):
+        # Each mode is written as one packed integer: the characters are
+        # translated to their values, combined into 16 bit lanes (a group of
+        # three digits, a pair of alphanumeric characters or a Kanji character
+        # per lane) and the lanes packed down to the field width.
+        data = self.data
         if self.mode == MODE_NUMBER:
-            for i in range(0, len(self.data), 3):
-                chars = self.data[i : i + 3]
-                bit_length = NUMBER_LENGTH[len(chars)]
-                buffer.put(int(chars), bit_length)
+            count, rest = divmod(len(data), 3)
+            values = data[: count * 3].translate(_DIGIT_VALUES)
+            groups = (
+                _lanes(values[0::3]) * 100
+                + _lanes(values[1::3]) * 10
+                + _lanes(values[2::3])
+            )
+            buffer.put(_pack_fields(groups, count, 10), count * 10)
+            if rest:
+                buffer.put(int(data[-rest:]), NUMBER_LENGTH[rest])
         elif self.mode == MODE_ALPHA_NUM:
-            for i in range(0, len(self.data), 2):
-                chars = self.data[i : i + 2]
-                if len(chars) > 1:
-                    buffer.put(
-                        ALPHA_NUM.find(chars[0]) * 45 + ALPHA_NUM.find(chars[1]), 11
-                    )
-                else:
-                    buffer.put(ALPHA_NUM.find(chars), 6)
+            count, rest = divmod(len(data), 2)
+            values = data.translate(_ALPHA_NUM_VALUES)
+            pairs = _lanes(values[0 : count * 2 : 2]) * 45 + _lanes(values[1::2])
+            buffer.put(_pack_fields(pairs, count, 11), count * 11)
+            if rest:
+                buffer.put(values[-1], 6)
+        elif self.mode == MODE_KANJI:
+            count = len(data) // 2
+            lead = _lanes(data[0::2].translate(_KANJI_LEAD_VALUES))
+            trail = _lanes(data[1::2].translate(_KANJI_TRAIL_VALUES))
+            chars = lead * 0xC0 + trail
+            buffer.put(_pack_fields(chars, count, 13), count * 13)
         else:
-            # Iterating a bytestring in Python 3 returns an integer,
-            # no need to ord().
-            data = self.data
-            for c in data:
-                buffer.put(c, 8)
+            buffer.put_bytes(data)
 
     def __repr__(self):
         return repr(self.data)
 
 
 class BitBuffer:
+    """
+    A big-endian bit buffer.
+
+    Completed bytes (and any trailing partial byte, left-aligned) are packed
+    into the ``buffer`` bytearray, so fields of any width are written with a
+    single integer conversion rather than bit by bit.
+    """
+
     def __init__(self):
-        self.buffer: list[int] = []
+        self.buffer = bytearray()
         self.length = 0
 
     def __repr__(self):
@@ -485,22 +703,38 @@ class BitBuffer:
         return ((self.buffer[buf_index] >> (7 - index % 8)) & 1) == 1
 
     def put(self, num, length):
-        for i in range(length):
-            self.put_bit(((num >> (length - i - 1)) & 1) == 1)
+        if length <= 0:
+            return
+        num &= (1 << length) - 1
+        used = self.length % 8
+        if used:
+            # Merge the bits with the trailing partial byte.
+            num |= (self.buffer.pop() >> (8 - used)) << length
+            length += used
+            self.length -= used
+        pad = -length % 8
+        self.buffer += (num << pad).to_bytes((length + pad) // 8, "big")
+        self.length += length
+
+    def put_bytes(self, data):
+        """
+        Write whole bytes, appending them directly when the buffer is
+        byte-aligned.
+        """
+        if self.length % 8:
+            self.put(int.from_bytes(data, "big"), len(data) * 8)
+        else:
+            self.buffer += data
+            self.length += len(data) * 8
 
     def __len__(self):
         return self.length
 
     def put_bit(self, bit):
-        buf_index = self.length // 8
-        if len(self.buffer) <= buf_index:
-            self.buffer.append(0)
-        if bit:
-            self.buffer[buf_index] |= 0x80 >> (self.length % 8)
-        self.length += 1
+        self.put(1 if bit else 0, 1)
 
 
-def create_bytes(buffer: BitBuffer, rs_blocks: list[RSBlock]):
+def create_bytes(buffer: BitBuffer, rs_blocks: tuple[RSBlock, ...]):
     offset = 0
 
     maxDcCount = 0
@@ -519,22 +753,7 @@ def create_bytes(buffer: BitBuffer, rs_blocks: list[RSBlock]):
         current_dc = [0xFF & buffer.buffer[i + offset] for i in range(dcCount)]
         offset += dcCount
 
-        # Get error correction polynomial.
-        if ecCount in LUT.rsPoly_LUT:
-            rsPoly = base.Polynomial(LUT.rsPoly_LUT[ecCount], 0)
-        else:
-            rsPoly = base.Polynomial([1], 0)
-            for i in range(ecCount):
-                rsPoly = rsPoly * base.Polynomial([1, base.gexp(i)], 0)
-
-        rawPoly = base.Polynomial(current_dc, len(rsPoly) - 1)
-
-        modPoly = rawPoly % rsPoly
-        current_ec = []
-        mod_offset = len(modPoly) - ecCount
-        for i in range(ecCount):
-            modIndex = i + mod_offset
-            current_ec.append(modPoly[modIndex] if (modIndex >= 0) else 0)
+        current_ec = base.rs_encode(current_dc, ecCount)
 
         dcdata.append(current_dc)
         ecdata.append(current_ec)
@@ -552,8 +771,34 @@ def create_bytes(buffer: BitBuffer, rs_blocks: list[RSBlock]):
     return data
 
 
-def create_data(version, error_correction, data_list):
+STRUCTURED_APPEND_LENGTH = 20
+
+
+class StructuredAppend(NamedTuple):
+    """
+    The Structured Append header linking a symbol to the others holding the
+    rest of the data.
+
+    :param index: The position of this symbol in the sequence, from 0.
+    :param total: The number of symbols in the sequence (up to 16).
+    :param parity: The XOR of every byte of the complete data.
+    """
+
+    index: int
+    total: int
+    parity: int
+
+    def write(self, buffer):
+        buffer.put(MODE_STRUCTURED_APPEND, 4)
+        buffer.put(self.index, 4)
+        buffer.put(self.total - 1, 4)
+        buffer.put(self.parity, 8)
+
+
+def create_data(version, error_correction, data_list, structured_append=None):
     buffer = BitBuffer()
+    if structured_append is not None:
+        structured_append.write(buffer)
     for data in data_list:
         buffer.put(data.mode, 4)
         buffer.put(len(data), length_in_bits(data.mode, version))
@@ -561,28 +806,22 @@ def create_data(version, error_correction, data_list):
 
     # Calculate the maximum number of bits for the given version.
     rs_blocks = base.rs_blocks(version, error_correction)
-    bit_limit = sum(block.data_count * 8 for block in rs_blocks)
+    bit_limit = BIT_LIMIT_TABLE[error_correction][version]
     if len(buffer) > bit_limit:
         raise exceptions.DataOverflowError(
             f"Code length overflow. Data size ({len(buffer)}) > size available ({bit_limit})"
         )
 
     # Terminate the bits (add up to four 0s).
-    for _ in range(min(bit_limit - len(buffer), 4)):
-        buffer.put_bit(False)
+    buffer.put(0, min(bit_limit - len(buffer), 4))
 
     # Delimit the string into 8-bit words, padding with 0s if necessary.
     delimit = len(buffer) % 8
     if delimit:
-        for _ in range(8 - delimit):
-            buffer.put_bit(False)
+        buffer.put(0, 8 - delimit)
 
     # Add special alternating padding bitstrings until buffer is full.
     bytes_to_fill = (bit_limit - len(buffer)) // 8
-    for i in range(bytes_to_fill):
-        if i % 2 == 0:
-            buffer.put(PAD0, 8)
-        else:
-            buffer.put(PAD1, 8)
+    buffer.put_bytes(bytes((PAD0, PAD1) * (bytes_to_fill // 2 + 1))[:bytes_to_fill])
 
     return create_bytes(buffer, rs_blocks)
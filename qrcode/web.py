@@ -0,0 +1,290 @@
+"""
+A small web application serving QR Code images, for WSGI or ASGI servers.
+
+.. code:: python
+
+    from qrcode.web import App
+
+    app = App()  # WSGI, e.g. gunicorn module:app
+    asgi_app = app.asgi  # ASGI, e.g. uvicorn module:asgi_app
+
+``GET /qr?data=...&ec=M&format=png`` returns the QR Code for the data, with
+the error correction level (``ec``, ``L``, ``M``, ``Q`` or ``H``) and the
+image ``format`` (``png`` or ``svg``) given, or M and PNG by default.
+
+Images are made on a thread pool of ``max_workers`` threads, and requests
+arriving while ``max_pending`` are already being made (or waiting to be) get
+a 503 response rather than queueing without bound. The most recent
+``cache_size`` images are kept in memory. Responses carry an ``ETag`` (a
+hash of the QR Code matrix and the image settings) and ``Cache-Control``
+header, and ``If-None-Match`` requests for an unchanged image get a 304.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import NamedTuple
+from urllib.parse import parse_qs
+
+from qrcode import constants, exceptions
+from qrcode.main import QRCode
+
+ERROR_CORRECTION = {
+    "L": constants.ERROR_CORRECT_L,
+    "M": constants.ERROR_CORRECT_M,
+    "Q": constants.ERROR_CORRECT_Q,
+    "H": constants.ERROR_CORRECT_H,
+}
+
+CONTENT_TYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+
+class Response(NamedTuple):
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+
+class BusyError(Exception):
+    """
+    Raised when there are already ``max_pending`` images being made.
+    """
+
+
+def _text_response(status, message, headers=()):
+    return Response(
+        status,
+        [("Content-Type", "text/plain; charset=utf-8"), *headers],
+        message.encode("utf-8"),
+    )
+
+
+class App:
+    """
+    The QR Code web application. Call it as a WSGI application, or use its
+    ``asgi`` method as an ASGI application.
+    """
+
+    def __init__(
+        self,
+        path="/qr",
+        cache_size=1024,
+        max_age=86400,
+        max_workers=4,
+        max_pending=None,
+        max_data=2048,
+        box_size=10,
+        border=4,
+    ):
+        self.path = path
+        self.cache_size = cache_size
+        self.max_age = max_age
+        self.max_data = max_data
+        self.box_size = box_size
+        self.border = border
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="qrcode-web")
+        self._pending = threading.BoundedSemaphore(max_pending or max_workers * 4)
+        self._cache: OrderedDict[tuple, tuple[str, bytes]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def render(self, data, error_correction, format):
+        """
+        Make the image for a request, returning its ETag and contents.
+        """
+        qr = QRCode(
+            error_correction=error_correction,
+            box_size=self.box_size,
+            border=self.border,
+        )
+        qr.add_data(data)
+        qr.make()
+        settings = f"{format}:{self.box_size}:{self.border}:".encode()
+        etag = hashlib.blake2b(
+            settings + qr.to_matrix().packbits(), digest_size=16
+        ).hexdigest()
+        if format == "svg":
+            from qrcode.image.svg import SvgPathImage  # noqa: PLC0415
+
+            img = qr.make_image(image_factory=SvgPathImage)
+        else:
+            img = qr.make_image()
+        stream = io.BytesIO()
+        img.save(stream)
+        return f'"{etag}"', stream.getvalue()
+
+    def _cached(self, key):
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return result
+
+    def _store(self, key, result):
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _submit(self, key):
+        """
+        Start making the image for a request on the pool.
+
+        :raises BusyError: if ``max_pending`` images are already being made.
+        """
+        if not self._pending.acquire(blocking=False):
+            raise BusyError
+        try:
+            future = self.executor.submit(self.render, *key)
+        except BaseException:
+            self._pending.release()
+            raise
+        future.add_done_callback(lambda _: self._pending.release())
+        return future
+
+    def _parse(self, method, path, query_string):
+        """
+        Check a request, returning either the cache key for its image or the
+        error response.
+        """
+        if path != self.path:
+            return _text_response(HTTPStatus.NOT_FOUND, "Not found")
+        if method not in {"GET", "HEAD"}:
+            return _text_response(
+                HTTPStatus.METHOD_NOT_ALLOWED,
+                "Method not allowed",
+                [("Allow", "GET, HEAD")],
+            )
+        query = parse_qs(query_string, keep_blank_values=True)
+        if "data" not in query:
+            return _text_response(HTTPStatus.BAD_REQUEST, "Missing data")
+        data = query["data"][0]
+        if len(data) > self.max_data:
+            return _text_response(HTTPStatus.BAD_REQUEST, "Data too long")
+        ec = query.get("ec", ["M"])[0].upper()
+        if ec not in ERROR_CORRECTION:
+            return _text_response(
+                HTTPStatus.BAD_REQUEST, "Invalid ec (expected L, M, Q or H)"
+            )
+        format = query.get("format", ["png"])[0].lower()
+        if format not in CONTENT_TYPES:
+            return _text_response(
+                HTTPStatus.BAD_REQUEST, "Invalid format (expected png or svg)"
+            )
+        return (data, ERROR_CORRECTION[ec], format)
+
+    def _respond(self, method, key, result, if_none_match):
+        etag, body = result
+        headers = [
+            ("ETag", etag),
+            ("Cache-Control", f"public, max-age={self.max_age}"),
+        ]
+        if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+            return Response(HTTPStatus.NOT_MODIFIED, headers, b"")
+        headers += [
+            ("Content-Type", CONTENT_TYPES[key[2]]),
+            ("Content-Length", str(len(body))),
+        ]
+        return Response(HTTPStatus.OK, headers, b"" if method == "HEAD" else body)
+
+    @staticmethod
+    def _error(error):
+        if isinstance(error, BusyError):
+            return _text_response(
+                HTTPStatus.SERVICE_UNAVAILABLE, "Busy", [("Retry-After", "1")]
+            )
+        return _text_response(HTTPStatus.BAD_REQUEST, "Data too long")
+
+    def handle(self, method, path, query_string, if_none_match=None):
+        """
+        Return the response to a request (blocking while the image is made).
+        """
+        key = self._parse(method, path, query_string)
+        if isinstance(key, Response):
+            return key
+        result = self._cached(key)
+        if result is None:
+            try:
+                result = self._submit(key).result()
+            except (BusyError, exceptions.DataOverflowError) as e:
+                return self._error(e)
+            self._store(key, result)
+        return self._respond(method, key, result, if_none_match)
+
+    async def handle_async(self, method, path, query_string, if_none_match=None):
+        """
+        Return the response to a request, without blocking the event loop
+        while the image is made.
+        """
+        key = self._parse(method, path, query_string)
+        if isinstance(key, Response):
+            return key
+        result = self._cached(key)
+        if result is None:
+            try:
+                result = await asyncio.wrap_future(self._submit(key))
+            except (BusyError, exceptions.DataOverflowError) as e:
+                return self._error(e)
+            self._store(key, result)
+        return self._respond(method, key, result, if_none_match)
+
+    def __call__(self, environ, start_response):
+        """
+        The WSGI application.
+        """
+        response = self.handle(
+            environ["REQUEST_METHOD"],
+            environ.get("PATH_INFO", ""),
+            environ.get("QUERY_STRING", ""),
+            environ.get("HTTP_IF_NONE_MATCH"),
+        )
+        status = HTTPStatus(response.status)
+        start_response(f"{status.value} {status.phrase}", response.headers)
+        return [response.body]
+
+    async def asgi(self, scope, receive, send):
+        """
+        The ASGI application.
+        """
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        headers = dict(scope.get("headers", ()))
+        if_none_match = headers.get(b"if-none-match")
+        response = await self.handle_async(
+            scope["method"],
+            scope["path"],
+            scope.get("query_string", b"").decode("latin-1"),
+            if_none_match and if_none_match.decode("latin-1"),
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": int(response.status),
+                "headers": [
+                    (name.lower().encode("latin-1"), value.encode("latin-1"))
+                    for name, value in response.headers
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": response.body})
+
+    def close(self):
+        """
+        Shut down the thread pool.
+        """
+        self.executor.shutdown()